@@ -0,0 +1,144 @@
+# ============================================================
+#  BENCHMARK: EVENT-LOOP LAG UNDER /mercy add-pull LOAD
+# ============================================================
+#
+#  Runs the same add-pull workload (read row, bump counters, write row)
+#  twice: once with the old inline sqlite3 calls on the event loop, once
+#  through the Storage service. A ticker task measures how late the
+#  loop wakes up while the workload is running.
+#
+#  python bench/event_loop_lag.py [--users 200] [--clicks 2000] [--slow-ms 2]
+
+import argparse
+import asyncio
+import os
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+import types
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hydra import backends  # noqa: E402
+from hydra import migrations  # noqa: E402
+from hydra import storage  # noqa: E402
+
+TICK = 0.005
+
+
+class SlowConnection(sqlite3.Connection):
+    # Simulates a slow disk: every commit costs an extra fsync-sized pause.
+    slow_ms = 0
+
+    def commit(self):
+        time.sleep(self.slow_ms / 1000)
+        super().commit()
+
+
+def connect(path, **kwargs):
+    return sqlite3.connect(path, factory=SlowConnection, **kwargs)
+
+
+async def ticker(lags, stop):
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(TICK)
+        lags.append((loop.time() - start - TICK) * 1000)
+
+
+# The pre-storage-service helpers, kept verbatim as the "before" baseline.
+
+def old_get_mercy_row(conn, user_id, shard_type):
+    c = conn.cursor()
+    c.execute(
+        "SELECT epic_pity, legendary_pity, mythical_pity FROM mercy WHERE user_id=? AND shard_type=?",
+        (str(user_id), shard_type)
+    )
+    row = c.fetchone()
+    if row is None:
+        c.execute("INSERT INTO mercy (user_id, shard_type) VALUES (?, ?)", (str(user_id), shard_type))
+        conn.commit()
+        return 0, 0, 0
+    return row
+
+
+def old_set_mercy_row(conn, user_id, shard_type, epic, legendary, mythical):
+    conn.execute("""
+        INSERT INTO mercy (user_id, shard_type, epic_pity, legendary_pity, mythical_pity)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(user_id, shard_type) DO UPDATE SET
+            epic_pity=excluded.epic_pity,
+            legendary_pity=excluded.legendary_pity,
+            mythical_pity=excluded.mythical_pity
+    """, (str(user_id), shard_type, epic, legendary, mythical))
+    conn.commit()
+
+
+async def add_pull_inline(conn, user_id):
+    epic, legendary, mythical = old_get_mercy_row(conn, user_id, "ancient")
+    old_set_mercy_row(conn, user_id, "ancient", epic + 10, legendary + 10, mythical)
+
+
+async def add_pull_service(db, user_id):
+    epic, legendary, mythical = await db.get_mercy_row(user_id, "ancient")
+    await db.set_mercy_row(user_id, "ancient", epic + 10, legendary + 10, mythical)
+
+
+async def run(mode, path, users, clicks):
+    lags = []
+    stop = asyncio.Event()
+    tick_task = asyncio.create_task(ticker(lags, stop))
+
+    if mode == "inline":
+        conn = connect(path)
+        migrations.run_migrations(conn)
+        click = lambda uid: add_pull_inline(conn, uid)  # noqa: E731
+    else:
+        db = storage.Storage(backends.SQLiteBackend(path))
+        await db.open()
+        click = lambda uid: add_pull_service(db, uid)  # noqa: E731
+
+    start = time.perf_counter()
+    await asyncio.gather(*(click(i % users) for i in range(clicks)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await tick_task
+
+    if mode == "inline":
+        conn.close()
+    else:
+        await db.close()
+
+    lags.sort()
+    return {
+        "mode": mode,
+        "clicks/s": clicks / elapsed,
+        "ticks": len(lags),
+        "lag p50 ms": statistics.median(lags) if lags else 0.0,
+        "lag p99 ms": lags[min(len(lags) - 1, int(len(lags) * 0.99))] if lags else 0.0,
+        "lag max ms": lags[-1] if lags else elapsed * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--clicks", type=int, default=2000)
+    parser.add_argument("--slow-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    SlowConnection.slow_ms = args.slow_ms
+    backends.sqlite3 = types.SimpleNamespace(**{**vars(sqlite3), "connect": connect})
+
+    for mode in ("inline", "service"):
+        with tempfile.TemporaryDirectory() as tmp:
+            result = asyncio.run(run(mode, os.path.join(tmp, "mercy.db"), args.users, args.clicks))
+        print("  ".join(f"{k}={v:.2f}" if isinstance(v, float) else f"{k}={v}" for k, v in result.items()))
+
+
+if __name__ == "__main__":
+    main()
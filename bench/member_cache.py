@@ -0,0 +1,114 @@
+# ============================================================
+#  BENCHMARK: RESIDENT MEMORY PER 10K GUILD MEMBERS
+# ============================================================
+#
+#  Builds a guild of --members members from gateway-shaped payloads and
+#  measures what each MEMBER_CACHE policy keeps resident:
+#
+#    full  every member chunked into the library cache at startup (the
+#          old behaviour)
+#    lru   only members who send a message are kept, in MemberCache;
+#          --active sets what fraction of the guild does
+#
+#  Each measurement runs in its own interpreter. Memory is reported both
+#  as Python allocations still live (tracemalloc) and, in a run without
+#  tracemalloc, as the growth in the process's resident set, scaled to
+#  10k members.
+#
+#  python bench/member_cache.py [--members 10000] [--active 0.05 1.0]
+
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def rss_bytes():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def member_payload(i):
+    return {
+        "user": {
+            "id": str(10**17 + i), "username": f"member{i}", "discriminator": "0",
+            "global_name": f"Member {i}", "avatar": f"{i:032x}"
+        },
+        "roles": [], "joined_at": "2024-01-01T00:00:00+00:00", "nick": None,
+        "deaf": False, "mute": False, "flags": 0
+    }
+
+
+def measure(policy, members, active, trace):
+    sys.path.insert(0, ROOT)
+    import discord
+    from hydra.members import MEMBER_CACHE_SIZE, MemberCache, member_cache_options
+
+    intents = discord.Intents.default()
+    intents.members = True
+    client = discord.Client(intents=intents, **member_cache_options(policy))
+    state = client._connection
+    guild = discord.Guild(data={"id": "1", "name": "bench", "roles": []}, state=state)
+    cache = MemberCache(MEMBER_CACHE_SIZE)
+    active_every = max(1, round(1 / active)) if active else 0
+
+    gc.collect()
+    if trace:
+        tracemalloc.start()
+    rss_before = rss_bytes()
+    alloc_before = tracemalloc.get_traced_memory()[0]
+
+    for i in range(members):
+        member = discord.Member(data=member_payload(i), guild=guild, state=state)
+        if policy == "full":
+            guild._add_member(member)  # what a GUILD_MEMBERS_CHUNK does
+        elif active_every and i % active_every == 0:
+            cache.remember(member)  # what on_message does
+        # Otherwise the member came and went with its event.
+
+    gc.collect()
+    live = tracemalloc.get_traced_memory()[0] - alloc_before
+    rss = rss_bytes() - rss_before
+    if trace:
+        tracemalloc.stop()
+    return {"live": live, "rss": rss, "cached": len(guild._members) + len(cache._members)}
+
+
+def run(policy, members, active, trace):
+    args = [sys.executable, os.path.abspath(__file__), "--child", policy,
+            "--members", str(members), "--active", str(active)]
+    out = subprocess.run(args + (["--trace"] if trace else []), check=True, capture_output=True, text=True).stdout
+    return json.loads(out)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--members", type=int, default=10000)
+    parser.add_argument("--active", type=float, nargs="+", default=[0.05, 1.0])
+    parser.add_argument("--child", choices=("full", "lru"), help=argparse.SUPPRESS)
+    parser.add_argument("--trace", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(args.child, args.members, args.active[0], args.trace)))
+        return
+
+    scale = 10000 / args.members
+    runs = [("full", "full", 1.0)] + [(f"lru, {a:.0%} active", "lru", a) for a in args.active]
+    print(f"{args.members} members, memory per 10k members:")
+    for label, policy, active in runs:
+        traced = run(policy, args.members, active, trace=True)
+        untraced = run(policy, args.members, active, trace=False)
+        print(
+            f"  {label:<18} cached={traced['cached']:>6}  "
+            f"python={traced['live'] * scale / 2**20:7.2f} MiB  rss={untraced['rss'] * scale / 2**20:7.2f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+# ============================================================
+#  BENCHMARK: 100K PENDING REMINDERS
+# ============================================================
+#
+#  Holds --pending reminders due a day out, then times --probes more
+#  spread over the next --window seconds, two ways:
+#
+#    tasks  one task per reminder parked in asyncio.sleep (the old
+#           reminder commands)
+#    heap   one TimerHeap (hydra/timers.py) and its single wake-up task
+#
+#  Reports the Python memory the pending reminders hold (tracemalloc),
+#  the cost of scheduling and of cancelling one, and the wake-up jitter
+#  of the probes: how long after its due time each one actually fired.
+#
+#  python bench/reminder_timers.py [--pending 100000] [--probes 1000] [--window 5]
+
+import argparse
+import asyncio
+import gc
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hydra.timers import TimerHeap  # noqa: E402
+
+DAY = 86400
+
+
+def payload(i):
+    # What Reminders keeps per timer: (user_id, channel_id, text).
+    return (str(10**17 + i), 10**18 + i, f"reminder text {i}")
+
+
+class TaskTimers:
+    # The old shape: a sleeping task per reminder, cancelled by task.
+
+    def __init__(self, fire):
+        self.fire = fire
+        self.tasks = {}
+
+    def start(self):
+        pass
+
+    async def stop(self):
+        for task in self.tasks.values():
+            task.cancel()
+        await asyncio.gather(*self.tasks.values(), return_exceptions=True)
+
+    def schedule(self, key, due_at, payload):
+        self.tasks[key] = asyncio.create_task(self._sleep(key, due_at, payload))
+
+    def cancel(self, key):
+        task = self.tasks.pop(key, None)
+        if task is not None:
+            task.cancel()
+
+    async def _sleep(self, key, due_at, payload):
+        await asyncio.sleep(due_at - time.time())
+        self.tasks.pop(key, None)
+        await self.fire([(key, due_at, payload)])
+
+
+def percentile(values, p):
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+async def run(mode, pending, probes, window, cancels):
+    lags = []
+    done = asyncio.Event()
+
+    async def fire(due):
+        now = time.time()
+        for key, due_at, _ in due:
+            if key >= pending:
+                lags.append((now - due_at) * 1000)
+        if len(lags) >= probes:
+            done.set()
+
+    timers = TimerHeap(fire) if mode == "heap" else TaskTimers(fire)
+    timers.start()
+    payloads = [payload(i) for i in range(pending)]
+    far = time.time() + DAY
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(pending):
+        timers.schedule(i, far + i % 3600, payloads[i])
+    await asyncio.sleep(0)  # let the tasks reach their sleep
+    gc.collect()
+    memory = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    # Scheduling and cancelling, untraced.
+    keys = random.Random(1).sample(range(pending), cancels)
+    start = time.perf_counter()
+    for key in keys:
+        timers.cancel(key)
+    cancel_us = (time.perf_counter() - start) / cancels * 1e6
+    start = time.perf_counter()
+    for key in keys:
+        timers.schedule(key, far + key % 3600, payloads[key])
+    schedule_us = (time.perf_counter() - start) / cancels * 1e6
+
+    first = time.time() + 0.5
+    for i in range(probes):
+        timers.schedule(pending + i, first + window * i / probes, payload(i))
+    await asyncio.wait_for(done.wait(), window + 30)
+    await timers.stop()
+
+    lags.sort()
+    return {
+        "mode": mode,
+        "memory MiB": memory / 2**20,
+        "schedule us": schedule_us,
+        "cancel us": cancel_us,
+        "jitter p50 ms": statistics.median(lags),
+        "jitter p99 ms": percentile(lags, 0.99),
+        "jitter max ms": lags[-1],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pending", type=int, default=100000)
+    parser.add_argument("--probes", type=int, default=1000)
+    parser.add_argument("--window", type=float, default=5.0)
+    parser.add_argument("--cancels", type=int, default=10000)
+    args = parser.parse_args()
+
+    print(f"{args.pending} pending reminders, {args.probes} probes over {args.window:g}s:")
+    for mode in ("tasks", "heap"):
+        result = asyncio.run(run(mode, args.pending, args.probes, args.window, args.cancels))
+        print("  " + "  ".join(f"{k}={v:.2f}" if isinstance(v, float) else f"{k}={v}" for k, v in result.items()))
+
+
+if __name__ == "__main__":
+    main()
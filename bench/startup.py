@@ -0,0 +1,145 @@
+# ============================================================
+#  BENCHMARK: COLD START TO READY, WITHOUT NETWORK
+# ============================================================
+#
+#  Starts a fresh interpreter per run and times each startup step the
+#  bot takes before it would connect to the gateway: importing the app,
+#  create_app(), load_rates(), init_storage() on a new and on an existing
+#  SQLite file, register_commands(), init_scheduler() and hashing the
+#  command tree for the sync check. Nothing talks to Discord.
+#
+#  It also checks that importing the app is side-effect free: no database
+#  file may appear and APScheduler must not be loaded.
+#
+#  python bench/startup.py [--runs 5] [--budget-ms 1500]
+#
+#  With --budget-ms it exits non-zero when the median time to ready
+#  exceeds the budget, so a cold-start regression fails CI.
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PHASES = (
+    "import", "create_app", "load_rates", "init_storage_new", "init_storage_existing",
+    "register_commands", "init_scheduler", "tree_hash"
+)
+
+
+async def measure(workdir):
+    timings = {}
+
+    start = time.perf_counter()
+    from hydra.app import create_app
+    timings["import"] = time.perf_counter() - start
+
+    side_effects = []
+    if os.listdir(workdir):
+        side_effects.append(f"files created on import: {os.listdir(workdir)}")
+    if "apscheduler" in sys.modules:
+        side_effects.append("apscheduler imported eagerly")
+
+    path = os.path.join(workdir, "mercy.db")
+    for phase in ("init_storage_new", "init_storage_existing"):
+        start = time.perf_counter()
+        app = create_app(database_url=path)
+        created = time.perf_counter()
+        await app.init_storage()
+        timings[phase] = time.perf_counter() - created
+        timings["create_app"] = created - start
+        if phase == "init_storage_new":
+            await app.db.close()
+
+    start = time.perf_counter()
+    app.load_rates()
+    timings["load_rates"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    await app.register_commands()
+    timings["register_commands"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    app.init_scheduler()
+    timings["init_scheduler"] = time.perf_counter() - start
+
+    from hydra.command_sync import tree_hash
+    start = time.perf_counter()
+    tree_hash(app.tree)
+    timings["tree_hash"] = time.perf_counter() - start
+
+    await app.db.close()
+    return timings, side_effects
+
+
+def child():
+    sys.path.insert(0, ROOT)
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        # The app prints migration progress; keep stdout for the result.
+        real_stdout, sys.stdout = sys.stdout, open(os.devnull, "w")
+        try:
+            timings, side_effects = asyncio.run(measure(workdir))
+        finally:
+            sys.stdout = real_stdout
+    print(json.dumps({"timings": timings, "side_effects": side_effects}))
+
+
+def run_once():
+    start = time.perf_counter()
+    out = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child"],
+        check=True, capture_output=True, text=True
+    ).stdout
+    wall = time.perf_counter() - start
+    result = json.loads(out.strip().splitlines()[-1])
+    result["timings"]["process_wall"] = wall
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        return child()
+
+    results = [run_once() for _ in range(args.runs)]
+
+    side_effects = sorted({effect for result in results for effect in result["side_effects"]})
+    for effect in side_effects:
+        print(f"side effect: {effect}")
+
+    medians = {
+        phase: statistics.median(result["timings"][phase] for result in results) * 1000
+        for phase in PHASES + ("process_wall",)
+    }
+    # Time to ready: everything setup_hook does before connecting, on an
+    # existing database, plus the import in front of it.
+    ready = sum(medians[phase] for phase in PHASES if phase != "init_storage_new")
+
+    print(f"median of {args.runs} cold starts (ms):")
+    for phase in PHASES:
+        print(f"  {phase:<22} {medians[phase]:8.1f}")
+    print(f"  {'time to ready':<22} {ready:8.1f}")
+    print(f"  {'process wall':<22} {medians['process_wall']:8.1f}")
+
+    if side_effects:
+        sys.exit(1)
+    if args.budget_ms is not None and ready > args.budget_ms:
+        print(f"over budget: {ready:.1f} ms > {args.budget_ms:.1f} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# ============================================================
+#  BENCHMARK: STORAGE BACKENDS UNDER A MIXED WORKLOAD
+# ============================================================
+#
+#  Runs the same synthetic traffic against every available backend:
+#  add-pull clicks (read + write mercy), mercyall reads of cold users,
+#  and key logging, all issued concurrently. Reports throughput, per-op
+#  latency percentiles and the number of commits the write-behind queue
+#  needed.
+#
+#  SQLite always runs (temp file). PostgreSQL runs when DATABASE_URL
+#  points at a server and asyncpg is installed; it writes to the real
+#  tables, so use a scratch database.
+#
+#  python bench/storage_backends.py [--users 500] [--ops 5000] [--concurrency 50]
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hydra import backends  # noqa: E402
+from hydra import storage  # noqa: E402
+
+# Keep the cache small so cold reads actually reach the backend.
+CACHE_SIZE = 100
+# Key logging is spread over this many servers.
+GUILDS = 10
+EPOCHS = {"hydra": 1, "chimera": 1}
+
+
+async def add_pull(db, user_id):
+    epic, legendary, mythical = await db.get_mercy_row(user_id, "ancient")
+    await db.set_mercy_row(user_id, "ancient", epic + 10, legendary + 10, mythical)
+
+
+async def mercy_overview(db, user_id):
+    await db.get_user_mercy(user_id)
+
+
+async def log_key(db, user_id):
+    guild_id = user_id % GUILDS
+    hydra_used, _ = await db.get_key_row(guild_id, user_id, EPOCHS)
+    await db.set_key_used(guild_id, user_id, f"user{user_id}", "hydra", EPOCHS["hydra"], hydra_used + 1)
+
+
+OPERATIONS = [(add_pull, 6), (mercy_overview, 3), (log_key, 1)]
+
+
+async def run(backend, users, ops, concurrency, seed):
+    db = storage.Storage(backend, mercy_cache_size=CACHE_SIZE)
+    await db.open()
+
+    rng = random.Random(seed)
+    funcs, weights = zip(*OPERATIONS)
+    plan = [(rng.choices(funcs, weights)[0], rng.randrange(users)) for _ in range(ops)]
+    latencies = []
+    gate = asyncio.Semaphore(concurrency)
+
+    async def timed(op, user_id):
+        async with gate:
+            start = time.perf_counter()
+            await op(db, user_id)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(timed(op, user_id) for op, user_id in plan))
+    await db.flush()
+    elapsed = time.perf_counter() - start
+
+    stats = db.write_stats()
+    await db.close()
+
+    latencies.sort()
+    return {
+        "backend": backend.name,
+        "ops/s": ops / elapsed,
+        "p50 ms": statistics.median(latencies),
+        "p99 ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        "max ms": latencies[-1],
+        "commits": stats["commits"],
+        "avg flush ms": stats["avg_flush_ms"],
+    }
+
+
+def report(result):
+    print("  ".join(f"{k}={v:.2f}" if isinstance(v, float) else f"{k}={v}" for k, v in result.items()))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--ops", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    workload = (args.users, args.ops, args.concurrency, args.seed)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        backend = backends.SQLiteBackend(os.path.join(tmp, "mercy.db"))
+        report(asyncio.run(run(backend, *workload)))
+
+    url = os.getenv("DATABASE_URL", "")
+    if not url.startswith(("postgres://", "postgresql://")):
+        print("postgres: skipped (set DATABASE_URL=postgresql://... to include it)")
+    elif backends.asyncpg is None:
+        print("postgres: skipped (asyncpg is not installed)")
+    else:
+        report(asyncio.run(run(backends.create_backend(url), *workload)))
+
+
+if __name__ == "__main__":
+    main()
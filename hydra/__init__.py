@@ -0,0 +1,7 @@
+# ============================================================
+#  HYDRA COMPANION
+# ============================================================
+#
+#  The bot lives in app.py (create_app, run); `python -m hydra` starts
+#  it and `python -m hydra.cluster` starts it as several workers. The
+#  other modules are libraries with no import-time side effects.
@@ -0,0 +1,252 @@
+# ============================================================
+#  HYDRA COMPANION — APPLICATION
+# ============================================================
+#
+#  create_app() builds the bot and run() starts it; importing this module
+#  (or bot.py) does neither, and opens no files. Startup happens in
+#  setup_hook, as explicit lifecycle steps that tests and
+#  bench/startup.py can also call one at a time:
+#
+#      load_rates()         compile the shard rate table (rates.py)
+#      init_storage()       open the database and run migrations
+#      register_commands()  load the command extensions (EXTENSIONS)
+#      sync_command_tree()  push slash commands to Discord if changed
+#      start_scheduler()    register jobs, then join the leader election
+#      start_reminders()    load stored reminders and send overdue ones
+#
+#  Subsystems most processes never touch load on first use: APScheduler
+#  when the scheduler is set up, the setup wizard when /admin setup runs.
+
+import asyncio
+import os
+import signal
+from functools import partial
+
+import discord
+from discord.ext import commands
+
+from .backends import create_backend
+from .clash_schedule import ClashScheduler
+from .cluster import LeaderElection, shard_config_from_env
+from .command_sync import check_command_groups
+from .config import KEY_REPORT_CHANNEL_ID
+from .members import MEMBER_CACHE_POLICY, MEMBER_CACHE_SIZE, MemberCache, member_cache_options
+from .rates import SHARD_RATES_PATH, load_shard_rates
+from .reminders import Reminders, owns_reminder, send_reminder
+from .storage import DB_PATH, MERCY_CACHE_SIZE, Storage
+from .suggestions import confirm_anonymous_suggestion
+from .tasks import cluster_heartbeat, register_jobs, send_clash_warning, start_leader_duties, stop_leader_duties
+
+EXTENSIONS = (
+    "hydra.commands.general",
+    "hydra.commands.mercy",
+    "hydra.commands.keys",
+    "hydra.commands.reminders",
+    "hydra.commands.gacha",
+    "hydra.commands.admin",
+)
+
+SCHEDULER_TIMEZONE = "Europe/London"
+
+
+def default_intents():
+    intents = discord.Intents.default()
+    intents.message_content = True
+    intents.members = True
+    return intents
+
+
+class HydraBot(commands.AutoShardedBot):
+    def __init__(self, *, database_url=DB_PATH, mercy_cache_size=MERCY_CACHE_SIZE, cluster_id=0,
+                 dev_guild_id=None, member_cache=MEMBER_CACHE_POLICY, member_cache_size=MEMBER_CACHE_SIZE,
+                 shard_rates_path=SHARD_RATES_PATH, **kwargs):
+        super().__init__(**member_cache_options(member_cache), **kwargs)
+        self.db = Storage(create_backend(database_url), mercy_cache_size=mercy_cache_size)
+        self.members = MemberCache(member_cache_size, query_members=self.intents.members)
+        self.cluster_id = cluster_id
+        self.dev_guild_id = dev_guild_id
+        self.shard_rates_path = shard_rates_path
+        # Last shared shard_rates version followed; see
+        # tasks.follow_rates_reloads.
+        self.rates_version = 0
+        self.reminders = Reminders(self.db, partial(send_reminder, self), partial(owns_reminder, self))
+
+        self.scheduler = None
+        self.scheduled_jobs = []
+        self.clash_scheduler = ClashScheduler(self.db, partial(send_clash_warning, self))
+        # Only the holder of the "scheduler" lease runs jobs and clash
+        # warnings, so they fire once however many workers are up.
+        self.leader = LeaderElection(
+            self.db, "scheduler",
+            partial(start_leader_duties, self), partial(stop_leader_duties, self), partial(cluster_heartbeat, self)
+        )
+
+    # ------------------------------------------------------------
+    #  LIFECYCLE
+    # ------------------------------------------------------------
+
+    async def setup_hook(self):
+        self.load_rates()
+        await self.init_storage()
+        await self.register_commands()
+        # Once per process rather than on every READY, and by one worker
+        # only; see command_sync.py.
+        if self.cluster_id == 0:
+            await self.sync_command_tree()
+        self.scheduler_task = asyncio.create_task(self.start_scheduler())
+        self.reminder_task = asyncio.create_task(self.start_reminders())
+
+    def load_rates(self):
+        # Also what $reloadrates calls; a bad file raises here rather than
+        # surfacing as a broken /mercy later.
+        return load_shard_rates(self.shard_rates_path)
+
+    async def init_storage(self):
+        await self.db.open()
+
+    async def register_commands(self):
+        for name in EXTENSIONS:
+            await self.load_extension(name)
+        check_command_groups(self.tree)
+
+    async def sync_command_tree(self):
+        # Imported here: hashing the tree is only needed when syncing.
+        from .command_sync import sync_commands
+
+        dev_guild = discord.Object(id=int(self.dev_guild_id)) if self.dev_guild_id else None
+        try:
+            synced = await sync_commands(self.tree, self.application_id, dev_guild)
+        except Exception as e:
+            print("Slash sync failed:", e)
+            return
+        scope = f"guild {self.dev_guild_id}" if dev_guild else "global"
+        print(f"Slash commands synced ({scope})" if synced else f"Slash commands unchanged ({scope}), sync skipped")
+
+    def init_scheduler(self):
+        # Jobs are registered on every worker; only the leader's scheduler
+        # ever starts.
+        from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+        self.scheduler = AsyncIOScheduler(timezone=SCHEDULER_TIMEZONE)
+        self.scheduled_jobs = register_jobs(self)
+
+    async def start_scheduler(self):
+        # Broadcasts need the guild list, so nothing runs before the first
+        # READY.
+        self.init_scheduler()
+        await self.wait_until_ready()
+        self.leader.start()
+
+    async def start_reminders(self):
+        # After READY, so overdue reminders go out as soon as the bot is
+        # back rather than racing the gateway connection.
+        await self.wait_until_ready()
+        await self.reminders.start()
+
+    async def close(self):
+        await self.leader.stop()
+        await self.reminders.stop()
+        if self.scheduler is not None and self.scheduler.running:
+            self.scheduler.shutdown(wait=False)
+        await self.clash_scheduler.stop()
+        await super().close()
+        await self.db.close()
+
+    # ------------------------------------------------------------
+    #  EVENTS
+    # ------------------------------------------------------------
+
+    async def on_ready(self):
+        print(f"Logged in as {self.user}")
+
+        # Key usage logged before per-guild tracking belongs to the home
+        # server, which also keeps the hardcoded report channel until it
+        # picks one.
+        key_report_channel = self.get_channel(KEY_REPORT_CHANNEL_ID)
+        if key_report_channel:
+            home_guild_id = key_report_channel.guild.id
+            await self.db.adopt_legacy_keys(home_guild_id)
+            if not self.db.get_guild_channels(home_guild_id)["key_report_channel_id"]:
+                await self.db.set_guild_channel(home_guild_id, "key_report_channel_id", KEY_REPORT_CHANNEL_ID)
+
+    async def on_message(self, message):
+        if message.author.bot:
+            return
+
+        self.members.remember(message.author)
+
+        # DMs are anonymous suggestions, never commands.
+        if isinstance(message.channel, discord.DMChannel):
+            await confirm_anonymous_suggestion(message)
+            return
+
+        await self.process_commands(message)
+
+    async def on_interaction(self, interaction):
+        self.members.remember(interaction.user)
+
+    async def on_raw_member_remove(self, payload):
+        self.members.forget(payload.guild_id, payload.user.id)
+
+
+def create_app(**options):
+    # Settings come from the environment unless passed in. cluster.py sets
+    # SHARD_COUNT, SHARD_IDS and CLUSTER_ID when this process is one
+    # worker of several; unset, the bot runs every shard itself.
+    shard_count, shard_ids, cluster_id = shard_config_from_env()
+    settings = {
+        # Local SQLite file by default; set DATABASE_URL=postgresql://...
+        # to share one PostgreSQL server between bot processes.
+        "database_url": os.getenv("DATABASE_URL", DB_PATH),
+        "mercy_cache_size": int(os.getenv("MERCY_CACHE_SIZE", MERCY_CACHE_SIZE)),
+        "shard_count": shard_count,
+        "shard_ids": shard_ids,
+        "cluster_id": cluster_id,
+        # A test server's id, to sync slash commands there instead of
+        # globally.
+        "dev_guild_id": os.getenv("DEV_GUILD_ID"),
+        # See members.py.
+        "member_cache": os.getenv("MEMBER_CACHE", MEMBER_CACHE_POLICY),
+        "member_cache_size": int(os.getenv("MEMBER_CACHE_SIZE", MEMBER_CACHE_SIZE)),
+        # See rates.py.
+        "shard_rates_path": os.getenv("SHARD_RATES_PATH", SHARD_RATES_PATH),
+    }
+    settings.update(options)
+    return HydraBot(command_prefix="$", intents=default_intents(), **settings)
+
+
+async def serve(bot, token):
+    # Client.run() only shuts down cleanly on Ctrl-C. SIGTERM (the cluster
+    # launcher, docker stop, systemd) has to go through close() as well, so
+    # queued writes are flushed, reminders stopped and the scheduler lease
+    # released.
+    closing = None
+
+    def stop():
+        nonlocal closing
+        if closing is None:
+            closing = asyncio.create_task(bot.close())
+
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(signum, stop)
+        except NotImplementedError:
+            # Windows: Ctrl-C still cancels start(), and leaving the
+            # context manager closes the bot.
+            pass
+
+    async with bot:
+        await bot.start(token)
+    # start() returns once the gateway is closed, before close() has
+    # flushed storage; see it through before the loop shuts down.
+    if closing is not None:
+        await closing
+
+
+def run():
+    discord.utils.setup_logging()
+    try:
+        asyncio.run(serve(create_app(), os.getenv("TOKEN")))
+    except KeyboardInterrupt:
+        pass
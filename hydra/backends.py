@@ -0,0 +1,673 @@
+# ============================================================
+#  HYDRA COMPANION — STORAGE BACKENDS
+# ============================================================
+#
+#  Storage (storage.py) holds the caches and the write-behind queue and
+#  talks to the database only through a StorageBackend. The query layer
+#  below is shared: it is written once with "?" placeholders against
+#  four primitives (fetchall, execute, execute_returning, transaction)
+#  that each backend implements.
+#
+#  SQLiteBackend   local mercy.db file (the default). One writer thread
+#                  plus a small pool of reader threads; WAL lets reads
+#                  run alongside a flush.
+#  PostgresBackend pooled asyncpg client for a shared PostgreSQL server,
+#                  so several bot processes can use the same state.
+#                  Select it with DATABASE_URL=postgresql://...
+
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from .migrations import LEGACY_KEYS_GUILD, run_migrations, run_postgres_migrations
+
+try:
+    import asyncpg
+except ImportError:
+    asyncpg = None
+
+SQLITE_READERS = 2
+# VACUUM once this share of the file is free pages.
+VACUUM_FREE_RATIO = 0.25
+
+POSTGRES_POOL_MIN = 1
+POSTGRES_POOL_MAX = 10
+
+MERCY_UPSERT = """
+    INSERT INTO mercy (user_id, shard_type, epic_pity, legendary_pity, mythical_pity)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT (user_id, shard_type) DO UPDATE SET
+        epic_pity=excluded.epic_pity,
+        legendary_pity=excluded.legendary_pity,
+        mythical_pity=excluded.mythical_pity
+"""
+
+KEYS_UPSERT = """
+    INSERT INTO keys (guild_id, user_id, username)
+    VALUES (?, ?, ?)
+    ON CONFLICT (guild_id, user_id) DO UPDATE SET
+        username=excluded.username
+"""
+
+KEY_USAGE_UPSERT = """
+    INSERT INTO key_usage (guild_id, user_id, boss, epoch, used)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT (guild_id, user_id, boss, epoch) DO UPDATE SET
+        used=excluded.used
+"""
+
+
+class StorageBackend:
+    name = "base"
+    # Largest IN (...) list sent in one query.
+    max_params = 900
+
+    def __init__(self):
+        self.commits = 0
+        self._commit_times = deque()
+
+    def _record_commit(self):
+        now = time.monotonic()
+        self.commits += 1
+        self._commit_times.append(now)
+        while self._commit_times and now - self._commit_times[0] > 60:
+            self._commit_times.popleft()
+
+    def commits_per_second(self):
+        now = time.monotonic()
+        return sum(1 for t in self._commit_times if now - t <= 60) / 60
+
+    # ------------------------------------------------------------
+    #  PRIMITIVES
+    # ------------------------------------------------------------
+
+    async def open(self):
+        raise NotImplementedError
+
+    async def close(self):
+        raise NotImplementedError
+
+    async def fetchall(self, sql, params=()):
+        raise NotImplementedError
+
+    async def execute(self, sql, params=()):
+        # Runs one statement in its own transaction; returns the row count.
+        raise NotImplementedError
+
+    async def execute_returning(self, sql, params=()):
+        # Like execute() for a statement with a RETURNING clause; returns
+        # the rows it produced.
+        raise NotImplementedError
+
+    async def transaction(self, batches):
+        # batches: [(sql, [params, ...]), ...] executed with one commit.
+        raise NotImplementedError
+
+    async def after_compaction(self):
+        pass
+
+    # ------------------------------------------------------------
+    #  MERCY
+    # ------------------------------------------------------------
+
+    async def load_users_mercy(self, user_ids):
+        states = {user_id: {} for user_id in user_ids}
+        for i in range(0, len(user_ids), self.max_params):
+            chunk = user_ids[i:i + self.max_params]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = await self.fetchall(
+                "SELECT user_id, shard_type, epic_pity, legendary_pity, mythical_pity "
+                f"FROM mercy WHERE user_id IN ({placeholders})",
+                chunk
+            )
+            for user_id, shard, epic, legendary, mythical in rows:
+                states[user_id][shard] = (epic, legendary, mythical)
+        return states
+
+    async def write_batch(self, mercy_upserts, mercy_deletes, roster_rows, key_usage_rows):
+        await self.transaction([
+            (MERCY_UPSERT, mercy_upserts),
+            ("DELETE FROM mercy WHERE user_id=? AND shard_type=?", mercy_deletes),
+            (KEYS_UPSERT, roster_rows),
+            (KEY_USAGE_UPSERT, key_usage_rows),
+        ])
+
+    async def compact_mercy(self, limit):
+        return await self.execute("""
+            DELETE FROM mercy WHERE (user_id, shard_type) IN (
+                SELECT user_id, shard_type FROM mercy
+                WHERE epic_pity = 0 AND legendary_pity = 0 AND mythical_pity = 0
+                LIMIT ?
+            )
+        """, (limit,))
+
+    # ------------------------------------------------------------
+    #  GUILD CHANNELS
+    # ------------------------------------------------------------
+
+    async def load_guild_channels(self, fields):
+        return await self.fetchall(
+            f"SELECT guild_id, {', '.join(fields)} FROM guild_channels ORDER BY guild_id"
+        )
+
+    async def set_guild_channel(self, guild_id, field, channel_id):
+        await self.transaction([
+            ("INSERT INTO guild_channels (guild_id) VALUES (?) ON CONFLICT (guild_id) DO NOTHING",
+             [(str(guild_id),)]),
+            (f"UPDATE guild_channels SET {field}=? WHERE guild_id=?", [(channel_id, str(guild_id))]),
+        ])
+
+    # ------------------------------------------------------------
+    #  KEYS
+    # ------------------------------------------------------------
+
+    # Every query below is restricted to one guild and served by primary
+    # keys, so its cost follows that guild's roster rather than the whole
+    # table. Usage is only ever read for the epochs passed in; rows from
+    # older epochs are left alone as history.
+
+    async def get_key_row(self, guild_id, user_id, epochs):
+        rows = await self.fetchall(
+            "SELECT boss, used FROM key_usage WHERE guild_id=? AND user_id=? "
+            "AND ((boss='hydra' AND epoch=?) OR (boss='chimera' AND epoch=?))",
+            (str(guild_id), str(user_id), epochs["hydra"], epochs["chimera"])
+        )
+        return dict(rows)
+
+    async def get_key_usage(self, guild_id, epochs):
+        return await self.fetchall("""
+            SELECT k.user_id, k.username, COALESCE(h.used, 0), COALESCE(c.used, 0)
+            FROM keys k
+            LEFT JOIN key_usage h
+                ON h.guild_id = k.guild_id AND h.user_id = k.user_id
+                AND h.boss = 'hydra' AND h.epoch = ?
+            LEFT JOIN key_usage c
+                ON c.guild_id = k.guild_id AND c.user_id = k.user_id
+                AND c.boss = 'chimera' AND c.epoch = ?
+            WHERE k.guild_id = ?
+        """, (epochs["hydra"], epochs["chimera"], str(guild_id)))
+
+    async def adopt_legacy_keys(self, guild_id):
+        # Rows already logged in the guild since the upgrade win.
+        params = [(str(guild_id), LEGACY_KEYS_GUILD)]
+        await self.transaction([
+            ("""
+                INSERT INTO keys (guild_id, user_id, username)
+                SELECT ?, user_id, username FROM keys WHERE guild_id=?
+                ON CONFLICT (guild_id, user_id) DO NOTHING
+            """, params),
+            ("""
+                INSERT INTO key_usage (guild_id, user_id, boss, epoch, used)
+                SELECT ?, user_id, boss, epoch, used FROM key_usage WHERE guild_id=?
+                ON CONFLICT (guild_id, user_id, boss, epoch) DO NOTHING
+            """, params),
+            ("DELETE FROM keys WHERE guild_id=?", [(LEGACY_KEYS_GUILD,)]),
+            ("DELETE FROM key_usage WHERE guild_id=?", [(LEGACY_KEYS_GUILD,)]),
+        ])
+
+    async def snapshot_key_usage(self, guild_id, boss, epoch, taken_at):
+        # Freezes one guild's week into key_report_snapshots. The first
+        # snapshot of a week wins, so a re-run report reads the same rows.
+        await self.execute("""
+            INSERT INTO key_report_snapshots (guild_id, boss, epoch, user_id, username, used, taken_at)
+            SELECT k.guild_id, CAST(? AS TEXT), CAST(? AS INTEGER), k.user_id, k.username,
+                   COALESCE(u.used, 0), CAST(? AS BIGINT)
+            FROM keys k
+            LEFT JOIN key_usage u
+                ON u.guild_id = k.guild_id AND u.user_id = k.user_id
+                AND u.boss = ? AND u.epoch = ?
+            WHERE k.guild_id = ?
+            ON CONFLICT (guild_id, boss, epoch, user_id) DO NOTHING
+        """, (boss, epoch, taken_at, boss, epoch, str(guild_id)))
+
+    async def get_key_snapshot(self, guild_id, boss, epoch):
+        return await self.fetchall(
+            "SELECT username, used FROM key_report_snapshots "
+            "WHERE guild_id=? AND boss=? AND epoch=? ORDER BY username",
+            (str(guild_id), boss, epoch)
+        )
+
+    # ------------------------------------------------------------
+    #  SCHEDULED JOBS
+    # ------------------------------------------------------------
+
+    async def get_job_runs(self):
+        return dict(await self.fetchall("SELECT job_id, last_run_at FROM job_runs"))
+
+    async def record_job_run(self, job_id, ran_at):
+        await self.execute("""
+            INSERT INTO job_runs (job_id, last_run_at) VALUES (?, ?)
+            ON CONFLICT (job_id) DO UPDATE SET last_run_at=excluded.last_run_at
+        """, (job_id, ran_at))
+
+    # ------------------------------------------------------------
+    #  CLASH SCHEDULES
+    # ------------------------------------------------------------
+
+    async def get_clash_schedules(self, guild_id):
+        return await self.fetchall(
+            "SELECT guild_id, event, weekday, local_time, timezone, lead_minutes, next_fire_at "
+            "FROM clash_schedules WHERE guild_id=? ORDER BY event",
+            (str(guild_id),)
+        )
+
+    async def get_due_clash_schedules(self, now):
+        return await self.fetchall(
+            "SELECT guild_id, event, weekday, local_time, timezone, lead_minutes, next_fire_at "
+            "FROM clash_schedules WHERE next_fire_at <= ? ORDER BY next_fire_at",
+            (now,)
+        )
+
+    async def get_next_clash_fire(self):
+        rows = await self.fetchall("SELECT MIN(next_fire_at) FROM clash_schedules")
+        return rows[0][0]
+
+    async def set_clash_schedules(self, rows, replace=True):
+        # rows: [(guild_id, event, weekday, local_time, timezone, lead_minutes, next_fire_at)]
+        conflict = """
+            DO UPDATE SET
+                weekday=excluded.weekday,
+                local_time=excluded.local_time,
+                timezone=excluded.timezone,
+                lead_minutes=excluded.lead_minutes,
+                next_fire_at=excluded.next_fire_at
+        """ if replace else "DO NOTHING"
+        await self.transaction([(f"""
+            INSERT INTO clash_schedules
+                (guild_id, event, weekday, local_time, timezone, lead_minutes, next_fire_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (guild_id, event) {conflict}
+        """, rows)])
+
+    async def advance_clash_schedules(self, rows):
+        # rows: [(next_fire_at, guild_id, event)]
+        await self.transaction([
+            ("UPDATE clash_schedules SET next_fire_at=? WHERE guild_id=? AND event=?", rows),
+        ])
+
+    # ------------------------------------------------------------
+    #  BROADCAST LEDGER
+    # ------------------------------------------------------------
+
+    async def start_broadcast(self, run_id, name, started_at, targets):
+        # Idempotent: an existing run keeps its start time and deliveries.
+        await self.transaction([
+            ("INSERT INTO broadcast_runs (run_id, name, started_at) VALUES (?, ?, ?) "
+             "ON CONFLICT (run_id) DO NOTHING",
+             [(run_id, name, started_at)]),
+            ("INSERT INTO broadcast_deliveries (run_id, guild_id, part, channel_id, content) "
+             "VALUES (?, ?, ?, ?, ?) ON CONFLICT (run_id, guild_id, part) DO NOTHING",
+             [(run_id, str(guild_id), part, channel_id, content)
+              for guild_id, channel_id, part, content in targets]),
+        ])
+        rows = await self.fetchall("SELECT started_at FROM broadcast_runs WHERE run_id=?", (run_id,))
+        return rows[0][0]
+
+    async def claim_deliveries(self, run_id, holder, now, stale_before):
+        # Marks the run's pending parts as being sent by `holder` and
+        # returns them, in one statement so two workers can never both
+        # claim a part. Parts claimed before stale_before are taken over,
+        # whoever claimed them: that worker has lost the lease since, or
+        # is this one after its duties were cut short.
+        return await self.execute_returning(
+            "UPDATE broadcast_deliveries SET status='sending', claimed_by=?, claimed_at=? "
+            "WHERE run_id=? AND (status='pending' OR (status='sending' AND claimed_at<?)) "
+            "RETURNING guild_id, channel_id, part, content",
+            (holder, now, run_id, stale_before)
+        )
+
+    async def release_deliveries(self, run_id, holder):
+        # Hands `holder`'s unsent parts back to pending.
+        await self.execute(
+            "UPDATE broadcast_deliveries SET status='pending', claimed_by=NULL, claimed_at=NULL "
+            "WHERE run_id=? AND status='sending' AND claimed_by=?",
+            (run_id, holder)
+        )
+
+    async def record_delivery(self, run_id, guild_id, part, status, message_id, error, attempts, latency_ms):
+        await self.execute(
+            "UPDATE broadcast_deliveries SET status=?, message_id=?, error=?, attempts=?, latency_ms=? "
+            "WHERE run_id=? AND guild_id=? AND part=?",
+            (status, message_id, error, attempts, latency_ms, run_id, str(guild_id), part)
+        )
+
+    async def finish_broadcast(self, run_id, finished_at):
+        # A run with parts still claimed elsewhere stays open, so it is
+        # resumed if that worker never records them.
+        return await self.execute(
+            "UPDATE broadcast_runs SET finished_at=? WHERE run_id=? AND NOT EXISTS ("
+            "SELECT 1 FROM broadcast_deliveries WHERE run_id=? AND status IN ('pending', 'sending'))",
+            (finished_at, run_id, run_id)
+        ) > 0
+
+    async def expire_broadcast(self, run_id, finished_at):
+        await self.transaction([
+            ("UPDATE broadcast_deliveries SET status='failed', error='expired before resume' "
+             "WHERE run_id=? AND status IN ('pending', 'sending')", [(run_id,)]),
+            ("UPDATE broadcast_runs SET finished_at=? WHERE run_id=?", [(finished_at, run_id)]),
+        ])
+
+    async def get_unfinished_broadcasts(self):
+        return await self.fetchall(
+            "SELECT run_id, name, started_at FROM broadcast_runs WHERE finished_at IS NULL ORDER BY started_at"
+        )
+
+    async def get_broadcast_stats(self, limit):
+        # Per recent run: (run_id, name, started_at, finished_at, targets,
+        # sent, failed, pending, latencies of sent deliveries in ms). A
+        # guild counts as sent once all its parts are, and failed if any
+        # part failed; its latency is that of its last part.
+        runs = await self.fetchall(
+            "SELECT run_id, name, started_at, finished_at FROM broadcast_runs "
+            "ORDER BY started_at DESC LIMIT ?",
+            (limit,)
+        )
+        stats = []
+        for run_id, name, started_at, finished_at in runs:
+            rows = await self.fetchall(
+                "SELECT guild_id, status, latency_ms FROM broadcast_deliveries WHERE run_id=?", (run_id,)
+            )
+            guilds = {}
+            for guild_id, status, latency in rows:
+                guilds.setdefault(guild_id, []).append((status, latency))
+
+            counts = {"sent": 0, "failed": 0, "pending": 0}
+            latencies = []
+            for parts in guilds.values():
+                statuses = {status for status, _ in parts}
+                if "failed" in statuses:
+                    counts["failed"] += 1
+                elif statuses == {"sent"}:
+                    counts["sent"] += 1
+                    latencies.append(max(latency or 0 for _, latency in parts))
+                else:
+                    counts["pending"] += 1
+            stats.append((run_id, name, started_at, finished_at, len(guilds),
+                          counts["sent"], counts["failed"], counts["pending"], sorted(latencies)))
+        return stats
+
+    # ------------------------------------------------------------
+    #  CLUSTER
+    # ------------------------------------------------------------
+
+    async def acquire_lease(self, name, holder, now, ttl):
+        # Takes the lease if it is free or lapsed, renews it if `holder`
+        # already has it, and reports whether `holder` holds it now.
+        await self.execute("""
+            INSERT INTO cluster_leases (name, holder, expires_at) VALUES (?, ?, ?)
+            ON CONFLICT (name) DO UPDATE SET holder=excluded.holder, expires_at=excluded.expires_at
+            WHERE cluster_leases.holder = excluded.holder OR cluster_leases.expires_at < ?
+        """, (name, holder, now + ttl, now))
+        rows = await self.fetchall("SELECT holder FROM cluster_leases WHERE name=?", (name,))
+        return bool(rows) and rows[0][0] == holder
+
+    async def release_lease(self, name, holder):
+        await self.execute("DELETE FROM cluster_leases WHERE name=? AND holder=?", (name, holder))
+
+    async def get_lease(self, name):
+        rows = await self.fetchall("SELECT holder, expires_at FROM cluster_leases WHERE name=?", (name,))
+        return rows[0] if rows else None
+
+    async def bump_reload_version(self, name):
+        rows = await self.execute_returning("""
+            INSERT INTO reload_versions (name, version) VALUES (?, 1)
+            ON CONFLICT (name) DO UPDATE SET version = reload_versions.version + 1
+            RETURNING version
+        """, (name,))
+        return rows[0][0]
+
+    async def get_reload_version(self, name):
+        # 0 if `name` was never reloaded.
+        rows = await self.fetchall("SELECT version FROM reload_versions WHERE name=?", (name,))
+        return rows[0][0] if rows else 0
+
+    async def set_shard_stats(self, rows):
+        # rows: [(shard_id, cluster_id, guild_count, latency_ms, updated_at)]
+        await self.transaction([("""
+            INSERT INTO cluster_shards (shard_id, cluster_id, guild_count, latency_ms, updated_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (shard_id) DO UPDATE SET
+                cluster_id=excluded.cluster_id,
+                guild_count=excluded.guild_count,
+                latency_ms=excluded.latency_ms,
+                updated_at=excluded.updated_at
+        """, rows)])
+
+    async def get_shard_stats(self):
+        return await self.fetchall(
+            "SELECT shard_id, cluster_id, guild_count, latency_ms, updated_at FROM cluster_shards ORDER BY shard_id"
+        )
+
+    # ------------------------------------------------------------
+    #  REMINDERS
+    # ------------------------------------------------------------
+
+    async def add_reminder(self, user_id, guild_id, channel_id, text, due_at, created_at):
+        rows = await self.execute_returning(
+            "INSERT INTO reminders (user_id, guild_id, channel_id, text, due_at, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?) RETURNING id",
+            (str(user_id), str(guild_id) if guild_id else None, channel_id, text, due_at, created_at)
+        )
+        return rows[0][0]
+
+    async def get_user_reminders(self, user_id):
+        return await self.fetchall(
+            "SELECT id, text, due_at FROM reminders WHERE user_id=? ORDER BY due_at, id",
+            (str(user_id),)
+        )
+
+    async def get_reminders(self):
+        return await self.fetchall(
+            "SELECT id, user_id, guild_id, channel_id, text, due_at FROM reminders ORDER BY due_at, id"
+        )
+
+    async def delete_reminder(self, reminder_id, user_id=None):
+        # Reports whether the reminder existed (and belonged to user_id).
+        if user_id is None:
+            return await self.execute("DELETE FROM reminders WHERE id=?", (reminder_id,)) > 0
+        return await self.execute(
+            "DELETE FROM reminders WHERE id=? AND user_id=?", (reminder_id, str(user_id))
+        ) > 0
+
+    async def claim_reminders(self, reminder_ids):
+        # Deletes the reminders and returns the rows that were still there,
+        # by id, as restore_reminders() takes them back.
+        claimed = {}
+        for i in range(0, len(reminder_ids), self.max_params):
+            chunk = reminder_ids[i:i + self.max_params]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = await self.execute_returning(
+                f"DELETE FROM reminders WHERE id IN ({placeholders}) "
+                "RETURNING id, user_id, guild_id, channel_id, text, due_at, created_at",
+                chunk
+            )
+            claimed.update((row[0], tuple(row)) for row in rows)
+        return claimed
+
+    async def restore_reminders(self, rows):
+        # Puts claimed rows back under their original ids.
+        await self.transaction([
+            ("INSERT INTO reminders (id, user_id, guild_id, channel_id, text, due_at, created_at) "
+             "VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT (id) DO NOTHING",
+             rows),
+        ])
+
+
+# ============================================================
+#  SQLITE
+# ============================================================
+
+class SQLiteBackend(StorageBackend):
+    name = "sqlite"
+
+    def __init__(self, path, readers=SQLITE_READERS):
+        super().__init__()
+        self.path = path
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mercy-db-write")
+        self._readers = ThreadPoolExecutor(max_workers=readers, thread_name_prefix="mercy-db-read")
+        self._write_conn = None
+        self._local = threading.local()
+        self._read_conns = []
+
+    async def _write(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._writer, fn, *args)
+
+    async def _read(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._readers, fn, *args)
+
+    def _open_sync(self):
+        self._write_conn = sqlite3.connect(self.path)
+        self._write_conn.execute("PRAGMA journal_mode=WAL")
+        self._write_conn.execute("PRAGMA synchronous=NORMAL")
+        run_migrations(self._write_conn)
+
+    def _reader_conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._local.conn = conn
+            self._read_conns.append(conn)
+        return conn
+
+    async def open(self):
+        await self._write(self._open_sync)
+
+    async def close(self):
+        await self._write(self._write_conn.close)
+        self._writer.shutdown(wait=True)
+        self._readers.shutdown(wait=True)
+        for conn in self._read_conns:
+            conn.close()
+
+    def _fetchall_sync(self, sql, params):
+        return self._reader_conn().execute(sql, params).fetchall()
+
+    def _execute_sync(self, sql, params):
+        try:
+            cur = self._write_conn.execute(sql, params)
+            self._write_conn.commit()
+        except Exception:
+            self._write_conn.rollback()
+            raise
+        self._record_commit()
+        return cur.rowcount
+
+    def _execute_returning_sync(self, sql, params):
+        try:
+            rows = self._write_conn.execute(sql, params).fetchall()
+            self._write_conn.commit()
+        except Exception:
+            self._write_conn.rollback()
+            raise
+        self._record_commit()
+        return rows
+
+    def _transaction_sync(self, batches):
+        try:
+            for sql, rows in batches:
+                if rows:
+                    self._write_conn.executemany(sql, rows)
+            self._write_conn.commit()
+        except Exception:
+            self._write_conn.rollback()
+            raise
+        self._record_commit()
+
+    def _vacuum_if_fragmented_sync(self):
+        page_count = self._write_conn.execute("PRAGMA page_count").fetchone()[0]
+        free_pages = self._write_conn.execute("PRAGMA freelist_count").fetchone()[0]
+        if page_count and free_pages / page_count >= VACUUM_FREE_RATIO:
+            self._write_conn.execute("VACUUM")
+
+    async def fetchall(self, sql, params=()):
+        return await self._read(self._fetchall_sync, sql, tuple(params))
+
+    async def execute(self, sql, params=()):
+        return await self._write(self._execute_sync, sql, tuple(params))
+
+    async def execute_returning(self, sql, params=()):
+        return await self._write(self._execute_returning_sync, sql, tuple(params))
+
+    async def transaction(self, batches):
+        # Submitted synchronously so a batch handed over during shutdown
+        # still reaches the writer thread.
+        future = self._writer.submit(self._transaction_sync, batches)
+        await asyncio.wrap_future(future)
+
+    async def after_compaction(self):
+        await self._write(self._vacuum_if_fragmented_sync)
+
+
+# ============================================================
+#  POSTGRESQL
+# ============================================================
+
+def to_postgres_placeholders(sql):
+    parts = sql.split("?")
+    out = [parts[0]]
+    for i, part in enumerate(parts[1:], start=1):
+        out.append(f"${i}")
+        out.append(part)
+    return "".join(out)
+
+
+def postgres_rowcount(status):
+    # asyncpg returns the command tag, e.g. "DELETE 12" or "UPDATE 3".
+    try:
+        return int(status.rsplit(" ", 1)[-1])
+    except ValueError:
+        return 0
+
+
+class PostgresBackend(StorageBackend):
+    name = "postgres"
+
+    def __init__(self, dsn, min_size=POSTGRES_POOL_MIN, max_size=POSTGRES_POOL_MAX):
+        if asyncpg is None:
+            raise RuntimeError("DATABASE_URL points at PostgreSQL but asyncpg is not installed.")
+        super().__init__()
+        self.dsn = dsn
+        self.min_size = min_size
+        self.max_size = max_size
+        self.pool = None
+
+    async def open(self):
+        self.pool = await asyncpg.create_pool(self.dsn, min_size=self.min_size, max_size=self.max_size)
+        async with self.pool.acquire() as conn:
+            await run_postgres_migrations(conn)
+
+    async def close(self):
+        await self.pool.close()
+
+    async def fetchall(self, sql, params=()):
+        rows = await self.pool.fetch(to_postgres_placeholders(sql), *params)
+        return [tuple(row) for row in rows]
+
+    async def execute(self, sql, params=()):
+        status = await self.pool.execute(to_postgres_placeholders(sql), *params)
+        self._record_commit()
+        return postgres_rowcount(status)
+
+    async def execute_returning(self, sql, params=()):
+        rows = await self.pool.fetch(to_postgres_placeholders(sql), *params)
+        self._record_commit()
+        return [tuple(row) for row in rows]
+
+    async def transaction(self, batches):
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                for sql, rows in batches:
+                    if rows:
+                        await conn.executemany(to_postgres_placeholders(sql), rows)
+        self._record_commit()
+
+
+def create_backend(url):
+    if url.startswith(("postgres://", "postgresql://")):
+        return PostgresBackend(url)
+    if url.startswith("sqlite:///"):
+        url = url[len("sqlite:///"):]
+    return SQLiteBackend(url)
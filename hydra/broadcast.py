@@ -0,0 +1,236 @@
+# ============================================================
+#  HYDRA COMPANION — BROADCAST ENGINE
+# ============================================================
+#
+#  Sends messages to many guilds at once (clash warnings, key reports).
+#  Deliveries run concurrently, up to BROADCAST_CONCURRENCY at a time,
+#  and every request first takes a slot from a shared pacer that keeps
+#  the whole bot under Discord's global request limit. Per-route buckets
+#  are honoured by discord.py itself, which waits out a 429 on the
+#  affected channel only; each guild gets its own channel, so one slow
+#  route never holds up the rest.
+#
+#  Every guild is isolated: a missing permission or deleted channel is
+#  recorded and skipped, server errors and rate limits are retried with
+#  backoff, and nothing one guild does can stop delivery to the others.
+#
+#  Every run is written to a delivery ledger (broadcast_runs and
+#  broadcast_deliveries) before the first message goes out. A guild may
+#  get several messages (parts), sent in order. A worker claims the
+#  pending parts it is about to send (status sending, stamped with the
+#  worker), and each then moves to sent (with the message id) or failed
+#  as it completes. Run ids are derived from what is being sent, so
+#  starting the same run twice only sends what is still pending, and
+#  resume_broadcasts() finishes runs cut short by a restart or a lost
+#  leader lease. A run cancelled mid-send hands its unsent parts back to
+#  pending; a part that was on its way out when the cancel came may be
+#  sent again.
+
+import asyncio
+import time
+
+import aiohttp
+import discord
+
+from .cluster import LEASE_RENEW, LEASE_TTL, node_id
+
+BROADCAST_CONCURRENCY = 10
+# Discord allows 50 requests/second per bot; leave room for everything else.
+BROADCAST_RATE = 40
+BROADCAST_RETRIES = 3
+BROADCAST_BACKOFF = 1.0
+DISCORD_MESSAGE_LIMIT = 2000
+# Unfinished runs older than this are marked failed instead of resumed.
+BROADCAST_RESUME_MAX_AGE = 6 * 3600
+# A leader that cannot renew stands down (cancelling its sends) within
+# LEASE_RENEW of its last renewal, and nobody else gets the lease until
+# LEASE_TTL after it. A claim this old is therefore one nobody is sending
+# any more, unless this process still is (see _sending).
+BROADCAST_CLAIM_STALE = LEASE_TTL - LEASE_RENEW
+
+# Runs this process is sending right now.
+_sending = set()
+
+
+def chunk_lines(header, lines, limit=DISCORD_MESSAGE_LIMIT):
+    # Packs `lines` into as few messages as possible, each at most `limit`
+    # characters. The header opens the first message only; a single line
+    # that is too long on its own is cut short.
+    chunks = []
+    current = header
+    for line in lines:
+        line = line[:limit]
+        if current and len(current) + 1 + len(line) > limit:
+            chunks.append(current)
+            current = line
+        else:
+            current = f"{current}\n{line}" if current else line
+    if current or not chunks:
+        chunks.append(current)
+    return chunks
+
+
+class Pacer:
+    # Hands out request slots at most `rate` per second, in arrival order.
+    def __init__(self, rate):
+        self.interval = 1 / rate
+        self._next_slot = 0.0
+
+    async def wait(self):
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+# Shared by every broadcast, since the global limit is per bot.
+pacer = Pacer(BROADCAST_RATE)
+
+
+class BroadcastSummary:
+    def __init__(self, run_id, targets):
+        self.run_id = run_id
+        self.targets = targets
+        self.delivered = 0
+        self.retries = 0
+        self.failures = {}
+        self.started = time.perf_counter()
+        self.last_delivery_s = None
+        self.elapsed_s = None
+
+    def describe(self):
+        last = f"{self.last_delivery_s:.2f}s" if self.last_delivery_s is not None else "n/a"
+        text = (
+            f"Broadcast {self.run_id}: {self.delivered}/{self.targets} delivered, "
+            f"{len(self.failures)} failed, {self.retries} retries, "
+            f"last delivery after {last}, finished in {self.elapsed_s:.2f}s"
+        )
+        for guild_id, error in self.failures.items():
+            text += f"\n  guild {guild_id}: {error}"
+        return text
+
+
+def retry_delay(error, attempt):
+    # Seconds to wait before retrying `error`, or None if it is permanent.
+    if isinstance(error, discord.RateLimited):
+        return error.retry_after
+    if isinstance(error, (discord.Forbidden, discord.NotFound)):
+        return None
+    if isinstance(error, discord.HTTPException) and error.status != 429 and error.status < 500:
+        return None
+    if not isinstance(error, (discord.HTTPException, aiohttp.ClientError, asyncio.TimeoutError)):
+        return None
+    return BROADCAST_BACKOFF * 2 ** attempt
+
+
+async def send_part(db, summary, run_id, started_at, guild_id, channel, part, content, retries):
+    # Returns the error text if the part could not be delivered.
+    for attempt in range(retries + 1):
+        await pacer.wait()
+        try:
+            message = await channel.send(content)
+        except Exception as e:
+            delay = retry_delay(e, attempt)
+            if delay is None or attempt == retries:
+                error = f"{type(e).__name__}: {e}"
+                await db.record_delivery(run_id, guild_id, part, "failed", error=error, attempts=attempt + 1)
+                return error
+            summary.retries += 1
+            await asyncio.sleep(delay)
+        else:
+            await db.record_delivery(
+                run_id, guild_id, part, "sent",
+                message_id=message.id,
+                attempts=attempt + 1,
+                latency_ms=int((time.time() - started_at) * 1000)
+            )
+            return None
+
+
+async def deliver(db, summary, run_id, started_at, guild_id, channel, parts, retries):
+    # parts: [(part, content), ...] still pending for this guild, in order.
+    # A guild's messages go out one after another so they read in order;
+    # once one fails, the rest of that guild's parts are failed with it.
+    error = None if channel is not None else "channel not found"
+    for part, content in parts:
+        if error is None:
+            error = await send_part(db, summary, run_id, started_at, guild_id, channel, part, content, retries)
+        else:
+            await db.record_delivery(run_id, guild_id, part, "failed", error=error)
+
+    if error is None:
+        summary.delivered += 1
+        summary.last_delivery_s = time.perf_counter() - summary.started
+    else:
+        summary.failures[guild_id] = error
+
+
+async def run_pending(db, run_id, started_at, get_channel, concurrency, retries):
+    # Returns None if this process is already sending the run: its claims
+    # may look stale by now, but they are still being worked through.
+    if run_id in _sending:
+        print(f"Broadcast {run_id} is already being sent")
+        return None
+    _sending.add(run_id)
+    try:
+        return await send_claimed(db, run_id, started_at, get_channel, concurrency, retries)
+    except asyncio.CancelledError:
+        # Lost the lease or shutting down: whatever was not sent yet goes
+        # back to pending for whoever resumes the run.
+        try:
+            await db.release_deliveries(run_id, node_id())
+        except Exception as e:
+            print(f"Releasing broadcast {run_id} failed:", e)
+        raise
+    finally:
+        _sending.discard(run_id)
+
+
+async def send_claimed(db, run_id, started_at, get_channel, concurrency, retries):
+    now = int(time.time())
+    by_guild = {}
+    claimed = await db.claim_deliveries(run_id, node_id(), now, now - BROADCAST_CLAIM_STALE)
+    for guild_id, channel_id, part, content in sorted(claimed, key=lambda row: (row[0], row[2])):
+        by_guild.setdefault((guild_id, channel_id), []).append((part, content))
+
+    summary = BroadcastSummary(run_id, len(by_guild))
+    gate = asyncio.Semaphore(concurrency)
+
+    async def run(guild_id, channel_id, parts):
+        async with gate:
+            await deliver(db, summary, run_id, started_at, guild_id, get_channel(channel_id), sorted(parts), retries)
+
+    await asyncio.gather(*(run(guild_id, channel_id, parts) for (guild_id, channel_id), parts in by_guild.items()))
+    await db.finish_broadcast(run_id, int(time.time()))
+
+    summary.elapsed_s = time.perf_counter() - summary.started
+    print(summary.describe())
+    return summary
+
+
+async def broadcast(db, run_id, name, targets, get_channel,
+                    concurrency=BROADCAST_CONCURRENCY, retries=BROADCAST_RETRIES):
+    # targets: [(guild_id, channel_id, content), ...] where content is one
+    # message or a list of messages (see chunk_lines).
+    # get_channel: channel_id -> channel or None
+    deliveries = []
+    for guild_id, channel_id, content in targets:
+        parts = [content] if isinstance(content, str) else content
+        deliveries.extend((guild_id, channel_id, part, text) for part, text in enumerate(parts))
+
+    started_at = await db.start_broadcast(run_id, name, int(time.time()), deliveries)
+    return await run_pending(db, run_id, started_at, get_channel, concurrency, retries)
+
+
+async def resume_broadcasts(db, get_channel, now=None):
+    # Called once at startup, after the guild list is available.
+    now = int(time.time()) if now is None else now
+    for run_id, name, started_at in await db.get_unfinished_broadcasts():
+        if now - started_at > BROADCAST_RESUME_MAX_AGE:
+            print(f"Expiring unfinished broadcast {run_id}")
+            await db.expire_broadcast(run_id, now)
+            continue
+        print(f"Resuming broadcast {run_id}")
+        await run_pending(db, run_id, started_at, get_channel, BROADCAST_CONCURRENCY, BROADCAST_RETRIES)
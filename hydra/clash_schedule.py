@@ -0,0 +1,173 @@
+# ============================================================
+#  HYDRA COMPANION — CLASH SCHEDULES
+# ============================================================
+#
+#  Every guild has one row per clash event in clash_schedules: the
+#  weekday and local time the clash starts, the timezone those are in,
+#  and how many minutes ahead of it the warning goes out. Each row also
+#  stores next_fire_at (unix seconds), which is indexed.
+#
+#  ClashScheduler is a single loop over that index: it sleeps until the
+#  earliest next_fire_at, pops every due row and hands the due guilds to
+#  `fire`, grouped by event, lead time and scheduled fire time. Each group
+#  is advanced to its following week once `fire` returns; a group whose
+#  run fails is retried on the next pass, and the broadcast ledger keeps
+#  it from sending anything twice. Editing a schedule calls wake() so the
+#  loop re-reads the index straight away. A warning that comes due while
+#  the bot is down is still sent late, as long as the clash has not
+#  started yet.
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo, available_timezones
+
+CLASH_EVENTS = ("hydra", "chimera")
+
+# event -> (weekday (Monday=0), "HH:MM", timezone, lead minutes)
+DEFAULT_CLASH_SCHEDULES = {
+    "hydra": (2, "11:00", "Europe/London", 24 * 60),
+    "chimera": (3, "11:00", "Europe/London", 24 * 60),
+}
+
+WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+# Upper bound on one sleep, so clock jumps are noticed within a minute.
+MAX_SLEEP = 60
+
+
+def parse_local_time(text):
+    # "HH:MM" -> (hour, minute); raises ValueError on anything else.
+    hour, minute = (int(part) for part in text.split(":"))
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        raise ValueError(f"Invalid time: {text}")
+    return hour, minute
+
+
+def next_fire_at(weekday, local_time, tz_name, lead_minutes, after):
+    # First warning time strictly after `after` (unix seconds). The clash
+    # is a wall-clock time in its own zone; the lead is real elapsed time.
+    tz = ZoneInfo(tz_name)
+    hour, minute = parse_local_time(local_time)
+    lead = timedelta(minutes=lead_minutes)
+
+    # Walk from the first clash that could still have its warning ahead.
+    local = datetime.fromtimestamp(after, timezone.utc).astimezone(tz) + lead
+    clash = local.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    clash += timedelta(days=(weekday - local.weekday()) % 7)
+    while True:
+        fire = int((clash.astimezone(timezone.utc) - lead).timestamp())
+        if fire > after:
+            return fire
+        clash += timedelta(days=7)
+
+
+def lead_label(lead_minutes):
+    # As used in the warning itself: "24 HOUR WARNING".
+    if lead_minutes % 60 == 0:
+        return f"{lead_minutes // 60} HOUR"
+    return f"{lead_minutes} MINUTE"
+
+
+def lead_text(lead_minutes):
+    # For settings summaries: "24 hours", "1 hour", "90 minutes".
+    count, unit = (lead_minutes // 60, "hour") if lead_minutes % 60 == 0 else (lead_minutes, "minute")
+    return f"{count} {unit}" + ("" if count == 1 else "s")
+
+
+def format_clash_schedule(row):
+    _, event, weekday, local_time, tz_name, lead_minutes, next_fire = row
+    return (
+        f"**{event.capitalize()}** — {lead_text(lead_minutes)} before "
+        f"{WEEKDAYS[weekday]} {local_time} ({tz_name}), next warning <t:{next_fire}:R>"
+    )
+
+
+@lru_cache(maxsize=1)
+def timezone_names():
+    return sorted(available_timezones())
+
+
+def default_schedule_rows(guild_id, now=None):
+    # Rows for set/ensure_clash_schedules with the default clash times.
+    now = int(time.time()) if now is None else now
+    rows = []
+    for event, (weekday, local_time, tz_name, lead) in DEFAULT_CLASH_SCHEDULES.items():
+        fire = next_fire_at(weekday, local_time, tz_name, lead, now)
+        rows.append((str(guild_id), event, weekday, local_time, tz_name, lead, fire))
+    return rows
+
+
+class ClashScheduler:
+    def __init__(self, db, fire):
+        # fire: async callable(event, lead_minutes, fire_at, guild_ids)
+        self.db = db
+        self.fire = fire
+        self._wake = asyncio.Event()
+        self._task = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def wake(self):
+        self._wake.set()
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self):
+        while True:
+            self._wake.clear()
+            delay = MAX_SLEEP
+            try:
+                await self.fire_due()
+                next_at = await self.db.get_next_clash_fire()
+                if next_at is not None:
+                    delay = min(max(next_at - time.time(), 0), MAX_SLEEP)
+            except Exception as e:
+                print("Clash scheduler failed:", e)
+
+            try:
+                await asyncio.wait_for(self._wake.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def fire_due(self, now=None):
+        now = int(time.time()) if now is None else now
+        due = await self.db.get_due_clash_schedules(now)
+        if not due:
+            return
+
+        groups = {}
+        skipped = []
+        for guild_id, event, weekday, local_time, tz_name, lead, fire_at in due:
+            advanced = (next_fire_at(weekday, local_time, tz_name, lead, now), guild_id, event)
+            if now < fire_at + lead * 60:
+                groups.setdefault((event, lead, fire_at), []).append(advanced)
+            else:
+                print(f"Skipping {event} warning for guild {guild_id}: the clash already started")
+                skipped.append(advanced)
+        if skipped:
+            await self.db.advance_clash_schedules(skipped)
+
+        # Advance after sending, so a run that fails (or a leader that dies
+        # mid-run) leaves the rows due. The run id is the same next time,
+        # and the ledger only sends what is still pending.
+        failed = 0
+        for (event, lead, fire_at), advanced in groups.items():
+            try:
+                await self.fire(event, lead, fire_at, [guild_id for _, guild_id, _ in advanced])
+            except Exception as e:
+                print(f"Sending {event} warnings for {fire_at} failed:", e)
+                failed += 1
+                continue
+            await self.db.advance_clash_schedules(advanced)
+
+        if failed:
+            # Back off until the next pass instead of refiring at once.
+            raise RuntimeError(f"{failed} warning run(s) left due for a retry")
@@ -0,0 +1,238 @@
+# ============================================================
+#  HYDRA COMPANION — CLUSTER MODE
+# ============================================================
+#
+#  The bot is an AutoShardedBot. Run on its own (python -m hydra) it
+#  opens every shard Discord recommends in one process. For more cores,
+#  run the launcher instead:
+#
+#      python -m hydra.cluster    # CLUSTER_COUNT workers, SHARD_COUNT shards
+#
+#  It splits the shards into contiguous ranges and starts one bot
+#  worker per range (SHARD_COUNT, SHARD_IDS and CLUSTER_ID in its
+#  environment), restarting any worker that crashes. Every worker must
+#  reach the same database, so either share the SQLite file on one host
+#  or point DATABASE_URL at PostgreSQL.
+#
+#  Cluster-wide work (the APScheduler jobs and clash warnings) runs on
+#  one worker only: the holder of the "scheduler" lease in the shared
+#  store. The holder renews it every LEASE_RENEW seconds; if it stops,
+#  the lease lapses after LEASE_TTL and another worker takes over. The
+#  duties start in a task of their own, so a long catch-up broadcast
+#  never holds up renewal, and losing the lease cancels them. The same
+#  loop publishes each worker's per-shard guild counts and latencies to
+#  cluster_shards, which /admin shards reads.
+
+import asyncio
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+LEASE_TTL = 30
+LEASE_RENEW = 10
+# Shard rows older than this belong to a worker that has gone away.
+SHARD_STALE_AFTER = 3 * LEASE_RENEW
+
+WORKER_RESTART_DELAY = 5
+# Per-process mercy caches cannot see each other's writes, so workers
+# read mercy through to the database unless told otherwise.
+WORKER_MERCY_CACHE_SIZE = "0"
+
+
+def shard_config_from_env():
+    # (shard_count, shard_ids, cluster_id) for this process. Unset means a
+    # single process that runs every recommended shard.
+    shard_count = os.getenv("SHARD_COUNT")
+    shard_ids = os.getenv("SHARD_IDS")
+    return (
+        int(shard_count) if shard_count else None,
+        [int(s) for s in shard_ids.split(",")] if shard_ids else None,
+        int(os.getenv("CLUSTER_ID", "0")),
+    )
+
+
+def shard_for_guild(guild_id, shard_count):
+    # Discord's routing rule: which shard receives a guild's events.
+    return (int(guild_id) >> 22) % shard_count
+
+
+def node_id():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class LeaderElection:
+    def __init__(self, db, name, on_elected, on_demoted, heartbeat=None):
+        # on_elected / on_demoted / heartbeat: async callables, no arguments.
+        self.db = db
+        self.name = name
+        self.holder = node_id()
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.heartbeat = heartbeat
+        self.is_leader = False
+        self._task = None
+        self._duties = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self.is_leader:
+            await self._demote()
+            try:
+                await self.db.release_lease(self.name, self.holder)
+            except Exception as e:
+                print("Releasing leader lease failed:", e)
+
+    async def _run(self):
+        while True:
+            await self.tick()
+            await asyncio.sleep(LEASE_RENEW)
+
+    async def tick(self, now=None):
+        now = int(time.time()) if now is None else now
+        try:
+            leader = await self.db.acquire_lease(self.name, self.holder, now, LEASE_TTL)
+        except Exception as e:
+            # Without a renewal we cannot know whether someone else holds
+            # it now, so stand down rather than risk running twice.
+            print("Leader lease renewal failed:", e)
+            leader = False
+
+        if leader and not self.is_leader:
+            print(f"{self.holder} is now the {self.name} leader")
+            self.is_leader = True
+            self._duties = asyncio.create_task(self._start_duties())
+        elif not leader and self.is_leader:
+            await self._demote()
+
+        if self.heartbeat is not None:
+            try:
+                await self.heartbeat()
+            except Exception as e:
+                print("Cluster heartbeat failed:", e)
+
+    async def _start_duties(self):
+        try:
+            await self.on_elected()
+        except Exception as e:
+            print("Starting leader duties failed:", e)
+
+    async def _demote(self):
+        print(f"{self.holder} is no longer the {self.name} leader")
+        self.is_leader = False
+        # Whatever the duties were still doing (a resumed broadcast, a
+        # missed job) stops here; the next leader picks it up.
+        if self._duties is not None:
+            self._duties.cancel()
+            await asyncio.gather(self._duties, return_exceptions=True)
+            self._duties = None
+        try:
+            await self.on_demoted()
+        except Exception as e:
+            print("Stopping leader duties failed:", e)
+
+
+# ------------------------------------------------------------
+#  LAUNCHER
+# ------------------------------------------------------------
+
+def recommended_shard_count(token):
+    request = urllib.request.Request(
+        "https://discord.com/api/v10/gateway/bot",
+        headers={"Authorization": f"Bot {token}", "User-Agent": "HydraCompanion (cluster launcher)"}
+    )
+    with urllib.request.urlopen(request, timeout=10) as response:
+        return json.load(response)["shards"]
+
+
+def shard_ranges(shard_count, cluster_count):
+    # Contiguous, as even as possible: 10 shards over 3 clusters is 4/3/3.
+    cluster_count = max(1, min(cluster_count, shard_count))
+    size, extra = divmod(shard_count, cluster_count)
+    ranges = []
+    start = 0
+    for cluster_id in range(cluster_count):
+        end = start + size + (1 if cluster_id < extra else 0)
+        ranges.append(list(range(start, end)))
+        start = end
+    return ranges
+
+
+def spawn_worker(cluster_id, shard_ids, shard_count):
+    env = dict(os.environ)
+    env["CLUSTER_ID"] = str(cluster_id)
+    env["SHARD_COUNT"] = str(shard_count)
+    env["SHARD_IDS"] = ",".join(map(str, shard_ids))
+    env.setdefault("MERCY_CACHE_SIZE", WORKER_MERCY_CACHE_SIZE)
+    # The worker runs in this directory, so relative paths such as the
+    # SQLite file resolve the same; only the package needs finding.
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, (root, env.get("PYTHONPATH"))))
+    print(f"Starting cluster {cluster_id} with shards {shard_ids[0]}-{shard_ids[-1]}")
+    return subprocess.Popen([sys.executable, "-m", "hydra"], env=env)
+
+
+def main():
+    shard_count = os.getenv("SHARD_COUNT")
+    shard_count = int(shard_count) if shard_count else recommended_shard_count(os.environ["TOKEN"])
+    cluster_count = int(os.getenv("CLUSTER_COUNT", os.cpu_count() or 1))
+    ranges = shard_ranges(shard_count, cluster_count)
+
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    workers = {cluster_id: spawn_worker(cluster_id, shard_ids, shard_count)
+               for cluster_id, shard_ids in enumerate(ranges)}
+    restart_at = {}
+
+    while not stopping:
+        time.sleep(1)
+        for cluster_id, process in list(workers.items()):
+            if process is None or process.poll() is None:
+                continue
+            if process.returncode == 0:
+                print(f"Cluster {cluster_id} exited")
+                workers[cluster_id] = None
+                continue
+            print(f"Cluster {cluster_id} exited with code {process.returncode}; "
+                  f"restarting in {WORKER_RESTART_DELAY}s")
+            workers[cluster_id] = None
+            restart_at[cluster_id] = time.monotonic() + WORKER_RESTART_DELAY
+
+        for cluster_id, when in list(restart_at.items()):
+            if time.monotonic() >= when:
+                del restart_at[cluster_id]
+                workers[cluster_id] = spawn_worker(cluster_id, ranges[cluster_id], shard_count)
+
+        if not restart_at and all(process is None for process in workers.values()):
+            break
+
+    # SIGTERM; each worker closes the bot on it (app.serve), flushing
+    # its queued writes and releasing the scheduler lease.
+    for process in workers.values():
+        if process is not None and process.poll() is None:
+            process.terminate()
+    for process in workers.values():
+        if process is not None:
+            process.wait()
+
+
+if __name__ == "__main__":
+    main()
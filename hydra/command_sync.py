@@ -0,0 +1,94 @@
+# ============================================================
+#  HYDRA COMPANION — SLASH COMMAND SYNC
+# ============================================================
+#
+#  A global tree sync is slow and heavily rate limited, so it only runs
+#  when the command definitions have changed. The tree is serialised to
+#  the same JSON Discord receives and hashed; the hash of the last
+#  successful sync is kept in COMMAND_HASH_PATH, per application and
+#  scope, and an unchanged hash skips the sync.
+#
+#  Setting DEV_GUILD_ID syncs the tree to that one server instead, which
+#  Discord applies at once, for testing changes before they go global.
+#
+#  Every slash group is created through CommandGroup, and once the
+#  extensions are loaded check_command_groups() refuses any group that
+#  is not the one registered under its name. discord.py already rejects
+#  duplicate commands inside one tree or group; a group redefined before
+#  being added used to replace the first one silently, taking its
+#  commands with it.
+
+import hashlib
+import json
+import os
+
+from discord import app_commands
+
+COMMAND_HASH_PATH = "command_tree.json"
+
+# Groups created since the last check_command_groups(). Extensions are
+# executed afresh for every bot that loads them, so names alone cannot
+# tell a duplicate from a second bot in the same process.
+_new_groups = []
+
+
+class DuplicateCommandError(Exception):
+    pass
+
+
+class CommandGroup(app_commands.Group):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        _new_groups.append(self)
+
+
+def check_command_groups(tree):
+    groups = list(_new_groups)
+    _new_groups.clear()
+    for group in groups:
+        if tree.get_command(group.name) is not group:
+            raise DuplicateCommandError(
+                f"Slash command group /{group.name} is defined twice, or never added to the tree"
+            )
+
+
+def tree_hash(tree, guild=None):
+    payload = sorted(
+        (command.to_dict(tree) for command in tree.get_commands(guild=guild)),
+        key=lambda command: (command.get("type", 1), command["name"])
+    )
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def _load_hashes(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_hashes(path, hashes):
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(hashes, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+async def sync_commands(tree, application_id, dev_guild=None, path=COMMAND_HASH_PATH):
+    # Returns True if a sync was sent, False if the tree was unchanged.
+    if dev_guild is not None:
+        tree.copy_global_to(guild=dev_guild)
+        scope = f"{application_id}:guild:{dev_guild.id}"
+    else:
+        scope = f"{application_id}:global"
+
+    digest = tree_hash(tree, guild=dev_guild)
+    hashes = _load_hashes(path)
+    if hashes.get(scope) == digest:
+        return False
+
+    await tree.sync(guild=dev_guild)
+    hashes[scope] = digest
+    _save_hashes(path, hashes)
+    return True
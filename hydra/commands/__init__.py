@@ -0,0 +1,9 @@
+# ============================================================
+#  HYDRA COMPANION — COMMAND EXTENSIONS
+# ============================================================
+#
+#  One discord.py extension per feature. Each module defines its prefix
+#  commands, slash groups and listeners and adds them in setup(bot);
+#  HydraBot.register_commands() loads the modules in app.EXTENSIONS.
+#  Handlers reach shared state through the bot (ctx.bot,
+#  interaction.client): bot.db, bot.clash_scheduler, bot.reminders.
@@ -0,0 +1,486 @@
+# ============================================================
+#  ADMIN COMMANDS
+# ============================================================
+
+import random
+import time
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from ..clash_schedule import (
+    CLASH_EVENTS, WEEKDAYS, format_clash_schedule, next_fire_at, parse_local_time, timezone_names
+)
+from ..cluster import LEASE_RENEW, SHARD_STALE_AFTER
+from ..command_sync import CommandGroup
+from ..config import ALLOWED_SUGGEST_BUTTON_CHANNELS, ANNOUNCE_CHANNEL_ID
+from ..guides import build_commands_guide_embed, build_mercy_guide_embed
+from ..suggestions import MessageMeButton, build_suggestion_button_embed
+from ..tasks import publish_shard_stats
+
+# ------------------------------------------------------------
+#  PREFIX COMMANDS
+# ------------------------------------------------------------
+
+@commands.command(name="purge")
+@commands.has_permissions(administrator=True)
+async def purge_cmd(ctx, amount: int):
+    await ctx.message.delete()
+    if amount <= 0:
+        warn = await ctx.send("Please enter a number greater than 0.")
+        return await warn.delete(delay=5)
+    deleted = await ctx.channel.purge(limit=amount)
+    confirm = await ctx.send(f"Deleted {len(deleted)} messages.")
+    await confirm.delete(delay=5)
+
+@purge_cmd.error
+async def purge_error(ctx, error):
+    if isinstance(error, commands.MissingPermissions):
+        responses = [
+            "Nuh uh, I do not think so, peasant XD",
+            "https://media.giphy.com/media/Ju7l5y9osyymQ/giphy.gif"
+        ]
+        await ctx.send(random.choice(responses))
+
+@commands.command(name="announce")
+@commands.has_permissions(administrator=True)
+async def announce_cmd(ctx, *, message: str):
+    await ctx.message.delete()
+    channel = ctx.bot.get_channel(ANNOUNCE_CHANNEL_ID)
+    embed = discord.Embed(
+        title="📢 Announcement",
+        description=message,
+        color=discord.Color.blue()
+    )
+    embed.set_footer(
+        text=f"Posted by {ctx.author}",
+        icon_url=ctx.author.avatar.url if ctx.author.avatar else None
+    )
+    embed.timestamp = discord.utils.utcnow()
+    await channel.send(embed=embed)
+
+@announce_cmd.error
+async def announce_error(ctx, error):
+    if isinstance(error, commands.MissingPermissions):
+        responses = [
+            "Nuh uh, I do not think so, peasant XD",
+            "https://media.giphy.com/media/Ju7l5y9osyymQ/giphy.gif"
+        ]
+        await ctx.send(random.choice(responses))
+
+@commands.command(name="suggestbutton")
+@commands.has_permissions(administrator=True)
+async def suggest_button_cmd(ctx):
+    if ctx.channel.id not in ALLOWED_SUGGEST_BUTTON_CHANNELS:
+        return await ctx.send("This command can only be used in approved channels.")
+    await ctx.send(embed=build_suggestion_button_embed(), view=MessageMeButton())
+
+@commands.command(name="commands")
+async def commands_prefix(ctx):
+    channels = ctx.bot.db.get_guild_channels(ctx.guild.id)
+    commands_channel_id = channels["commands_channel_id"]
+    channel = ctx.guild.get_channel(commands_channel_id) if commands_channel_id else ctx.channel
+    await channel.send(embed=build_commands_guide_embed())
+
+@commands.command(name="mercyguide")
+@commands.has_permissions(administrator=True)
+async def mercy_guide_prefix(ctx):
+    await ctx.send(embed=build_mercy_guide_embed())
+
+@commands.command(name="reloadrates")
+@commands.is_owner()
+async def reload_rates_cmd(ctx):
+    # Rates are game data shared by every server, so only the bot owner
+    # may swap them. A bad file keeps the current tables. Other cluster
+    # workers follow the shared version on their next heartbeat.
+    try:
+        compiled = ctx.bot.load_rates()
+    except (OSError, ValueError) as e:
+        return await ctx.send(f"Shard rates not reloaded: {e}")
+    reloaded = f"Shard rates reloaded for {', '.join(compiled)}"
+    try:
+        ctx.bot.rates_version = await ctx.bot.db.bump_reload_version("shard_rates")
+    except Exception as e:
+        return await ctx.send(f"{reloaded} on this worker only: {e}")
+    if ctx.bot.shard_ids is not None:
+        reloaded += f"; the other workers follow within {LEASE_RENEW}s"
+    await ctx.send(f"{reloaded}.")
+
+# ------------------------------------------------------------
+#  SLASH COMMANDS
+# ------------------------------------------------------------
+
+admin_group = CommandGroup(
+    name="admin",
+    description="Administrative tools for server management.",
+    default_permissions=discord.Permissions(administrator=True)
+)
+
+@admin_group.command(
+    name="announce",
+    description="Post an announcement to the configured announcement channel."
+)
+@app_commands.describe(message="The announcement text.")
+async def admin_announce_slash(interaction, message: str):
+    if not interaction.user.guild_permissions.administrator:
+        return await interaction.response.send_message(
+            "You do not have permission.",
+            ephemeral=True
+        )
+
+    channel = interaction.client.get_channel(ANNOUNCE_CHANNEL_ID)
+
+    embed = discord.Embed(
+        title="📢 Announcement",
+        description=message,
+        color=discord.Color.blue()
+    )
+    embed.set_footer(
+        text=f"Posted by {interaction.user}",
+        icon_url=interaction.user.avatar.url if interaction.user.avatar else None
+    )
+    embed.timestamp = discord.utils.utcnow()
+
+    await channel.send(embed=embed)
+    await interaction.response.send_message("Announcement sent.", ephemeral=True)
+
+
+@admin_group.command(
+    name="purge",
+    description="Delete a number of messages from the current channel."
+)
+@app_commands.describe(amount="Number of messages to delete.")
+async def admin_purge_slash(interaction, amount: int):
+    if not interaction.user.guild_permissions.administrator:
+        return await interaction.response.send_message(
+            "You do not have permission.",
+            ephemeral=True
+        )
+
+    if amount <= 0:
+        return await interaction.response.send_message(
+            "Enter a number greater than 0.",
+            ephemeral=True
+        )
+
+    deleted = await interaction.channel.purge(limit=amount)
+    await interaction.response.send_message(
+        f"Deleted {len(deleted)} messages.",
+        ephemeral=True
+    )
+
+
+@admin_group.command(
+    name="suggest-button",
+    description="Post the anonymous suggestion button in the current channel."
+)
+async def admin_suggest_button_slash(interaction):
+    if not interaction.user.guild_permissions.administrator:
+        return await interaction.response.send_message(
+            "You do not have permission.",
+            ephemeral=True
+        )
+
+    if interaction.channel.id not in ALLOWED_SUGGEST_BUTTON_CHANNELS:
+        return await interaction.response.send_message(
+            "This channel is not approved.",
+            ephemeral=True
+        )
+
+    await interaction.response.send_message(embed=build_suggestion_button_embed(), view=MessageMeButton())
+
+
+@admin_group.command(
+    name="setup",
+    description="Start the Hydra Companion setup wizard."
+)
+async def admin_setup_slash(interaction):
+    if not interaction.user.guild_permissions.administrator:
+        return await interaction.response.send_message(
+            "You do not have permission.",
+            ephemeral=True
+        )
+
+    # Imported here so the wizard's views are only built once someone
+    # actually runs it.
+    from ..setup_wizard import start_commands_step
+
+    state = {}
+    await start_commands_step(interaction, state)
+
+
+@admin_group.command(
+    name="commands-guide",
+    description="Post the full commands guide in the configured channel."
+)
+async def admin_commands_guide_slash(interaction):
+    if not interaction.user.guild_permissions.administrator:
+        return await interaction.response.send_message("No permission.", ephemeral=True)
+
+    channels = interaction.client.db.get_guild_channels(interaction.guild.id)
+    commands_channel_id = channels["commands_channel_id"]
+    channel = interaction.guild.get_channel(commands_channel_id) if commands_channel_id else interaction.channel
+
+    await channel.send(embed=build_commands_guide_embed())
+    await interaction.response.send_message("Commands guide posted.", ephemeral=True)
+
+
+@admin_group.command(
+    name="mercy-guide",
+    description="Post the mercy tracking guide in the current channel."
+)
+async def admin_mercy_guide_slash(interaction):
+    if not interaction.user.guild_permissions.administrator:
+        return await interaction.response.send_message("No permission.", ephemeral=True)
+
+    await interaction.channel.send(embed=build_mercy_guide_embed())
+    await interaction.response.send_message("Mercy guide posted.", ephemeral=True)
+
+
+@admin_group.command(
+    name="debug-commands",
+    description="List all registered slash commands for debugging."
+)
+async def admin_debug_commands_slash(interaction):
+    if not interaction.user.guild_permissions.administrator:
+        return await interaction.response.send_message("No permission.", ephemeral=True)
+
+    cmds = await interaction.client.tree.fetch_commands()
+
+    if not cmds:
+        return await interaction.response.send_message("No slash commands registered.", ephemeral=True)
+
+    lines = [f"/{cmd.name} — ID: `{cmd.id}`" for cmd in cmds]
+
+    await interaction.response.send_message(
+        "**Registered Slash Commands:**\n" + "\n".join(lines),
+        ephemeral=True
+    )
+
+
+async def timezone_autocomplete(interaction, current):
+    current = current.lower()
+    return [
+        app_commands.Choice(name=name, value=name)
+        for name in timezone_names() if current in name.lower()
+    ][:25]
+
+
+@admin_group.command(
+    name="clash-schedule",
+    description="Set when a clash starts for this server and how early to warn."
+)
+@app_commands.describe(
+    event="Which clash to schedule.",
+    weekday="Day the clash starts.",
+    start_time="Clash start time in 24h HH:MM, e.g. 11:00.",
+    timezone="Timezone the day and time are in, e.g. Europe/London.",
+    lead_hours="How many hours before the clash to post the warning."
+)
+@app_commands.choices(
+    event=[app_commands.Choice(name=event.capitalize(), value=event) for event in CLASH_EVENTS],
+    weekday=[app_commands.Choice(name=name, value=i) for i, name in enumerate(WEEKDAYS)]
+)
+@app_commands.autocomplete(timezone=timezone_autocomplete)
+async def admin_clash_schedule_slash(
+    interaction,
+    event: app_commands.Choice[str],
+    weekday: app_commands.Choice[int],
+    start_time: str,
+    timezone: str,
+    lead_hours: app_commands.Range[int, 1, 168]
+):
+    if not interaction.user.guild_permissions.administrator:
+        return await interaction.response.send_message("No permission.", ephemeral=True)
+
+    try:
+        hour, minute = parse_local_time(start_time)
+    except ValueError:
+        return await interaction.response.send_message("Use HH:MM for the start time, e.g. 11:00.", ephemeral=True)
+
+    if timezone not in timezone_names():
+        return await interaction.response.send_message(f"Unknown timezone: {timezone}", ephemeral=True)
+
+    start_time = f"{hour:02d}:{minute:02d}"
+    lead_minutes = lead_hours * 60
+    row = (
+        str(interaction.guild.id), event.value, weekday.value, start_time, timezone, lead_minutes,
+        next_fire_at(weekday.value, start_time, timezone, lead_minutes, int(time.time()))
+    )
+    await interaction.client.db.set_clash_schedules([row])
+    interaction.client.clash_scheduler.wake()
+
+    await interaction.response.send_message(format_clash_schedule(row), ephemeral=True)
+
+
+@admin_group.command(
+    name="reload-config",
+    description="Reload every server's channel configuration from the database."
+)
+async def admin_reload_config_slash(interaction):
+    # Reloads every server's configuration, not just the caller's.
+    if not await interaction.client.is_owner(interaction.user):
+        return await interaction.response.send_message("Only the bot owner can use this.", ephemeral=True)
+
+    count = await interaction.client.db.reload_guild_channels()
+    await interaction.response.send_message(
+        f"Reloaded channel configuration for {count} servers.",
+        ephemeral=True
+    )
+
+
+@admin_group.command(
+    name="storage-stats",
+    description="Show database commit rate, flush latency, cache stats and reminder delivery."
+)
+async def admin_storage_stats_slash(interaction):
+    # Bot-wide storage and cache internals, for the bot owner.
+    if not await interaction.client.is_owner(interaction.user):
+        return await interaction.response.send_message("Only the bot owner can use this.", ephemeral=True)
+
+    stats = interaction.client.db.write_stats()
+    cache = interaction.client.db.cache_stats()
+
+    embed = discord.Embed(
+        title="Storage Stats",
+        color=discord.Color.dark_teal()
+    )
+    embed.add_field(
+        name="Commits",
+        value=(
+            f"Backend: {stats['backend']}\n"
+            f"Total: {stats['commits']}\nLast 60s: {stats['commits_per_second']:.2f}/s"
+        ),
+        inline=False
+    )
+    embed.add_field(
+        name="Write-behind",
+        value=(
+            f"Flushes: {stats['flushes']} ({stats['rows_flushed']} rows)\n"
+            f"Pending rows: {stats['pending_rows']}\n"
+            f"Flush latency: last {stats['last_flush_ms']:.2f} ms, "
+            f"avg {stats['avg_flush_ms']:.2f} ms, max {stats['max_flush_ms']:.2f} ms\n"
+            f"Zero rows compacted: {stats['rows_compacted']}"
+        ),
+        inline=False
+    )
+    embed.add_field(
+        name="Mercy cache",
+        value=(
+            f"Users: {cache['size']}/{cache['capacity']}\n"
+            f"Hit ratio: {cache['hit_ratio']:.1%} ({cache['hits']} hits, {cache['misses']} misses)\n"
+            f"Evictions: {cache['evictions']}"
+        ),
+        inline=False
+    )
+    members = interaction.client.members.stats()
+    embed.add_field(
+        name="Member cache",
+        value=(
+            f"Members: {members['size']}/{members['capacity']}\n"
+            f"Hit ratio: {members['hit_ratio']:.1%} ({members['hits']} hits, {members['misses']} misses)\n"
+            f"Fetched: {members['fetched']} · Evictions: {members['evictions']}"
+        ),
+        inline=False
+    )
+    reminders = interaction.client.reminders.stats()
+    embed.add_field(
+        name="Reminders",
+        value=(
+            f"Pending: {reminders['pending']}\n"
+            f"Delivered: {reminders['delivered']} in {reminders['messages']} messages "
+            f"({reminders['coalescing_ratio']:.2f} per message)\n"
+            f"Delivery lag: p50 {reminders['lag_p50']:.1f} s, p95 {reminders['lag_p95']:.1f} s, "
+            f"max {reminders['lag_max']:.1f} s"
+        ),
+        inline=False
+    )
+
+    await interaction.response.send_message(embed=embed, ephemeral=True)
+
+
+@admin_group.command(
+    name="shards",
+    description="Show guild counts and gateway latency for every shard in the cluster."
+)
+async def admin_shards_slash(interaction):
+    # Cluster topology and the leader's host are the operator's business.
+    if not await interaction.client.is_owner(interaction.user):
+        return await interaction.response.send_message("Only the bot owner can use this.", ephemeral=True)
+
+    bot = interaction.client
+    await publish_shard_stats(bot)
+    rows = await bot.db.get_shard_stats()
+    lease = await bot.db.get_lease("scheduler")
+    now = int(time.time())
+
+    lines = []
+    for shard_id, cluster_id, guild_count, latency_ms, updated_at in rows:
+        if shard_id >= (bot.shard_count or 1):
+            continue  # left over from an older shard count
+        latency = f"{latency_ms} ms" if latency_ms is not None else "connecting"
+        state = "" if now - updated_at <= SHARD_STALE_AFTER else f" · ⚠️ last seen <t:{updated_at}:R>"
+        lines.append(f"**Shard {shard_id}** (cluster {cluster_id}): {guild_count} servers · {latency}{state}")
+
+    embed = discord.Embed(
+        title="Shards",
+        description="\n".join(lines) or "No shard stats published yet.",
+        color=discord.Color.dark_teal()
+    )
+    embed.add_field(
+        name="Scheduler leader",
+        value=f"`{lease[0]}`" + (" (this worker)" if bot.leader.is_leader else "") if lease else "none",
+        inline=False
+    )
+    embed.set_footer(text=f"{bot.shard_count or 1} shards · this is cluster {bot.cluster_id}")
+
+    await interaction.response.send_message(embed=embed, ephemeral=True)
+
+
+def format_latency(ms):
+    return f"{ms / 1000:.1f}s" if ms is not None else "n/a"
+
+
+@admin_group.command(
+    name="broadcast-stats",
+    description="Show delivery latency and failure rates for recent broadcasts."
+)
+async def admin_broadcast_stats_slash(interaction):
+    # Runs cover every server the bot is in, so this is for the bot owner.
+    if not await interaction.client.is_owner(interaction.user):
+        return await interaction.response.send_message("Only the bot owner can use this.", ephemeral=True)
+
+    runs = await interaction.client.db.get_broadcast_stats(limit=10)
+    if not runs:
+        return await interaction.response.send_message("No broadcasts recorded yet.", ephemeral=True)
+
+    embed = discord.Embed(
+        title="Recent Broadcasts",
+        color=discord.Color.dark_teal()
+    )
+    for run_id, name, started_at, finished_at, targets, sent, failed, pending, latencies in runs:
+        p50 = latencies[len(latencies) // 2] if latencies else None
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] if latencies else None
+        last = latencies[-1] if latencies else None
+        state = "finished" if finished_at else "in progress"
+        embed.add_field(
+            name=f"{name} ({state})",
+            value=(
+                f"<t:{started_at}:f> · `{run_id}`\n"
+                f"Sent {sent}/{targets} · failed {failed} ({failed / targets if targets else 0:.0%})"
+                f" · pending {pending}\n"
+                f"Latency p50 {format_latency(p50)} · p95 {format_latency(p95)} · last {format_latency(last)}"
+            ),
+            inline=False
+        )
+
+    await interaction.response.send_message(embed=embed, ephemeral=True)
+
+
+async def setup(bot):
+    for command in (
+        purge_cmd, announce_cmd, suggest_button_cmd, commands_prefix, mercy_guide_prefix, reload_rates_cmd
+    ):
+        bot.add_command(command)
+    bot.tree.add_command(admin_group)
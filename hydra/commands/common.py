@@ -0,0 +1,31 @@
+# Helpers shared by several command extensions.
+
+import discord
+from discord import app_commands
+
+from ..broadcast import chunk_lines
+from ..rates import shard_types
+
+EMBED_DESCRIPTION_LIMIT = 4096
+
+
+async def shard_autocomplete(interaction, current):
+    current = current.lower()
+    return [
+        app_commands.Choice(name=s.capitalize(), value=s)
+        for s in shard_types() if current in s
+    ]
+
+
+async def send_embed_pages(interaction, title, lines, color):
+    # Long lists go out as several embeds rather than one that Discord
+    # would reject; the first answers the interaction (unless it was
+    # deferred), the rest follow up.
+    pages = chunk_lines("", lines, EMBED_DESCRIPTION_LIMIT)
+    for number, page in enumerate(pages, start=1):
+        page_title = title if len(pages) == 1 else f"{title} ({number}/{len(pages)})"
+        embed = discord.Embed(title=page_title, description=page, color=color)
+        if number == 1 and not interaction.response.is_done():
+            await interaction.response.send_message(embed=embed)
+        else:
+            await interaction.followup.send(embed=embed)
@@ -0,0 +1,171 @@
+# ============================================================
+#  GACHA COMMANDS
+# ============================================================
+
+import asyncio
+import random
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from ..command_sync import CommandGroup
+from ..rates import shard_rates, shard_types
+from ..simulator import RARITIES, roll_pulls, simulate_until_hit, summarize
+from .common import shard_autocomplete
+
+PULL_YES = [
+    "Yes — send it.",
+    "Absolutely. This shard is calling your name.",
+    "Yep. You will regret skipping more than pulling."
+]
+PULL_NO = [
+    "No — save your resources.",
+    "Skip. This shard is not worth it.",
+    "Not this one. Your future self will thank you."
+]
+
+RARITY_LABELS = ("💙 Rare", "💜 Epic", "🌟 Legendary", "🔥 Mythical")
+
+SIM_PULLS = 10
+
+
+def build_pull_advice_embed(user, event=None):
+    decision = random.choice(["yes", "no"])
+    answer = random.choice(PULL_YES if decision == "yes" else PULL_NO)
+    colour = discord.Color.green() if decision == "yes" else discord.Color.red()
+
+    embed = discord.Embed(title="🎲 Should you pull?", description=answer, color=colour)
+    embed.add_field(name="Requested by", value=user.mention, inline=False)
+    if event:
+        embed.add_field(name="Event", value=event, inline=False)
+    embed.set_footer(text="Decision generated by Hydra Companion RNG")
+    return embed
+
+
+def build_simulation_embed(shard_type, user, counters, results, hits):
+    # results: rarities of the simulated pulls; hits: simulate_until_hit()
+    # for the same starting counters.
+    labels = [RARITY_LABELS[rarity] for rarity in results]
+
+    summary = {}
+    for label in labels:
+        summary[label] = summary.get(label, 0) + 1
+
+    embed = discord.Embed(
+        title=f"🎰 {shard_type.capitalize()} Shard — {len(results)} Pulls",
+        color=discord.Color.gold()
+    )
+    embed.add_field(name="Results", value="\n".join(labels), inline=False)
+    embed.add_field(
+        name="Summary",
+        value="\n".join([f"{label}: **{count}**" for label, count in summary.items()]),
+        inline=False
+    )
+
+    epic, legendary, mythical = counters
+    rates = shard_rates(shard_type)
+    mercy = [f"Legendary {legendary}"]
+    if rates.tracks_epic:
+        mercy.insert(0, f"Epic {epic}")
+    if rates.has_mythical:
+        mercy.append(f"Mythical {mythical}")
+    lines = [f"Starting mercy: {', '.join(mercy)}"]
+    for target, pulls in hits.items():
+        stats = summarize(pulls)
+        lines.append(
+            f"{RARITY_LABELS[RARITIES.index(target)]}: {stats['mean']:.1f} on average, "
+            f"half within **{stats['p50']}**, 90% within **{stats['p90']}**"
+        )
+    embed.add_field(name="Pulls until your next…", value="\n".join(lines), inline=False)
+
+    embed.add_field(name="Requested by", value=user.mention, inline=False)
+    runs = len(next(iter(hits.values())))
+    embed.set_footer(text=f"Hydra Companion Simulator · {runs:,} simulated pull sequences")
+    return embed
+
+
+async def simulate_for_user(db, user, shard_type):
+    # Rolls from the user's own mercy counters. The batch simulation runs
+    # off the event loop: it takes tens of milliseconds.
+    counters = await db.get_mercy_row(user.id, shard_type)
+    results, _ = roll_pulls(shard_type, counters, SIM_PULLS)
+    hits = await asyncio.to_thread(simulate_until_hit, shard_type, counters)
+    return build_simulation_embed(shard_type, user, counters, results, hits)
+
+# ------------------------------------------------------------
+#  PREFIX COMMANDS
+# ------------------------------------------------------------
+
+@commands.command(name="pull")
+async def should_i_pull(ctx, *, event: str = None):
+    await ctx.message.delete(delay=15)
+    await ctx.send(embed=build_pull_advice_embed(ctx.author, event))
+
+@commands.command(name="sim")
+@commands.cooldown(1, 30, commands.BucketType.user)
+async def gacha_sim(ctx, shard_type: str = None):
+    await ctx.message.delete(delay=30)
+
+    if shard_type is None:
+        msg = await ctx.send(f"Specify shard: {', '.join(shard_types())}.")
+        return await msg.delete(delay=10)
+
+    shard_type = shard_type.lower()
+    if shard_type not in shard_types():
+        msg = await ctx.send("Invalid shard type.")
+        return await msg.delete(delay=10)
+
+    await ctx.send(embed=await simulate_for_user(ctx.bot.db, ctx.author, shard_type))
+
+# ------------------------------------------------------------
+#  SLASH COMMANDS
+# ------------------------------------------------------------
+
+gacha_group = CommandGroup(
+    name="gacha",
+    description="Simulate shard pulls and get pull advice."
+)
+
+@gacha_group.command(
+    name="simulate",
+    description="Simulate 10 pulls from your current mercy and see when your next legendary lands."
+)
+@app_commands.describe(shard_type="Shard type to simulate.")
+@app_commands.autocomplete(shard_type=shard_autocomplete)
+@app_commands.checks.cooldown(1, 30)
+async def gacha_simulate_slash(interaction, shard_type: str):
+    shard_type = shard_type.lower()
+    if shard_type not in shard_types():
+        return await interaction.response.send_message(
+            "Invalid shard type.",
+            ephemeral=True
+        )
+
+    # The simulation can outlast Discord's 3 second reply deadline,
+    # especially without NumPy.
+    await interaction.response.defer()
+    embed = await simulate_for_user(interaction.client.db, interaction.user, shard_type)
+    await interaction.followup.send(embed=embed)
+
+@gacha_simulate_slash.error
+async def gacha_simulate_error(interaction, error):
+    if isinstance(error, app_commands.CommandOnCooldown):
+        await interaction.response.send_message(
+            f"You can simulate again in {error.retry_after:.0f}s.",
+            ephemeral=True
+        )
+
+@gacha_group.command(
+    name="pull-advice",
+    description="Get advice on whether you should pull right now."
+)
+@app_commands.describe(event="Optional event or banner name.")
+async def gacha_pull_advice_slash(interaction, event: str | None = None):
+    await interaction.response.send_message(embed=build_pull_advice_embed(interaction.user, event))
+
+
+async def setup(bot):
+    bot.add_command(should_i_pull)
+    bot.add_command(gacha_sim)
+    bot.tree.add_command(gacha_group)
@@ -0,0 +1,91 @@
+# ============================================================
+#  GENERAL COMMANDS
+# ============================================================
+
+from discord import app_commands
+from discord.ext import commands
+
+
+async def on_guild_join(guild):
+    for ch in guild.text_channels:
+        if ch.permissions_for(guild.me).send_messages:
+            await ch.send(
+                "Hello! I am **Hydra Companion**.\n"
+                "Support server: https://discord.gg/DuemMm57jr"
+            )
+            break
+
+# ------------------------------------------------------------
+#  PREFIX COMMANDS
+# ------------------------------------------------------------
+
+@commands.command()
+async def test(ctx):
+    await ctx.message.delete()
+    await ctx.send("Hydra warning test successful.")
+
+@commands.command()
+async def chests(ctx):
+    msg = (
+        "**Hydra Chest Requirements**\n"
+        "Normal – Over 6.66M\n"
+        "Hard – Over 20.4M\n"
+        "Brutal – Over 29.4M\n"
+        "Nightmare – Over 36.6M"
+    )
+    await ctx.send(msg)
+    await ctx.message.delete()
+
+@commands.command(name="support")
+async def support_prefix(ctx):
+    await ctx.send(
+        "**Support Server**\n"
+        "If you need help with Hydra Companion, join here:\n"
+        "https://discord.gg/DuemMm57jr"
+    )
+
+@commands.command(name="developer")
+async def developer_prefix(ctx):
+    await ctx.send(
+        "**Hydra Companion Developer Resources**\n\n"
+        "**GitHub Profile:** https://github.com/sketeraid\n"
+        "**Desktop App (Beta):** https://github.com/sketeraid/HydraCompanionApp\n"
+        "**Discord Bot:** https://github.com/sketeraid/HydraCompanion-Discord-Bot\n"
+        "**Android App (Beta):** https://github.com/sketeraid/HydraCompanionAndroidAPK"
+    )
+
+# ------------------------------------------------------------
+#  SUPPORT & DEVELOPER SLASH COMMANDS
+# ------------------------------------------------------------
+
+@app_commands.command(
+    name="support",
+    description="Show the Hydra Companion support server link."
+)
+async def support_slash(interaction):
+    await interaction.response.send_message(
+        "**Support Server**\n"
+        "https://discord.gg/DuemMm57jr"
+    )
+
+
+@app_commands.command(
+    name="developer",
+    description="Show Hydra Companion developer resources and GitHub links."
+)
+async def developer_slash(interaction):
+    await interaction.response.send_message(
+        "**Hydra Companion Developer Resources**\n\n"
+        "**GitHub Profile:** https://github.com/sketeraid\n"
+        "**Desktop App:** https://github.com/sketeraid/HydraCompanionApp\n"
+        "**Discord Bot:** https://github.com/sketeraid/HydraCompanion-Discord-Bot\n"
+        "**Android App:** https://github.com/sketeraid/HydraCompanionAndroidAPK"
+    )
+
+
+async def setup(bot):
+    bot.add_listener(on_guild_join)
+    for command in (test, chests, support_prefix, developer_prefix):
+        bot.add_command(command)
+    bot.tree.add_command(support_slash)
+    bot.tree.add_command(developer_slash)
@@ -0,0 +1,173 @@
+# ============================================================
+#  KEY COMMANDS
+# ============================================================
+
+import discord
+from discord import app_commands
+
+from ..command_sync import CommandGroup
+from ..config import CHIMERA_MAX_KEYS, HYDRA_MAX_KEYS, MAX_KEYS
+from ..key_epochs import current_key_epochs
+from .common import send_embed_pages
+
+keys_group = CommandGroup(
+    name="keys",
+    description="Track Hydra and Chimera key usage."
+)
+
+@keys_group.command(
+    name="add",
+    description="Record a used Hydra or Chimera key."
+)
+@app_commands.describe(boss="Which boss the key was used on.")
+@app_commands.choices(
+    boss=[
+        app_commands.Choice(name="Hydra", value="hydra"),
+        app_commands.Choice(name="Chimera", value="chimera")
+    ]
+)
+async def keys_add_slash(interaction, boss: app_commands.Choice[str]):
+    if interaction.guild is None:
+        return await interaction.response.send_message(
+            "Keys are tracked per server. Use this command in a server.",
+            ephemeral=True
+        )
+
+    db = interaction.client.db
+    user = interaction.user
+    guild_id = interaction.guild.id
+    epochs = current_key_epochs()
+    hydra_used, chimera_used = await db.get_key_row(guild_id, user.id, epochs)
+
+    if boss.value == "hydra":
+        if hydra_used >= HYDRA_MAX_KEYS:
+            return await interaction.response.send_message(
+                f"{user.mention} has no Hydra keys remaining.",
+            )
+        hydra_used += 1
+        remaining = HYDRA_MAX_KEYS - hydra_used
+        await db.set_key_used(guild_id, user.id, user.display_name, "hydra", epochs["hydra"], hydra_used)
+        return await interaction.response.send_message(
+            f"Hydra key consumed! Only {remaining}/{HYDRA_MAX_KEYS} keys remain, warrior.",
+        )
+
+    if boss.value == "chimera":
+        if chimera_used >= CHIMERA_MAX_KEYS:
+            return await interaction.response.send_message(
+                f"{user.mention} has no Chimera keys remaining.",
+            )
+        chimera_used += 1
+        remaining = CHIMERA_MAX_KEYS - chimera_used
+        await db.set_key_used(guild_id, user.id, user.display_name, "chimera", epochs["chimera"], chimera_used)
+        return await interaction.response.send_message(
+            f"Chimera key consumed! Only {remaining}/{CHIMERA_MAX_KEYS} keys remain, warrior.",
+        )
+
+
+@keys_group.command(
+    name="report",
+    description="Admin: View Hydra and Chimera key usage for this server."
+)
+async def keys_report_slash(interaction):
+    if not interaction.user.guild_permissions.administrator:
+        return await interaction.response.send_message(
+            "You do not have permission.",
+            ephemeral=True
+        )
+
+    rows = await interaction.client.db.get_key_usage(interaction.guild.id, current_key_epochs())
+
+    if not rows:
+        return await interaction.response.send_message(
+            "No key usage recorded yet.",
+        )
+
+    # Current display names, fetching members that are not cached; the
+    # name stored with the keys covers anyone who has left.
+    await interaction.response.defer()
+    members = await interaction.client.members.fetch_many(
+        interaction.guild, [int(user_id) for user_id, _, _, _ in rows]
+    )
+
+    def status_emoji(used, max_keys):
+        if used >= max_keys:
+            return "🟢"
+        if used == 0:
+            return "🔴"
+        return "🟡"
+
+    lines = []
+    for user_id, username, hydra_used, chimera_used in rows:
+        member = members.get(int(user_id))
+        username = member.display_name if member else username
+        hydra_status = status_emoji(hydra_used, HYDRA_MAX_KEYS)
+        chimera_status = status_emoji(chimera_used, CHIMERA_MAX_KEYS)
+        lines.append(
+            f"**{username}** | Hydra: {hydra_status} ({hydra_used}/{HYDRA_MAX_KEYS}) "
+            f"| Chimera: {chimera_status} ({chimera_used}/{CHIMERA_MAX_KEYS})"
+        )
+
+    await send_embed_pages(interaction, "Key Usage Overview", lines, discord.Color.dark_teal())
+
+
+@keys_group.command(
+    name="history",
+    description="Admin: View this server's key usage for a past week."
+)
+@app_commands.describe(
+    boss="Which boss's keys to show.",
+    weeks_ago="How many weeks back (1 is the week that just ended)."
+)
+@app_commands.choices(
+    boss=[
+        app_commands.Choice(name="Hydra", value="hydra"),
+        app_commands.Choice(name="Chimera", value="chimera")
+    ]
+)
+async def keys_history_slash(
+    interaction,
+    boss: app_commands.Choice[str],
+    weeks_ago: app_commands.Range[int, 1, 12] = 1
+):
+    if not interaction.user.guild_permissions.administrator:
+        return await interaction.response.send_message(
+            "You do not have permission.",
+            ephemeral=True
+        )
+
+    epoch = current_key_epochs()[boss.value] - weeks_ago
+    rows = await interaction.client.db.get_key_snapshot(interaction.guild.id, boss.value, epoch)
+
+    week = "last week" if weeks_ago == 1 else f"{weeks_ago} weeks ago"
+    if not rows:
+        return await interaction.response.send_message(
+            f"No {boss.name} key report was recorded for {week}.",
+            ephemeral=True
+        )
+
+    max_keys = MAX_KEYS[boss.value]
+    lines = [f"**{username}**: {used}/{max_keys} used" for username, used in rows]
+    await send_embed_pages(interaction, f"{boss.name} Key Usage ({week})", lines, discord.Color.dark_teal())
+
+
+@keys_group.command(
+    name="report-channel",
+    description="Admin: Choose where this server's weekly key reports are posted."
+)
+@app_commands.describe(channel="Channel for the weekly Hydra and Chimera key reports.")
+async def keys_report_channel_slash(interaction, channel: discord.TextChannel):
+    if not interaction.user.guild_permissions.administrator:
+        return await interaction.response.send_message(
+            "You do not have permission.",
+            ephemeral=True
+        )
+
+    await interaction.client.db.set_guild_channel(interaction.guild.id, "key_report_channel_id", channel.id)
+    await interaction.response.send_message(
+        f"Weekly key reports will be posted in {channel.mention}.",
+        ephemeral=True
+    )
+
+
+async def setup(bot):
+    bot.tree.add_command(keys_group)
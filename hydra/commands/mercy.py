@@ -0,0 +1,300 @@
+# ============================================================
+#  MERCY COMMANDS
+# ============================================================
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from ..command_sync import CommandGroup
+from ..forecast import DEFAULT_FORECAST_PULLS, build_mercy_forecast_embed
+from ..members import CachedMember
+from ..mercy import (
+    build_mercy_compare_embed, build_mercy_overview_embed, build_mercy_status_embed, build_mercy_table_embed
+)
+from ..rates import shard_rates, shard_types
+from .common import shard_autocomplete
+
+# ------------------------------------------------------------
+#  PREFIX COMMANDS
+# ------------------------------------------------------------
+
+@commands.command(name="mercy")
+async def mercy_cmd(ctx, shard_type: str):
+    shard_type = shard_type.lower()
+    if shard_type not in shard_types():
+        return await ctx.send("Invalid shard type.")
+
+    counters = await ctx.bot.db.get_mercy_row(ctx.author.id, shard_type)
+    await ctx.send(embed=build_mercy_status_embed(shard_type, counters))
+
+@commands.command(name="mercyall")
+async def mercy_all_cmd(ctx):
+    mercy = await ctx.bot.db.get_user_mercy(ctx.author.id)
+    await ctx.send(embed=build_mercy_overview_embed(ctx.author.display_name, mercy))
+
+@commands.command(name="mercytable")
+async def mercy_table_cmd(ctx):
+    mercy = await ctx.bot.db.get_user_mercy(ctx.author.id)
+    await ctx.send(embed=build_mercy_table_embed(ctx.author.display_name, mercy))
+
+@commands.command(name="mercycompare")
+async def mercy_compare_cmd(ctx, member: CachedMember):
+    mercy = await ctx.bot.db.get_users_mercy([ctx.author.id, member.id])
+    await ctx.send(embed=build_mercy_compare_embed(ctx.author, mercy[ctx.author.id], member, mercy[member.id]))
+
+@commands.command(name="clearmercy")
+async def clear_mercy_cmd(ctx, shard_type: str):
+    shard_type = shard_type.lower()
+    if shard_type not in shard_types():
+        return await ctx.send("Invalid shard type.")
+    await ctx.bot.db.set_mercy_row(ctx.author.id, shard_type, 0, 0, 0)
+    await ctx.send(f"{ctx.author.mention}, your {shard_type} mercy has been reset.")
+
+@commands.command(name="addepic")
+async def add_epic_cmd(ctx, shard_type: str):
+    shard_type = shard_type.lower()
+    if shard_type not in shard_types():
+        return await ctx.send("Invalid shard type.")
+    epic, legendary, mythical = await ctx.bot.db.get_mercy_row(ctx.author.id, shard_type)
+    epic = 0
+    legendary += 1
+    if shard_rates(shard_type).has_mythical:
+        mythical += 1
+    await ctx.bot.db.set_mercy_row(ctx.author.id, shard_type, epic, legendary, mythical)
+    await ctx.send(f"{ctx.author.mention}, **Epic** recorded for {shard_type}.")
+
+@commands.command(name="addlegendary")
+async def add_legendary_cmd(ctx, shard_type: str):
+    shard_type = shard_type.lower()
+    if shard_type not in shard_types():
+        return await ctx.send("Invalid shard type.")
+    epic, legendary, mythical = await ctx.bot.db.get_mercy_row(ctx.author.id, shard_type)
+    epic = 0
+    legendary = 0
+    if shard_rates(shard_type).has_mythical:
+        mythical += 1
+    await ctx.bot.db.set_mercy_row(ctx.author.id, shard_type, epic, legendary, mythical)
+    await ctx.send(f"{ctx.author.mention}, **Legendary** recorded for {shard_type}.")
+
+@commands.command(name="addmythical")
+async def add_mythical_cmd(ctx, shard_type: str):
+    shard_type = shard_type.lower()
+    if shard_type not in shard_types() or not shard_rates(shard_type).has_mythical:
+        return await ctx.send("That shard cannot pull mythical champions.")
+    epic, legendary, mythical = await ctx.bot.db.get_mercy_row(ctx.author.id, shard_type)
+    epic = 0
+    legendary = 0
+    mythical = 0
+    await ctx.bot.db.set_mercy_row(ctx.author.id, shard_type, epic, legendary, mythical)
+    await ctx.send(f"{ctx.author.mention}, **Mythical** recorded for {shard_type}.")
+
+@commands.command(name="addpull")
+async def add_pull_cmd(ctx, shard_type: str, amount: int):
+    shard_type = shard_type.lower()
+    if shard_type not in shard_types():
+        return await ctx.send("Invalid shard type.")
+    if amount <= 0:
+        return await ctx.send("Amount must be positive.")
+    epic, legendary, mythical = await ctx.bot.db.get_mercy_row(ctx.author.id, shard_type)
+    if shard_rates(shard_type).tracks_epic:
+        epic += amount
+    legendary += amount
+    if shard_rates(shard_type).has_mythical:
+        mythical += amount
+    await ctx.bot.db.set_mercy_row(ctx.author.id, shard_type, epic, legendary, mythical)
+    msg = f"{ctx.author.mention}, added **{amount}** pulls to your **{shard_type}** mercy.\n"
+    if shard_rates(shard_type).tracks_epic:
+        msg += f"Epic: **{epic}**, "
+    msg += f"Legendary: **{legendary}**"
+    if shard_rates(shard_type).has_mythical:
+        msg += f", Mythical: **{mythical}**"
+    await ctx.send(msg)
+
+# ------------------------------------------------------------
+#  SLASH COMMANDS
+# ------------------------------------------------------------
+
+mercy_group = CommandGroup(
+    name="mercy",
+    description="View and manage your shard mercy counters."
+)
+
+@mercy_group.command(
+    name="check",
+    description="Show your mercy status and pull chances for a specific shard."
+)
+@app_commands.describe(shard_type="Shard type to check.")
+@app_commands.autocomplete(shard_type=shard_autocomplete)
+async def mercy_check(interaction, shard_type: str):
+    shard_type = shard_type.lower()
+    if shard_type not in shard_types():
+        return await interaction.response.send_message("Invalid shard type.", ephemeral=True)
+
+    counters = await interaction.client.db.get_mercy_row(interaction.user.id, shard_type)
+    await interaction.response.send_message(embed=build_mercy_status_embed(shard_type, counters))
+
+@mercy_group.command(
+    name="forecast",
+    description="Exact odds of your next legendary or mythical from your current mercy."
+)
+@app_commands.describe(shard_type="Shard type to forecast.", pulls="How many pulls you plan to do.")
+@app_commands.autocomplete(shard_type=shard_autocomplete)
+async def mercy_forecast_slash(
+    interaction,
+    shard_type: str,
+    pulls: app_commands.Range[int, 1, 1000] = DEFAULT_FORECAST_PULLS
+):
+    shard_type = shard_type.lower()
+    if shard_type not in shard_types():
+        return await interaction.response.send_message("Invalid shard type.", ephemeral=True)
+
+    counters = await interaction.client.db.get_mercy_row(interaction.user.id, shard_type)
+    await interaction.response.send_message(embed=build_mercy_forecast_embed(shard_type, counters, pulls))
+
+@mercy_group.command(
+    name="table",
+    description="Display a detailed mercy table for all shard types."
+)
+async def mercy_table_slash(interaction):
+    mercy = await interaction.client.db.get_user_mercy(interaction.user.id)
+    await interaction.response.send_message(
+        embed=build_mercy_table_embed(interaction.user.display_name, mercy)
+    )
+
+@mercy_group.command(
+    name="all",
+    description="Show a full overview of all your mercy counters."
+)
+async def mercy_all_slash(interaction):
+    mercy = await interaction.client.db.get_user_mercy(interaction.user.id)
+    await interaction.response.send_message(
+        embed=build_mercy_overview_embed(interaction.user.display_name, mercy)
+    )
+
+@mercy_group.command(
+    name="compare",
+    description="Compare your mercy counters with another user."
+)
+@app_commands.describe(member="User to compare with.")
+async def mercy_compare_slash(interaction, member: discord.Member):
+    user = interaction.user
+    interaction.client.members.remember(member)
+    mercy = await interaction.client.db.get_users_mercy([user.id, member.id])
+    await interaction.response.send_message(
+        embed=build_mercy_compare_embed(user, mercy[user.id], member, mercy[member.id])
+    )
+
+@mercy_group.command(
+    name="add-pull",
+    description="Add raw pulls to your mercy counters."
+)
+@app_commands.describe(shard_type="Shard type to update.", amount="Number of pulls to add.")
+@app_commands.autocomplete(shard_type=shard_autocomplete)
+async def mercy_add_pull_slash(interaction, shard_type: str, amount: int):
+    shard_type = shard_type.lower()
+    if shard_type not in shard_types():
+        return await interaction.response.send_message("Invalid shard type.", ephemeral=True)
+    if amount <= 0:
+        return await interaction.response.send_message("Amount must be positive.", ephemeral=True)
+
+    db = interaction.client.db
+    epic, legendary, mythical = await db.get_mercy_row(interaction.user.id, shard_type)
+
+    if shard_rates(shard_type).tracks_epic:
+        epic += amount
+    legendary += amount
+    if shard_rates(shard_type).has_mythical:
+        mythical += amount
+
+    await db.set_mercy_row(interaction.user.id, shard_type, epic, legendary, mythical)
+
+    msg = f"Added **{amount}** pulls to **{shard_type}**.\n"
+    if shard_rates(shard_type).tracks_epic:
+        msg += f"Epic: {epic}, "
+    msg += f"Legendary: {legendary}"
+    if shard_rates(shard_type).has_mythical:
+        msg += f", Mythical: {mythical}"
+
+    await interaction.response.send_message(msg)
+
+@mercy_group.command(
+    name="add-epic",
+    description="Record an Epic pull and update mercy accordingly."
+)
+@app_commands.autocomplete(shard_type=shard_autocomplete)
+async def mercy_add_epic_slash(interaction, shard_type: str):
+    shard_type = shard_type.lower()
+    if shard_type not in shard_types():
+        return await interaction.response.send_message("Invalid shard type.", ephemeral=True)
+
+    db = interaction.client.db
+    epic, legendary, mythical = await db.get_mercy_row(interaction.user.id, shard_type)
+
+    epic = 0
+    legendary += 1
+    if shard_rates(shard_type).has_mythical:
+        mythical += 1
+
+    await db.set_mercy_row(interaction.user.id, shard_type, epic, legendary, mythical)
+
+    await interaction.response.send_message(f"Epic recorded for {shard_type}.")
+
+@mercy_group.command(
+    name="add-legendary",
+    description="Record a Legendary pull and reset mercy counters."
+)
+@app_commands.autocomplete(shard_type=shard_autocomplete)
+async def mercy_add_legendary_slash(interaction, shard_type: str):
+    shard_type = shard_type.lower()
+    if shard_type not in shard_types():
+        return await interaction.response.send_message("Invalid shard type.", ephemeral=True)
+
+    db = interaction.client.db
+    epic, legendary, mythical = await db.get_mercy_row(interaction.user.id, shard_type)
+
+    epic = 0
+    legendary = 0
+    if shard_rates(shard_type).has_mythical:
+        mythical += 1
+
+    await db.set_mercy_row(interaction.user.id, shard_type, epic, legendary, mythical)
+
+    await interaction.response.send_message(f"Legendary recorded for {shard_type}.")
+
+@mercy_group.command(
+    name="add-mythical",
+    description="Record a Mythical pull and reset mercy counters."
+)
+@app_commands.describe(shard_type="A shard type that can pull mythical.")
+async def mercy_add_mythical_slash(interaction, shard_type: str):
+    shard_type = shard_type.lower()
+    if shard_type not in shard_types() or not shard_rates(shard_type).has_mythical:
+        return await interaction.response.send_message("That shard cannot pull mythical.", ephemeral=True)
+
+    await interaction.client.db.set_mercy_row(interaction.user.id, shard_type, 0, 0, 0)
+
+    await interaction.response.send_message(f"Mythical recorded for {shard_type}.")
+
+@mercy_group.command(
+    name="clear",
+    description="Reset your mercy counters for a specific shard."
+)
+@app_commands.autocomplete(shard_type=shard_autocomplete)
+async def mercy_clear_slash(interaction, shard_type: str):
+    shard_type = shard_type.lower()
+    if shard_type not in shard_types():
+        return await interaction.response.send_message("Invalid shard type.", ephemeral=True)
+
+    await interaction.client.db.set_mercy_row(interaction.user.id, shard_type, 0, 0, 0)
+
+    await interaction.response.send_message(f"Your {shard_type} mercy has been reset.")
+
+
+async def setup(bot):
+    for command in (
+        mercy_cmd, mercy_all_cmd, mercy_table_cmd, mercy_compare_cmd, clear_mercy_cmd,
+        add_epic_cmd, add_legendary_cmd, add_mythical_cmd, add_pull_cmd
+    ):
+        bot.add_command(command)
+    bot.tree.add_command(mercy_group)
@@ -0,0 +1,128 @@
+# ============================================================
+#  REMINDER COMMANDS
+# ============================================================
+#
+#  Reminders are stored and delivered by bot.reminders (see
+#  hydra/reminders.py); these commands only add, list and cancel them.
+
+from discord import app_commands
+from discord.ext import commands
+
+from ..command_sync import CommandGroup
+from ..reminders import parse_reminder_time
+
+
+def format_reminder_list(rows):
+    msg = "**Your Active Reminders:**\n"
+    for reminder_id, text, due_at in rows:
+        msg += f"• #{reminder_id} – {text} (<t:{due_at}:R>)\n"
+    return msg
+
+# ------------------------------------------------------------
+#  PREFIX COMMANDS
+# ------------------------------------------------------------
+
+@commands.command()
+async def remindme(ctx, time: str, *, reminder: str = None):
+    await ctx.message.delete()
+
+    if reminder is None:
+        await ctx.send("Usage: `$remindme 10m take the bins out`")
+        return
+
+    try:
+        seconds = parse_reminder_time(time)
+    except ValueError as e:
+        await ctx.send(str(e))
+        return
+
+    reminder_id, due_at = await ctx.bot.reminders.add(
+        ctx.author.id, ctx.guild.id if ctx.guild else None, ctx.channel.id, reminder, seconds
+    )
+    await ctx.send(f"⏰ Reminder **#{reminder_id}** set for **{time}** (<t:{due_at}:f>).")
+
+@commands.command(name="reminders")
+async def list_reminders(ctx):
+    await ctx.message.delete()
+    rows = await ctx.bot.reminders.list(ctx.author.id)
+
+    if not rows:
+        await ctx.send("You have no active reminders.")
+        return
+
+    await ctx.send(format_reminder_list(rows))
+
+@commands.command()
+async def cancelreminder(ctx, reminder_id: int):
+    await ctx.message.delete()
+
+    if await ctx.bot.reminders.cancel(ctx.author.id, reminder_id):
+        await ctx.send(f"❎ Reminder #{reminder_id} cancelled.")
+    else:
+        await ctx.send(f"No reminder found with ID #{reminder_id}.")
+
+# ------------------------------------------------------------
+#  SLASH COMMANDS
+# ------------------------------------------------------------
+
+reminder_group = CommandGroup(
+    name="reminder",
+    description="Set and manage personal reminders."
+)
+
+@reminder_group.command(
+    name="set",
+    description="Create a reminder for a future time."
+)
+@app_commands.describe(time="Format: 10m, 2h, 1d", reminder="Reminder text.")
+async def reminder_set(interaction, time: str, reminder: str):
+    try:
+        seconds = parse_reminder_time(time)
+    except ValueError as e:
+        return await interaction.response.send_message(str(e), ephemeral=True)
+
+    reminder_id, due_at = await interaction.client.reminders.add(
+        interaction.user.id, interaction.guild_id, interaction.channel_id, reminder, seconds
+    )
+    await interaction.response.send_message(
+        f"⏰ Reminder **#{reminder_id}** set for **{time}** (<t:{due_at}:f>).",
+        ephemeral=True
+    )
+
+@reminder_group.command(
+    name="list",
+    description="View all active reminders."
+)
+async def reminder_list_slash(interaction):
+    rows = await interaction.client.reminders.list(interaction.user.id)
+
+    if not rows:
+        return await interaction.response.send_message(
+            "You have no active reminders.",
+            ephemeral=True
+        )
+
+    await interaction.response.send_message(format_reminder_list(rows), ephemeral=True)
+
+@reminder_group.command(
+    name="cancel",
+    description="Cancel one of your active reminders."
+)
+@app_commands.describe(reminder_id="Reminder ID to cancel.")
+async def reminder_cancel_slash(interaction, reminder_id: int):
+    if await interaction.client.reminders.cancel(interaction.user.id, reminder_id):
+        await interaction.response.send_message(
+            f"❎ Reminder #{reminder_id} cancelled.",
+            ephemeral=True
+        )
+    else:
+        await interaction.response.send_message(
+            f"No reminder found with ID #{reminder_id}.",
+            ephemeral=True
+        )
+
+
+async def setup(bot):
+    for command in (remindme, list_reminders, cancelreminder):
+        bot.add_command(command)
+    bot.tree.add_command(reminder_group)
@@ -0,0 +1,22 @@
+# ============================================================
+#  HYDRA COMPANION — CONSTANTS
+# ============================================================
+#
+#  Fixed ids and game data shared by the command extensions. Settings
+#  that come from the environment are read by app.create_app() instead,
+#  so importing this (or any hydra module) has no side effects.
+
+HYDRA_WARNING_CHANNEL_ID = 1461342242470887546
+ANNOUNCE_CHANNEL_ID = 1461342242470887546
+SUGGESTION_CHANNEL_ID = 1464216800651640893
+KEY_REPORT_CHANNEL_ID = 1483798122931949598
+
+HYDRA_MAX_KEYS = 3
+CHIMERA_MAX_KEYS = 2
+
+MAX_KEYS = {"hydra": HYDRA_MAX_KEYS, "chimera": CHIMERA_MAX_KEYS}
+
+ALLOWED_SUGGEST_BUTTON_CHANNELS = {
+    1463963533640335423,
+    1463963575780507669
+}
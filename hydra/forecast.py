@@ -0,0 +1,160 @@
+# ============================================================
+#  HYDRA COMPANION — MERCY FORECAST
+# ============================================================
+#
+#  Exact answers to "how many more pulls until a legendary?" for
+#  /mercy forecast, without simulating.
+#
+#  Until the rarity you are waiting for lands, every pull that misses
+#  adds one to each pity counter involved, so the misses walk a fixed
+#  path and the pity rules form a finite Markov chain along it. Position
+#  i on the path is the pity the pull is made at; h[i] is the chance it
+#  hits. Then, from pity p:
+#
+#      P(no hit in n pulls)  = S[p + n] / S[p],  S[x] = prod(1 - h[i], i < x)
+#      expected pulls E[p]   = 1 + (1 - h[p]) * E[p + 1]
+#
+#  Both tables are built once per chain from the shard's compiled chance
+#  tables (rates.py) and cached, so a forecast is a few array lookups.
+#  Past the end of those tables the chance no longer changes, so the tail
+#  is geometric. Chains are cached per compiled table, so a rate reload
+#  starts fresh ones.
+#
+#  A legendary means legendary or better. On shards with mythicals a
+#  mythical also resets legendary pity, so that chain walks both counters
+#  and is cached per gap between them, which stays fixed until a hit.
+
+import math
+from bisect import bisect_left
+from functools import lru_cache
+
+import discord
+
+from .rates import shard_rates
+
+FORECAST_TARGETS = ("legendary", "mythical")
+FORECAST_QUANTILES = (0.5, 0.9)
+DEFAULT_FORECAST_PULLS = 10
+
+
+class Chain:
+    def __init__(self, hit):
+        # hit: chance (0..1) of a hit at each pity 0..limit, beyond which
+        # it stays at hit[-1].
+        self.hit = hit
+        self.limit = len(hit) - 1
+        self.tail = hit[-1]
+        # First pity at which a hit is certain, if the curve gets there.
+        self.certain_at = next((i for i, h in enumerate(hit) if h >= 1.0), None)
+
+        self.survival = [1.0]
+        for h in hit:
+            self.survival.append(self.survival[-1] * (1.0 - h))
+
+        self.expected = [0.0] * len(hit)
+        self.expected[-1] = 1.0 / self.tail if self.tail > 0 else math.inf
+        for i in range(len(hit) - 2, -1, -1):
+            self.expected[i] = 1.0 + (1.0 - hit[i]) * self.expected[i + 1]
+
+    def chance_now(self, pity):
+        return self.hit[min(pity, self.limit)]
+
+    def expected_pulls(self, pity):
+        return self.expected[min(pity, self.limit)]
+
+    def miss_chance(self, pity, pulls):
+        # Chance of no hit in the next `pulls` pulls from `pity`.
+        end = pity + pulls
+        if self.certain_at is not None and end > self.certain_at:
+            return 0.0
+        if pity > self.limit:
+            return (1.0 - self.tail) ** pulls
+        inside = min(end, self.limit + 1)
+        miss = self.survival[inside] / self.survival[pity]
+        return miss * (1.0 - self.tail) ** (end - inside)
+
+    def hit_chance(self, pity, pulls):
+        return 1.0 - self.miss_chance(pity, pulls)
+
+    def guaranteed_within(self, pity):
+        # Pulls until a hit is certain, or None if it never is.
+        if self.certain_at is None:
+            return None
+        return max(self.certain_at - pity, 0) + 1
+
+    def pulls_for(self, pity, chance):
+        # Fewest pulls that reach at least `chance` of a hit, or None if
+        # the chain never gets there.
+        if self.certain_at is not None:
+            hi = self.guaranteed_within(pity)
+        elif self.tail > 0:
+            hi = self.limit + 1 + math.ceil(math.log(1.0 - chance) / math.log(1.0 - self.tail))
+        else:
+            return None
+        return bisect_left(range(1, hi + 1), chance, key=lambda n: self.hit_chance(pity, n)) + 1
+
+
+# Bounded so chains for tables a reload replaced eventually drop out.
+@lru_cache(maxsize=4096)
+def forecast_chain(rates, target, gap=0):
+    # rates: the shard's ShardRates. gap: mythical pity minus legendary
+    # pity, for legendaries on shards with mythicals.
+    if target == "mythical":
+        hit = [c / 100 for c in rates.mythical]
+    else:
+        hit = []
+        for pity in range(rates.limit + 1):
+            mythical_pity = min(max(pity + gap, 0), rates.limit)
+            hit.append(min(100.0, rates.legendary[pity] + rates.mythical[mythical_pity]) / 100)
+    return Chain(hit)
+
+
+def forecast_targets(shard_type):
+    return FORECAST_TARGETS if shard_rates(shard_type).has_mythical else FORECAST_TARGETS[:1]
+
+
+def forecast(shard_type, counters, pulls=DEFAULT_FORECAST_PULLS):
+    # {target: {...}} for the rarities this shard can be waited on for.
+    _, legendary, mythical = counters
+    rates = shard_rates(shard_type)
+    results = {}
+    for target in forecast_targets(shard_type):
+        if target == "mythical":
+            pity, chain = mythical, forecast_chain(rates, "mythical")
+        else:
+            # Gaps wider than the tables give the same chain; clamped so
+            # the cache stays bounded.
+            gap = mythical - legendary if rates.has_mythical else 0
+            gap = min(max(gap, -rates.limit - 1), rates.limit + 1)
+            pity, chain = legendary, forecast_chain(rates, "legendary", gap)
+        results[target] = {
+            "pity": pity,
+            "chance_now": chain.chance_now(pity),
+            "expected": chain.expected_pulls(pity),
+            "within": chain.hit_chance(pity, pulls),
+            "quantiles": {q: chain.pulls_for(pity, q) for q in FORECAST_QUANTILES},
+            "guaranteed_within": chain.guaranteed_within(pity),
+        }
+    return results
+
+
+def build_mercy_forecast_embed(shard_type, counters, pulls=DEFAULT_FORECAST_PULLS):
+    embed = discord.Embed(
+        title=f"{shard_type.capitalize()} Mercy Forecast",
+        color=discord.Color.teal()
+    )
+
+    for target, f in forecast(shard_type, counters, pulls).items():
+        half, most = (f["quantiles"][q] for q in FORECAST_QUANTILES)
+        lines = [
+            f"Pity: {f['pity']} — chance on the next pull: {f['chance_now']:.2%}",
+            f"Expected pulls: **{f['expected']:.1f}**",
+            f"50% within **{half}** pulls, 90% within **{most}**",
+            f"Chance within {pulls} pulls: **{f['within']:.1%}**",
+        ]
+        if f["guaranteed_within"] is not None:
+            lines.append(f"Guaranteed within **{f['guaranteed_within']}** pulls")
+        embed.add_field(name=target.capitalize(), value="\n".join(lines), inline=False)
+
+    embed.set_footer(text="Exact odds from the mercy rules, not a simulation")
+    return embed
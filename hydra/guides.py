@@ -0,0 +1,104 @@
+# ============================================================
+#  HYDRA COMPANION — GUIDE EMBEDS
+# ============================================================
+#
+#  The commands and mercy guides, posted by the setup wizard and the
+#  admin commands.
+
+import discord
+
+
+def build_commands_guide_embed():
+    embed = discord.Embed(
+        title="Hydra Companion — FULL COMMAND GUIDE",
+        color=discord.Color.blurple()
+    )
+    embed.add_field(
+        name="GENERAL COMMANDS",
+        value="`$test` — Check if Hydra Companion is online.\n`$chests` — Hydra Clash chest requirements.",
+        inline=False
+    )
+    embed.add_field(
+        name="ADMIN / UTILITY COMMANDS",
+        value="`$announce <msg>` — Post announcement.\n`$purge <amount>` — Delete messages.",
+        inline=False
+    )
+    embed.add_field(
+        name="ANONYMOUS SUGGESTIONS",
+        value="Click **Message Me** → DM bot → Confirm → Submit anonymously.",
+        inline=False
+    )
+    embed.add_field(
+        name="REMINDERS",
+        value="`$remindme 10m task` — Set reminder.\n`$reminders` — List.\n`$cancelreminder <id>` — Cancel.",
+        inline=False
+    )
+    embed.add_field(
+        name="SHOULD I PULL?",
+        value="`$pull <event>` — Random pull advice.",
+        inline=False
+    )
+    embed.add_field(
+        name="GACHA SIMULATOR",
+        value="`$sim <shard>` — Simulate 10 pulls.",
+        inline=False
+    )
+    embed.add_field(
+        name="MERCY TRACKER",
+        value=(
+            "`$mercy <shard>`\n`$mercyall`\n`$mercytable`\n"
+            "`$mercycompare @user`\n"
+            "`$addepic <shard>`\n`$addlegendary <shard>`\n"
+            "`$addmythical`\n`$addpull <shard> <amount>`\n`$clearmercy <shard>`"
+        ),
+        inline=False
+    )
+    return embed
+
+
+def build_mercy_guide_embed():
+    embed = discord.Embed(
+        title="Hydra Companion — MERCY TRACKING GUIDE",
+        color=discord.Color.gold()
+    )
+    embed.add_field(
+        name="BEFORE YOU START",
+        value="Begin tracking after your last Legendary pull.",
+        inline=False
+    )
+    embed.add_field(
+        name="$addpull <shard> <amount>",
+        value="Adds raw pulls to pity counters.",
+        inline=False
+    )
+    embed.add_field(
+        name="$addepic <shard>",
+        value="Resets Epic pity and increases Legendary pity.",
+        inline=False
+    )
+    embed.add_field(
+        name="$addlegendary <shard>",
+        value="Resets Epic + Legendary pity.",
+        inline=False
+    )
+    embed.add_field(
+        name="$addmythical primal",
+        value="Resets all primal pity.",
+        inline=False
+    )
+    embed.add_field(
+        name="$mercy <shard>",
+        value="Shows pity, chances, and readiness.",
+        inline=False
+    )
+    embed.add_field(
+        name="$mercyall / $mercytable",
+        value="Full overview of all shards.",
+        inline=False
+    )
+    embed.add_field(
+        name="$mercycompare @user",
+        value="Compare pity with another player.",
+        inline=False
+    )
+    return embed
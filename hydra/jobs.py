@@ -0,0 +1,60 @@
+# ============================================================
+#  HYDRA COMPANION — SCHEDULED JOBS
+# ============================================================
+#
+#  Recurring jobs are registered once, from setup_hook, under stable ids
+#  with replace_existing, so a gateway reconnect (which re-fires
+#  on_ready) can never stack a second copy of a job.
+#
+#  While the bot is up, APScheduler coalesces missed runs into one and
+#  drops runs more than JOB_MISFIRE_GRACE seconds late. While it is down
+#  nothing runs, so every completed run is recorded in the job_runs
+#  table; at startup a job whose next fire time after its last recorded
+#  run has already passed is run exactly once to catch up.
+
+import time
+from datetime import datetime, timezone
+
+JOB_MISFIRE_GRACE = 3600
+
+
+async def run_job(db, job_id, func):
+    started = int(time.time())
+    await func()
+    await db.record_job_run(job_id, started)
+
+
+def schedule_job(scheduler, db, job_id, func, trigger, **trigger_args):
+    return scheduler.add_job(
+        run_job,
+        trigger,
+        args=(db, job_id, func),
+        id=job_id,
+        replace_existing=True,
+        coalesce=True,
+        max_instances=1,
+        misfire_grace_time=JOB_MISFIRE_GRACE,
+        **trigger_args
+    )
+
+
+async def catch_up_missed_jobs(db, jobs):
+    runs = await db.get_job_runs()
+    now = datetime.now(timezone.utc)
+
+    for job in jobs:
+        last_run = runs.get(job.id)
+        if last_run is None:
+            # First deploy of this job: start counting from now rather than
+            # replaying a fire time nobody was waiting for.
+            await db.record_job_run(job.id, int(now.timestamp()))
+            continue
+
+        after_last = datetime.fromtimestamp(last_run + 1, timezone.utc)
+        missed = job.trigger.get_next_fire_time(None, after_last)
+        if missed is not None and missed <= now:
+            print(f"Catching up missed job {job.id} (due {missed.isoformat()})")
+            try:
+                await job.func(*job.args)
+            except Exception as e:
+                print(f"Catch-up of {job.id} failed:", e)
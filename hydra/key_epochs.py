@@ -0,0 +1,46 @@
+# ============================================================
+#  HYDRA COMPANION — KEY EPOCHS
+# ============================================================
+#
+#  Key usage is stored per epoch: one epoch is the week between two
+#  resets of that boss's keys. Counters from an older epoch simply read
+#  as zero, so the weekly reset is a clock tick rather than a table
+#  rewrite, and past weeks stay in the table as history.
+#
+#  Resets are wall-clock times in Europe/London (the scheduler's zone),
+#  so they stay put across daylight saving changes.
+
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+RESET_TIMEZONE = ZoneInfo("Europe/London")
+
+# boss -> (weekday (Monday=0), hour, minute) of the weekly key reset.
+KEY_RESETS = {
+    "hydra": (2, 10, 59),
+    "chimera": (3, 11, 0),
+}
+
+
+def last_reset(boss, now=None):
+    # The most recent reset at or before `now`, as a London datetime.
+    if now is None:
+        now = datetime.now(timezone.utc)
+    local = now.astimezone(RESET_TIMEZONE)
+    weekday, hour, minute = KEY_RESETS[boss]
+
+    boundary = local.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    boundary -= timedelta(days=(local.weekday() - weekday) % 7)
+    if boundary > local:
+        boundary -= timedelta(days=7)
+    return boundary
+
+
+def key_epoch(boss, now=None):
+    # Resets for one boss always fall on the same weekday, so their day
+    # ordinals are exactly 7 apart and this counts up by one per week.
+    return last_reset(boss, now).toordinal() // 7
+
+
+def current_key_epochs(now=None):
+    return {boss: key_epoch(boss, now) for boss in KEY_RESETS}
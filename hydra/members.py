@@ -0,0 +1,161 @@
+# ============================================================
+#  HYDRA COMPANION — MEMBER CACHE
+# ============================================================
+#
+#  With the members intent and discord.py's default cache policy, every
+#  member of every guild is chunked at startup and kept for good. The
+#  bot only needs members for /mercy compare and for display names in
+#  key reports, so MEMBER_CACHE picks a policy:
+#
+#      lru   (default) no startup chunking and no library member cache.
+#            Members seen using a command are kept in an LRU of
+#            MEMBER_CACHE_SIZE; anyone else is fetched when a command
+#            asks for them.
+#      full  the library default: chunk every guild, cache everyone.
+#
+#  The members intent stays on under both: it is what lets a report
+#  fetch up to 100 missing members in one gateway query instead of one
+#  REST call each. bench/member_cache.py measures memory per 10k members
+#  under each policy.
+
+import asyncio
+from collections import OrderedDict
+
+import discord
+from discord.ext import commands
+
+MEMBER_CACHE_POLICIES = ("lru", "full")
+MEMBER_CACHE_POLICY = "lru"
+MEMBER_CACHE_SIZE = 5000
+
+QUERY_BATCH = 100  # user ids per gateway member query, Discord's limit
+QUERY_TIMEOUT = 5.0
+
+
+def member_cache_options(policy):
+    # discord.Client keyword arguments for a MEMBER_CACHE policy.
+    if policy == "lru":
+        return {"member_cache_flags": discord.MemberCacheFlags.none(), "chunk_guilds_at_startup": False}
+    if policy == "full":
+        return {"member_cache_flags": discord.MemberCacheFlags.all(), "chunk_guilds_at_startup": True}
+    raise ValueError(f"MEMBER_CACHE must be one of {', '.join(MEMBER_CACHE_POLICIES)}, not {policy!r}")
+
+
+class MemberCache:
+    def __init__(self, capacity=MEMBER_CACHE_SIZE, query_members=True):
+        # query_members: the members intent is on, so misses can be
+        # fetched in batches over the gateway.
+        self.capacity = capacity
+        self.query_members = query_members
+        self._members = OrderedDict()  # (guild_id, user_id) -> Member
+
+        self.hits = 0
+        self.misses = 0
+        self.fetched = 0
+        self.evictions = 0
+
+    def remember(self, member):
+        # Called with every member seen sending a message or using a
+        # command, so an entry's display name is as fresh as that user's
+        # last activity.
+        if self.capacity <= 0 or not isinstance(member, discord.Member):
+            return
+        key = (member.guild.id, member.id)
+        self._members[key] = member
+        self._members.move_to_end(key)
+        while len(self._members) > self.capacity:
+            self._members.popitem(last=False)
+            self.evictions += 1
+
+    def forget(self, guild_id, user_id):
+        self._members.pop((guild_id, user_id), None)
+
+    def get(self, guild, user_id):
+        # Cached member or None; never fetches.
+        member = self._members.get((guild.id, user_id))
+        if member is not None:
+            self._members.move_to_end((guild.id, user_id))
+            self.hits += 1
+            return member
+        # The bot itself, or anyone at all under the "full" policy.
+        member = guild.get_member(user_id)
+        if member is not None:
+            self.hits += 1
+            return member
+        self.misses += 1
+        return None
+
+    async def fetch(self, guild, user_id):
+        # Cached member, else fetched; None if they have left the guild.
+        member = self.get(guild, user_id)
+        if member is not None:
+            return member
+        try:
+            member = await guild.fetch_member(user_id)
+        except discord.NotFound:
+            return None
+        self.fetched += 1
+        self.remember(member)
+        return member
+
+    async def fetch_many(self, guild, user_ids):
+        # {user_id: Member} for those still in the guild. A slow gateway
+        # leaves the rest out rather than holding up the command. Members
+        # fetched here are not remembered: a report over a whole roster
+        # would otherwise push every active member out of the LRU.
+        found = {}
+        missing = []
+        for user_id in user_ids:
+            member = self.get(guild, user_id)
+            if member is not None:
+                found[user_id] = member
+            else:
+                missing.append(user_id)
+
+        if not self.query_members:
+            for user_id in missing:
+                try:
+                    found[user_id] = await guild.fetch_member(user_id)
+                except discord.NotFound:
+                    continue
+                self.fetched += 1
+            return found
+
+        for start in range(0, len(missing), QUERY_BATCH):
+            batch = missing[start:start + QUERY_BATCH]
+            try:
+                members = await asyncio.wait_for(
+                    guild.query_members(user_ids=batch, limit=len(batch), cache=False), QUERY_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                break
+            for member in members:
+                self.fetched += 1
+                found[member.id] = member
+        return found
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._members),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "fetched": self.fetched,
+            "evictions": self.evictions,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class CachedMember(commands.MemberConverter):
+    # discord.Member for prefix commands: the LRU first, then the usual
+    # lookup (which fetches when the library has not cached the member).
+    async def convert(self, ctx, argument):
+        match = self._get_id_match(argument.strip("<@!>"))
+        if match and ctx.guild is not None:
+            member = ctx.bot.members.get(ctx.guild, int(match.group(1)))
+            if member is not None:
+                return member
+        member = await super().convert(ctx, argument)
+        ctx.bot.members.remember(member)
+        return member
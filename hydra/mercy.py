@@ -0,0 +1,145 @@
+# ============================================================
+#  HYDRA COMPANION — MERCY HELPERS
+# ============================================================
+#
+#  Readiness and the embeds the mercy commands (prefix and slash) build
+#  from a user's counters. Chances and which counters a shard keeps come
+#  from the compiled rate tables in rates.py.
+
+import discord
+
+from .rates import shard_rates, shard_types
+from .storage import EMPTY_MERCY
+
+
+def compute_readiness_color_and_flag(shard_type, legendary_chance, mythical_chance=None):
+    rates = shard_rates(shard_type)
+    relevant = mythical_chance if rates.chase == "mythical" else legendary_chance
+    ready = relevant > 74.0
+
+    if ready:
+        return discord.Color.green(), True, "🟢 **Ready to pull**"
+    if relevant > 20.0:
+        return discord.Color.orange(), False, "🟡 Building up"
+    return discord.Color.red(), False, "🔴 Low mercy"
+
+
+def build_mercy_status_embed(shard_type, counters):
+    epic, legendary, mythical = counters
+    rates = shard_rates(shard_type)
+
+    embed = discord.Embed(
+        title=f"{shard_type.capitalize()} Mercy Status",
+        color=discord.Color.gold()
+    )
+
+    if rates.tracks_epic:
+        epic_chance = rates.chance("epic", epic)
+        embed.add_field(name="Epic", value=f"Pity: {epic}\nChance: {epic_chance:.2f}%", inline=False)
+
+    legendary_chance = rates.chance("legendary", legendary)
+    embed.add_field(name="Legendary", value=f"Pity: {legendary}\nChance: {legendary_chance:.2f}%", inline=False)
+
+    mythical_chance = None
+    if rates.has_mythical:
+        mythical_chance = rates.chance("mythical", mythical)
+        embed.add_field(name="Mythical", value=f"Pity: {mythical}\nChance: {mythical_chance:.2f}%", inline=False)
+
+    color, ready, _ = compute_readiness_color_and_flag(shard_type, legendary_chance, mythical_chance)
+    embed.color = color
+
+    if ready:
+        embed.add_field(name="🔥 Ready?", value="Looks like you are ready to pull :P", inline=False)
+
+    return embed
+
+
+def build_mercy_overview_embed(display_name, mercy):
+    embed = discord.Embed(
+        title=f"{display_name}'s Full Mercy Overview",
+        color=discord.Color.blue()
+    )
+
+    for shard in shard_types():
+        epic, legendary, mythical = mercy.get(shard, EMPTY_MERCY)
+        rates = shard_rates(shard)
+        text = ""
+
+        legendary_chance = rates.chance("legendary", legendary)
+        mythical_chance = None
+
+        if rates.tracks_epic:
+            epic_chance = rates.chance("epic", epic)
+            text += f"**Epic:** {epic} pulls — {epic_chance:.2f}%\n"
+
+        text += f"**Legendary:** {legendary} pulls — {legendary_chance:.2f}%"
+
+        if rates.has_mythical:
+            mythical_chance = rates.chance("mythical", mythical)
+            text += f"\n**Mythical:** {mythical} pulls — {mythical_chance:.2f}%"
+
+        _, ready, _ = compute_readiness_color_and_flag(shard, legendary_chance, mythical_chance)
+        if ready:
+            text += "\n🔥 **Looks like you are ready to pull :P**"
+
+        embed.add_field(name=shard.capitalize(), value=text, inline=False)
+
+    return embed
+
+
+def build_mercy_table_embed(display_name, mercy):
+    embed = discord.Embed(
+        title=f"{display_name}'s Mercy Table",
+        color=discord.Color.gold()
+    )
+
+    for shard in shard_types():
+        epic, legendary, mythical = mercy.get(shard, EMPTY_MERCY)
+        rates = shard_rates(shard)
+        lines = []
+
+        legendary_chance = rates.chance("legendary", legendary)
+        mythical_chance = None
+
+        if rates.tracks_epic:
+            epic_chance = rates.chance("epic", epic)
+            lines.append(f"**Epic:** {epic} pulls — {epic_chance:.2f}%")
+        lines.append(f"**Legendary:** {legendary} pulls — {legendary_chance:.2f}%")
+        if rates.has_mythical:
+            mythical_chance = rates.chance("mythical", mythical)
+            lines.append(f"**Mythical:** {mythical} pulls — {mythical_chance:.2f}%")
+
+        _, _, status = compute_readiness_color_and_flag(shard, legendary_chance, mythical_chance)
+        lines.append(f"**Status:** {status}")
+
+        embed.add_field(name=shard.capitalize(), value="\n".join(lines), inline=False)
+
+    return embed
+
+
+def format_mercy_compare_line(shard, display_name, counters):
+    epic, legendary, mythical = counters
+    rates = shard_rates(shard)
+    parts = []
+    if rates.tracks_epic:
+        parts.append(f"E:{epic} ({rates.chance('epic', epic):.2f}%)")
+    parts.append(f"L:{legendary} ({rates.chance('legendary', legendary):.2f}%)")
+    if rates.has_mythical:
+        parts.append(f"M:{mythical} ({rates.chance('mythical', mythical):.2f}%)")
+    return f"**{display_name}:** " + "  ".join(parts)
+
+
+def build_mercy_compare_embed(user1, mercy1, user2, mercy2):
+    embed = discord.Embed(
+        title=f"Mercy Comparison: {user1.display_name} vs {user2.display_name}",
+        color=discord.Color.purple()
+    )
+
+    for shard in shard_types():
+        lines = [
+            format_mercy_compare_line(shard, user1.display_name, mercy1.get(shard, EMPTY_MERCY)),
+            format_mercy_compare_line(shard, user2.display_name, mercy2.get(shard, EMPTY_MERCY))
+        ]
+        embed.add_field(name=shard.capitalize(), value="\n".join(lines), inline=False)
+
+    return embed
@@ -0,0 +1,583 @@
+# ============================================================
+#  HYDRA COMPANION — SCHEMA MIGRATIONS
+# ============================================================
+#
+#  Every schema change is a numbered migration. Applied versions are
+#  recorded in schema_version, so startup only runs what is new and
+#  never probes the schema with DDL that is expected to fail.
+#
+#  Migrations that touch many rows go through run_chunked(), which
+#  commits after every small batch so the database is never locked long
+#  enough to stall live commands from another process.
+#
+#  Table rebuilds are the exception (4, 5 and 9: copy the rows into a
+#  table of the new shape, drop the old one, rename). Each runs as one
+#  transaction together with its schema_version row. Copied in chunks,
+#  a write to a row that had already been copied would be dropped with
+#  the old table, and a crash halfway would leave a half-built table
+#  that the retry cannot create again. They run once, over the key
+#  tables and the broadcast ledger, and block writers only while they
+#  copy.
+#
+#  SQLite migrations are Python functions run on the storage thread.
+#  The PostgreSQL backend keeps a parallel list of plain statements with
+#  the same version numbers, so both backends report the same schema
+#  version for the same feature set.
+
+import time
+
+from .clash_schedule import default_schedule_rows
+from .key_epochs import current_key_epochs
+
+CHUNK_SIZE = 500
+
+
+def column_exists(conn, table, column):
+    return any(row[1] == column for row in conn.execute(f"PRAGMA table_info({table})"))
+
+
+def run_chunked(conn, sql, params=(), chunk_size=CHUNK_SIZE):
+    # `sql` must be an UPDATE/DELETE restricted to a "... LIMIT ?"
+    # subquery and must stop matching rows once they are processed; the
+    # chunk size is bound as the last param.
+    total = 0
+    while True:
+        cur = conn.execute(sql, (*params, chunk_size))
+        conn.commit()
+        total += cur.rowcount
+        if cur.rowcount < chunk_size:
+            return total
+
+
+# ------------------------------------------------------------
+#  MIGRATIONS
+# ------------------------------------------------------------
+
+def migrate_baseline(conn):
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS mercy (
+        user_id TEXT,
+        shard_type TEXT,
+        epic_pity INTEGER DEFAULT 0,
+        legendary_pity INTEGER DEFAULT 0,
+        mythical_pity INTEGER DEFAULT 0,
+        PRIMARY KEY (user_id, shard_type)
+    )
+    """)
+
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS guild_channels (
+        guild_id TEXT PRIMARY KEY,
+        warning_channel_id INTEGER,
+        suggestion_channel_id INTEGER,
+        feedback_channel_id INTEGER,
+        commands_channel_id INTEGER,
+        mercy_channel_id INTEGER
+    )
+    """)
+
+    # Databases created before the mercy guide step lack this column.
+    if not column_exists(conn, "guild_channels", "mercy_channel_id"):
+        conn.execute("ALTER TABLE guild_channels ADD COLUMN mercy_channel_id INTEGER")
+
+    # Key usage table
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS keys (
+        user_id TEXT PRIMARY KEY,
+        username TEXT,
+        hydra_used INTEGER DEFAULT 0,
+        chimera_used INTEGER DEFAULT 0
+    )
+    """)
+
+
+def migrate_mercy_indexes(conn):
+    # Pity range lookups ("who is close to a legendary/mythical").
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_mercy_legendary_pity "
+        "ON mercy (shard_type, legendary_pity)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_mercy_mythical_pity "
+        "ON mercy (shard_type, mythical_pity)"
+    )
+    # Partial index so compaction only ever visits all-zero rows.
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_mercy_empty ON mercy (user_id)
+        WHERE epic_pity = 0 AND legendary_pity = 0 AND mythical_pity = 0
+    """)
+
+
+def migrate_purge_empty_mercy(conn):
+    # The old insert-on-read path left one all-zero row per shard viewed.
+    run_chunked(conn, """
+        DELETE FROM mercy WHERE (user_id, shard_type) IN (
+            SELECT user_id, shard_type FROM mercy
+            WHERE epic_pity = 0 AND legendary_pity = 0 AND mythical_pity = 0
+            LIMIT ?
+        )
+    """)
+
+
+# Key usage rows that predate per-guild tracking. They are moved into the
+# guild that owns KEY_REPORT_CHANNEL_ID the first time the bot sees it.
+LEGACY_KEYS_GUILD = "0"
+
+
+def migrate_keys_per_guild(conn):
+    # SQLite cannot change a primary key in place, so rebuild the table
+    # keyed by (guild_id, user_id). The key is also the index every
+    # guild-scoped report and reset walks.
+    conn.execute("""
+    CREATE TABLE keys_by_guild (
+        guild_id TEXT NOT NULL,
+        user_id TEXT NOT NULL,
+        username TEXT,
+        hydra_used INTEGER DEFAULT 0,
+        chimera_used INTEGER DEFAULT 0,
+        PRIMARY KEY (guild_id, user_id)
+    )
+    """)
+    conn.execute("""
+        INSERT INTO keys_by_guild (guild_id, user_id, username, hydra_used, chimera_used)
+        SELECT ?, user_id, username, hydra_used, chimera_used FROM keys
+    """, (LEGACY_KEYS_GUILD,))
+    conn.execute("DROP TABLE keys")
+    conn.execute("ALTER TABLE keys_by_guild RENAME TO keys")
+
+    if not column_exists(conn, "guild_channels", "key_report_channel_id"):
+        conn.execute("ALTER TABLE guild_channels ADD COLUMN key_report_channel_id INTEGER")
+
+
+def migrate_key_epochs(conn):
+    # keys becomes the per-guild roster (who has logged keys, and under
+    # which name); the counters move to key_usage, one row per user, boss
+    # and weekly epoch. The live counters belong to the current week.
+    conn.execute("""
+    CREATE TABLE key_usage (
+        guild_id TEXT NOT NULL,
+        user_id TEXT NOT NULL,
+        boss TEXT NOT NULL,
+        epoch INTEGER NOT NULL,
+        used INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (guild_id, user_id, boss, epoch)
+    )
+    """)
+    epochs = current_key_epochs()
+    for boss in ("hydra", "chimera"):
+        conn.execute(f"""
+            INSERT INTO key_usage (guild_id, user_id, boss, epoch, used)
+            SELECT guild_id, user_id, ?, ?, {boss}_used FROM keys WHERE {boss}_used > 0
+        """, (boss, epochs[boss]))
+
+    conn.execute("""
+    CREATE TABLE key_roster (
+        guild_id TEXT NOT NULL,
+        user_id TEXT NOT NULL,
+        username TEXT,
+        PRIMARY KEY (guild_id, user_id)
+    )
+    """)
+    conn.execute("INSERT INTO key_roster SELECT guild_id, user_id, username FROM keys")
+    conn.execute("DROP TABLE keys")
+    conn.execute("ALTER TABLE key_roster RENAME TO keys")
+
+
+def migrate_job_runs(conn):
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS job_runs (
+        job_id TEXT PRIMARY KEY,
+        last_run_at BIGINT NOT NULL
+    )
+    """)
+
+
+CLASH_SCHEDULES_TABLE = """
+CREATE TABLE IF NOT EXISTS clash_schedules (
+    guild_id TEXT NOT NULL,
+    event TEXT NOT NULL,
+    weekday INTEGER NOT NULL,
+    local_time TEXT NOT NULL,
+    timezone TEXT NOT NULL,
+    lead_minutes INTEGER NOT NULL,
+    next_fire_at BIGINT NOT NULL,
+    PRIMARY KEY (guild_id, event)
+)
+"""
+
+CLASH_SCHEDULES_INDEX = (
+    "CREATE INDEX IF NOT EXISTS idx_clash_schedules_next_fire ON clash_schedules (next_fire_at)"
+)
+
+# Guilds that already have a warning channel keep the old global times.
+CLASH_SCHEDULES_BACKFILL = """
+    INSERT INTO clash_schedules
+        (guild_id, event, weekday, local_time, timezone, lead_minutes, next_fire_at)
+    SELECT guild_id, ?, ?, ?, ?, ?, ? FROM guild_channels WHERE warning_channel_id IS NOT NULL
+"""
+
+
+def default_schedule_params():
+    return [row[1:] for row in default_schedule_rows(None)]
+
+
+def migrate_clash_schedules(conn):
+    conn.execute(CLASH_SCHEDULES_TABLE)
+    conn.execute(CLASH_SCHEDULES_INDEX)
+    conn.executemany(CLASH_SCHEDULES_BACKFILL, default_schedule_params())
+
+
+BROADCAST_TABLES = [
+    """
+    CREATE TABLE IF NOT EXISTS broadcast_runs (
+        run_id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        started_at BIGINT NOT NULL,
+        finished_at BIGINT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS broadcast_deliveries (
+        run_id TEXT NOT NULL,
+        guild_id TEXT NOT NULL,
+        channel_id BIGINT,
+        content TEXT NOT NULL,
+        status TEXT NOT NULL DEFAULT 'pending',
+        message_id BIGINT,
+        error TEXT,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        latency_ms INTEGER,
+        PRIMARY KEY (run_id, guild_id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_broadcast_runs_started ON broadcast_runs (started_at)",
+    "CREATE INDEX IF NOT EXISTS idx_broadcast_runs_open ON broadcast_runs (started_at) WHERE finished_at IS NULL",
+]
+
+
+def migrate_broadcast_ledger(conn):
+    for statement in BROADCAST_TABLES:
+        conn.execute(statement)
+
+
+KEY_REPORT_SNAPSHOTS_TABLE = """
+CREATE TABLE IF NOT EXISTS key_report_snapshots (
+    guild_id TEXT NOT NULL,
+    boss TEXT NOT NULL,
+    epoch INTEGER NOT NULL,
+    user_id TEXT NOT NULL,
+    username TEXT,
+    used INTEGER NOT NULL,
+    taken_at BIGINT NOT NULL,
+    PRIMARY KEY (guild_id, boss, epoch, user_id)
+)
+"""
+
+
+def migrate_key_snapshots(conn):
+    conn.execute(KEY_REPORT_SNAPSHOTS_TABLE)
+
+    # A report may now span several messages: deliveries gain a part
+    # number, and every existing row becomes part 0 of its run.
+    conn.execute("""
+    CREATE TABLE broadcast_parts (
+        run_id TEXT NOT NULL,
+        guild_id TEXT NOT NULL,
+        part INTEGER NOT NULL DEFAULT 0,
+        channel_id BIGINT,
+        content TEXT NOT NULL,
+        status TEXT NOT NULL DEFAULT 'pending',
+        message_id BIGINT,
+        error TEXT,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        latency_ms INTEGER,
+        PRIMARY KEY (run_id, guild_id, part)
+    )
+    """)
+    conn.execute("""
+        INSERT INTO broadcast_parts
+            (run_id, guild_id, part, channel_id, content, status, message_id, error, attempts, latency_ms)
+        SELECT run_id, guild_id, 0, channel_id, content, status, message_id, error, attempts, latency_ms
+        FROM broadcast_deliveries
+    """)
+    conn.execute("DROP TABLE broadcast_deliveries")
+    conn.execute("ALTER TABLE broadcast_parts RENAME TO broadcast_deliveries")
+
+
+CLUSTER_TABLES = [
+    """
+    CREATE TABLE IF NOT EXISTS cluster_leases (
+        name TEXT PRIMARY KEY,
+        holder TEXT NOT NULL,
+        expires_at BIGINT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS cluster_shards (
+        shard_id INTEGER PRIMARY KEY,
+        cluster_id INTEGER NOT NULL,
+        guild_count INTEGER NOT NULL,
+        latency_ms INTEGER,
+        updated_at BIGINT NOT NULL
+    )
+    """,
+]
+
+
+def migrate_cluster_tables(conn):
+    for statement in CLUSTER_TABLES:
+        conn.execute(statement)
+
+
+# AUTOINCREMENT (and BIGSERIAL on PostgreSQL) never hands out an id
+# again, even after the newest reminder is deleted: the id is the number
+# users cancel by.
+REMINDERS_TABLE = """
+CREATE TABLE IF NOT EXISTS reminders (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT NOT NULL,
+    guild_id TEXT,
+    channel_id BIGINT NOT NULL,
+    text TEXT NOT NULL,
+    due_at BIGINT NOT NULL,
+    created_at BIGINT NOT NULL
+)
+"""
+
+REMINDERS_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_reminders_user ON reminders (user_id, due_at)",
+    "CREATE INDEX IF NOT EXISTS idx_reminders_due ON reminders (due_at)",
+]
+
+
+def migrate_reminders(conn):
+    conn.execute(REMINDERS_TABLE)
+    for statement in REMINDERS_INDEXES:
+        conn.execute(statement)
+
+
+# A part a worker is sending is marked 'sending' and stamped with that
+# worker and the time, so another leader does not send it too.
+BROADCAST_CLAIM_COLUMNS = [
+    "ALTER TABLE broadcast_deliveries ADD COLUMN claimed_by TEXT",
+    "ALTER TABLE broadcast_deliveries ADD COLUMN claimed_at BIGINT",
+]
+
+
+def migrate_broadcast_claims(conn):
+    for statement in BROADCAST_CLAIM_COLUMNS:
+        conn.execute(statement)
+
+
+# One counter per reloadable resource (shard_rates), bumped by whichever
+# worker reloads it so the others follow (see tasks.follow_rates_reloads).
+RELOAD_VERSIONS_TABLE = """
+CREATE TABLE IF NOT EXISTS reload_versions (
+    name TEXT PRIMARY KEY,
+    version BIGINT NOT NULL
+)
+"""
+
+
+def migrate_reload_versions(conn):
+    conn.execute(RELOAD_VERSIONS_TABLE)
+
+
+MIGRATIONS = [
+    (1, "baseline schema", migrate_baseline),
+    (2, "mercy pity and compaction indexes", migrate_mercy_indexes),
+    (3, "purge all-zero mercy rows", migrate_purge_empty_mercy),
+    (4, "key usage per guild", migrate_keys_per_guild),
+    (5, "weekly key epochs", migrate_key_epochs),
+    (6, "scheduled job runs", migrate_job_runs),
+    (7, "per-guild clash schedules", migrate_clash_schedules),
+    (8, "broadcast delivery ledger", migrate_broadcast_ledger),
+    (9, "key report snapshots and multi-part deliveries", migrate_key_snapshots),
+    (10, "cluster leases and shard stats", migrate_cluster_tables),
+    (11, "persistent reminders", migrate_reminders),
+    (12, "broadcast delivery claims", migrate_broadcast_claims),
+    (13, "shared reload versions", migrate_reload_versions),
+]
+
+
+SCHEMA_VERSION_TABLE = """
+CREATE TABLE IF NOT EXISTS schema_version (
+    version INTEGER PRIMARY KEY,
+    description TEXT,
+    applied_at BIGINT
+)
+"""
+
+
+def applied_versions(conn):
+    conn.execute(SCHEMA_VERSION_TABLE)
+    conn.commit()
+    return {row[0] for row in conn.execute("SELECT version FROM schema_version")}
+
+
+def run_migrations(conn):
+    done = applied_versions(conn)
+    applied = []
+
+    for version, description, migrate in MIGRATIONS:
+        if version in done:
+            continue
+        try:
+            migrate(conn)
+            conn.execute(
+                "INSERT INTO schema_version (version, description, applied_at) VALUES (?, ?, ?)",
+                (version, description, int(time.time()))
+            )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        applied.append(version)
+        print(f"Applied schema migration {version}: {description}")
+
+    return applied
+
+
+# ------------------------------------------------------------
+#  POSTGRESQL
+# ------------------------------------------------------------
+
+POSTGRES_CLASH_SCHEDULES_BACKFILL = CLASH_SCHEDULES_BACKFILL.replace(
+    "?, ?, ?, ?, ?, ?", "$1::text, $2::integer, $3::text, $4::text, $5::integer, $6::bigint"
+)
+
+POSTGRES_MIGRATIONS = [
+    (1, "baseline schema", [
+        """
+        CREATE TABLE IF NOT EXISTS mercy (
+            user_id TEXT,
+            shard_type TEXT,
+            epic_pity INTEGER DEFAULT 0,
+            legendary_pity INTEGER DEFAULT 0,
+            mythical_pity INTEGER DEFAULT 0,
+            PRIMARY KEY (user_id, shard_type)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS guild_channels (
+            guild_id TEXT PRIMARY KEY,
+            warning_channel_id BIGINT,
+            suggestion_channel_id BIGINT,
+            feedback_channel_id BIGINT,
+            commands_channel_id BIGINT,
+            mercy_channel_id BIGINT
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS keys (
+            user_id TEXT PRIMARY KEY,
+            username TEXT,
+            hydra_used INTEGER DEFAULT 0,
+            chimera_used INTEGER DEFAULT 0
+        )
+        """,
+    ]),
+    (2, "mercy pity and compaction indexes", [
+        "CREATE INDEX IF NOT EXISTS idx_mercy_legendary_pity ON mercy (shard_type, legendary_pity)",
+        "CREATE INDEX IF NOT EXISTS idx_mercy_mythical_pity ON mercy (shard_type, mythical_pity)",
+        """
+        CREATE INDEX IF NOT EXISTS idx_mercy_empty ON mercy (user_id)
+        WHERE epic_pity = 0 AND legendary_pity = 0 AND mythical_pity = 0
+        """,
+    ]),
+    # Version 3 only cleaned up SQLite-era rows; nothing to do here.
+    (3, "purge all-zero mercy rows", []),
+    (4, "key usage per guild", [
+        f"ALTER TABLE keys ADD COLUMN IF NOT EXISTS guild_id TEXT NOT NULL DEFAULT '{LEGACY_KEYS_GUILD}'",
+        "ALTER TABLE keys ALTER COLUMN guild_id DROP DEFAULT",
+        "ALTER TABLE keys DROP CONSTRAINT IF EXISTS keys_pkey",
+        "ALTER TABLE keys ADD PRIMARY KEY (guild_id, user_id)",
+        "ALTER TABLE guild_channels ADD COLUMN IF NOT EXISTS key_report_channel_id BIGINT",
+    ]),
+    (5, "weekly key epochs", [
+        """
+        CREATE TABLE IF NOT EXISTS key_usage (
+            guild_id TEXT NOT NULL,
+            user_id TEXT NOT NULL,
+            boss TEXT NOT NULL,
+            epoch INTEGER NOT NULL,
+            used INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (guild_id, user_id, boss, epoch)
+        )
+        """,
+        # (sql, args) pairs take their arguments when the migration runs.
+        ("""
+        INSERT INTO key_usage (guild_id, user_id, boss, epoch, used)
+        SELECT guild_id, user_id, 'hydra', $1::integer, hydra_used FROM keys WHERE hydra_used > 0
+        """, lambda: (current_key_epochs()["hydra"],)),
+        ("""
+        INSERT INTO key_usage (guild_id, user_id, boss, epoch, used)
+        SELECT guild_id, user_id, 'chimera', $1::integer, chimera_used FROM keys WHERE chimera_used > 0
+        """, lambda: (current_key_epochs()["chimera"],)),
+        "ALTER TABLE keys DROP COLUMN hydra_used",
+        "ALTER TABLE keys DROP COLUMN chimera_used",
+    ]),
+    (6, "scheduled job runs", [
+        """
+        CREATE TABLE IF NOT EXISTS job_runs (
+            job_id TEXT PRIMARY KEY,
+            last_run_at BIGINT NOT NULL
+        )
+        """,
+    ]),
+    (7, "per-guild clash schedules", [
+        CLASH_SCHEDULES_TABLE,
+        CLASH_SCHEDULES_INDEX,
+        (POSTGRES_CLASH_SCHEDULES_BACKFILL, lambda: default_schedule_params()[0]),
+        (POSTGRES_CLASH_SCHEDULES_BACKFILL, lambda: default_schedule_params()[1]),
+    ]),
+    (8, "broadcast delivery ledger", BROADCAST_TABLES),
+    (9, "key report snapshots and multi-part deliveries", [
+        KEY_REPORT_SNAPSHOTS_TABLE,
+        "ALTER TABLE broadcast_deliveries ADD COLUMN IF NOT EXISTS part INTEGER NOT NULL DEFAULT 0",
+        "ALTER TABLE broadcast_deliveries DROP CONSTRAINT IF EXISTS broadcast_deliveries_pkey",
+        "ALTER TABLE broadcast_deliveries ADD PRIMARY KEY (run_id, guild_id, part)",
+    ]),
+    (10, "cluster leases and shard stats", CLUSTER_TABLES),
+    (11, "persistent reminders", [
+        REMINDERS_TABLE.replace("INTEGER PRIMARY KEY AUTOINCREMENT", "BIGSERIAL PRIMARY KEY"),
+        *REMINDERS_INDEXES,
+    ]),
+    (12, "broadcast delivery claims", [
+        statement.replace("ADD COLUMN", "ADD COLUMN IF NOT EXISTS") for statement in BROADCAST_CLAIM_COLUMNS
+    ]),
+    (13, "shared reload versions", [RELOAD_VERSIONS_TABLE]),
+]
+
+
+# Several bot processes may share one server; only one migrates at a time.
+POSTGRES_MIGRATION_LOCK = 0x48594452
+
+
+async def run_postgres_migrations(conn):
+    await conn.execute("SELECT pg_advisory_lock($1)", POSTGRES_MIGRATION_LOCK)
+    try:
+        await conn.execute(SCHEMA_VERSION_TABLE)
+        done = {row[0] for row in await conn.fetch("SELECT version FROM schema_version")}
+        applied = []
+
+        for version, description, statements in POSTGRES_MIGRATIONS:
+            if version in done:
+                continue
+            async with conn.transaction():
+                for statement in statements:
+                    if isinstance(statement, tuple):
+                        sql, args = statement
+                        await conn.execute(sql, *args())
+                    else:
+                        await conn.execute(statement)
+                await conn.execute(
+                    "INSERT INTO schema_version (version, description, applied_at) VALUES ($1, $2, $3)",
+                    version, description, int(time.time())
+                )
+            applied.append(version)
+            print(f"Applied schema migration {version}: {description}")
+
+        return applied
+    finally:
+        await conn.execute("SELECT pg_advisory_unlock($1)", POSTGRES_MIGRATION_LOCK)
@@ -0,0 +1,134 @@
+# ============================================================
+#  HYDRA COMPANION — SHARD RATES
+# ============================================================
+#
+#  Every shard's pull rates come from one declarative table,
+#  shard_rates.json (SHARD_RATES_PATH overrides it). Each rarity has
+#  a base chance in percent. A rarity with mercy also has the pity after
+#  which it rises (soft_pity), what each further pull adds (increment)
+#  and where it stops (cap, 100 if omitted):
+#
+#      chance(pity) = base                                             pity <= soft_pity
+#                   = min(cap, base + (pity - soft_pity) * increment)  otherwise
+#
+#  A rarity a shard leaves out has no chance at all; rare is whatever the
+#  others leave over. The pity counters follow the table too: the epic
+#  counter is kept only where epic has mercy, the mythical one only where
+#  mythical can drop.
+#
+#  load_shard_rates() compiles the table into one chance array per
+#  rarity, indexed by pity up to where every curve has flattened out, so
+#  a chance lookup is a single index. Mercy display, readiness, the
+#  simulator and forecasts all read the compiled tables. The bot compiles
+#  them at startup; the owner's $reloadrates recompiles them after the
+#  game changes rates, and a file that fails to validate leaves the old
+#  tables in place. The tables are per process; in a cluster the reload
+#  bumps a shared version, and the other workers reload the file when
+#  their heartbeat sees it change.
+
+import json
+import math
+import os
+
+RARITIES = ("epic", "legendary", "mythical")
+
+SHARD_RATES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "shard_rates.json")
+
+_shards = None
+
+
+class ShardRates:
+    def __init__(self, name, definition):
+        self.name = name
+        if not isinstance(definition, dict):
+            raise ValueError(f"{name}: needs an object of rarities")
+        curves = {rarity: validate_curve(name, rarity, definition.get(rarity)) for rarity in RARITIES}
+        unknown = set(definition) - set(RARITIES)
+        if unknown:
+            raise ValueError(f"{name}: unknown rarity {', '.join(sorted(unknown))}")
+        if sum(curve["base"] for curve in curves.values()) > 100:
+            raise ValueError(f"{name}: base chances add up to more than 100%")
+
+        # Highest pity at which any chance still changes; counters above
+        # it read the last entry.
+        self.limit = max(flat_from(curve) for curve in curves.values())
+        self.epic, self.legendary, self.mythical = (
+            tuple(curve_chance(curves[rarity], pity) for pity in range(self.limit + 1))
+            for rarity in RARITIES
+        )
+        self.tracks_epic = "soft_pity" in curves["epic"]
+        self.has_mythical = curves["mythical"]["base"] > 0
+
+    def chance(self, rarity, pity):
+        return getattr(self, rarity)[min(pity, self.limit)]
+
+    @property
+    def chase(self):
+        # The rarity readiness is judged on.
+        return "mythical" if self.has_mythical else "legendary"
+
+
+def validate_curve(shard, rarity, curve):
+    if curve is None:
+        return {"base": 0.0}
+    where = f"{shard}.{rarity}"
+    if not isinstance(curve, dict) or not isinstance(curve.get("base"), (int, float)):
+        raise ValueError(f"{where}: needs a numeric base chance")
+    if not 0 <= curve["base"] <= 100:
+        raise ValueError(f"{where}: base must be between 0 and 100")
+    if ("soft_pity" in curve) != ("increment" in curve):
+        raise ValueError(f"{where}: soft_pity and increment go together")
+    if "soft_pity" in curve:
+        if not isinstance(curve["soft_pity"], int) or curve["soft_pity"] < 0:
+            raise ValueError(f"{where}: soft_pity must be a whole number of pulls")
+        if not isinstance(curve["increment"], (int, float)) or curve["increment"] <= 0:
+            raise ValueError(f"{where}: increment must be positive")
+        if not curve["base"] <= curve.get("cap", 100) <= 100:
+            raise ValueError(f"{where}: cap must be between base and 100")
+    elif "cap" in curve:
+        raise ValueError(f"{where}: cap needs soft_pity and increment")
+    return curve
+
+
+def flat_from(curve):
+    if "soft_pity" not in curve:
+        return 0
+    return curve["soft_pity"] + math.ceil((curve.get("cap", 100) - curve["base"]) / curve["increment"])
+
+
+def curve_chance(curve, pity):
+    base = curve["base"]
+    if "soft_pity" not in curve or pity <= curve["soft_pity"]:
+        return base
+    return min(curve.get("cap", 100.0), base + (pity - curve["soft_pity"]) * curve["increment"])
+
+
+def compile_shard_rates(definitions):
+    if not isinstance(definitions, dict) or not definitions:
+        raise ValueError("The shard rate table must map shard names to their rarities")
+    return {name: ShardRates(name, definition) for name, definition in definitions.items()}
+
+
+def load_shard_rates(path=SHARD_RATES_PATH):
+    # Compiles the table and swaps it in; raises OSError or ValueError
+    # (JSON errors included) without touching the current tables if the
+    # file is unusable.
+    global _shards
+    with open(path) as f:
+        compiled = compile_shard_rates(json.load(f))
+    _shards = compiled
+    return compiled
+
+
+def shard_table():
+    # Compiled on first use if the bot has not loaded it yet (scripts,
+    # benchmarks).
+    return _shards if _shards is not None else load_shard_rates()
+
+
+def shard_rates(shard_type):
+    return shard_table()[shard_type]
+
+
+def shard_types():
+    return tuple(shard_table())
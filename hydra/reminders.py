@@ -0,0 +1,223 @@
+# ============================================================
+#  HYDRA COMPANION — REMINDERS
+# ============================================================
+#
+#  Every reminder is a row in the reminders table with an absolute due
+#  time (unix seconds), so a deploy or crash no longer loses it. The row
+#  id is the reminder number users see and cancel by; ids are never
+#  reused.
+#
+#  Each process delivers the reminders of guilds on its own shards, and
+#  reminders set in DMs belong to whoever runs shard 0, where Discord
+#  sends DMs. At startup it loads them from the store into one TimerHeap
+#  (timers.py): anything that fell due while the bot was down fires
+#  straight away, the rest wait for their due time. Cancelling removes
+#  the reminder from the heap as well as the store.
+#
+#  Due reminders are coalesced per channel: the first one to fall due
+#  in a channel opens a COALESCE_WINDOW, and everything due there by the
+#  time it closes goes out as one message that mentions every user, one
+#  line each, in due order. A clan that all set "remind me 23h" after
+#  the same Hydra warning gets one ping instead of thirty.
+#
+#  Delivery deletes the rows before sending. A reminder cancelled from
+#  another process has no row left and is not sent, and one a restart
+#  already delivered is never sent twice. A send that fails, or is cut
+#  short by stop(), puts the rows back under the same ids: stop() leaves
+#  them for the next start, a failure retries the batch after
+#  RETRY_DELAY. Only a channel that is gone or closed to the bot drops
+#  its reminders. A batch that failed after part of it went out is sent
+#  again in full.
+
+import asyncio
+import time
+from collections import deque
+
+import discord
+
+from .broadcast import chunk_lines
+from .cluster import shard_for_guild
+from .timers import TimerHeap
+
+REMINDER_UNITS = {"m": 60, "h": 3600, "d": 86400}
+
+# A reminder delivered this many seconds after its due time says so.
+LATE_AFTER = 60
+
+COALESCE_WINDOW = 1.0
+RETRY_DELAY = 30
+# Delivery lags kept for stats(), most recent last.
+LAG_SAMPLES = 1000
+
+
+def parse_reminder_time(value):
+    # "10m", "2h" or "1d" in seconds; ValueError with a message for users.
+    unit = value[-1:].lower()
+    amount = value[:-1]
+
+    if not amount.isdigit():
+        raise ValueError("Time must be a number followed by m/h/d.")
+    if unit not in REMINDER_UNITS:
+        raise ValueError("Invalid time unit. Use m, h, or d.")
+    return int(amount) * REMINDER_UNITS[unit]
+
+
+def late_note(due_at, now):
+    return f" (due <t:{due_at}:R>)" if now - due_at >= LATE_AFTER else ""
+
+
+def format_reminders(reminders, now):
+    # reminders: [(reminder_id, user_id, text, due_at)] for one channel, in
+    # due order. Returns the message contents to send, usually just one.
+    if len(reminders) == 1:
+        reminder_id, user_id, text, due_at = reminders[0]
+        return [f"<@{user_id}> 🔔 Reminder #{reminder_id}: **{text}**{late_note(due_at, now)}"]
+    lines = [
+        f"<@{user_id}> #{reminder_id}: **{text}**{late_note(due_at, now)}"
+        for reminder_id, user_id, text, due_at in reminders
+    ]
+    return chunk_lines("🔔 **Reminders**", lines)
+
+
+def owns_reminder(bot, guild_id):
+    # True if this process delivers reminders set in guild_id (None: a DM).
+    if bot.shard_ids is None:
+        return True
+    shard_id = shard_for_guild(guild_id, bot.shard_count) if guild_id else 0
+    return shard_id in bot.shard_ids
+
+
+async def send_reminder(bot, channel_id, content):
+    channel = bot.get_channel(channel_id) or bot.get_partial_messageable(channel_id)
+    await channel.send(content)
+
+
+class Reminders:
+    def __init__(self, db, send, owns, window=COALESCE_WINDOW):
+        # send: async callable(channel_id, content)
+        # owns: callable(guild_id) -> whether this process delivers it
+        self.db = db
+        self.send = send
+        self.owns = owns
+        self.window = window
+        self.timers = TimerHeap(self._deliver_due)
+
+        self._outbox = {}  # channel_id -> [(reminder_id, user_id, text, due_at)]
+        self._flush_tasks = {}  # channel_id -> task sending its outbox
+
+        self.delivered = 0
+        self.messages = 0
+        self._lags = deque(maxlen=LAG_SAMPLES)
+
+    async def start(self):
+        # Loads pending reminders; overdue ones fire on the first wake-up,
+        # oldest first.
+        for reminder_id, user_id, guild_id, channel_id, text, due_at in await self.db.get_reminders():
+            if self.owns(guild_id):
+                self.timers.schedule(reminder_id, due_at, (user_id, channel_id, text))
+        self.timers.start()
+
+    async def stop(self):
+        # Reminders still in an outbox keep their rows, so the next start
+        # delivers them.
+        await self.timers.stop()
+        tasks = list(self._flush_tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def add(self, user_id, guild_id, channel_id, text, seconds):
+        # Returns (reminder_id, due_at). Added before start(), it simply
+        # waits in the heap until the timer task runs.
+        now = int(time.time())
+        due_at = now + seconds
+        reminder_id = await self.db.add_reminder(user_id, guild_id, channel_id, text, due_at, now)
+        self.timers.schedule(reminder_id, due_at, (user_id, channel_id, text))
+        return reminder_id, due_at
+
+    async def cancel(self, user_id, reminder_id):
+        # Reports whether user_id had a pending reminder with that id. One
+        # already waiting in an outbox has lost its row and is skipped.
+        if not await self.db.delete_reminder(reminder_id, user_id):
+            return False
+        self.timers.cancel(reminder_id)
+        return True
+
+    async def list(self, user_id):
+        return await self.db.get_user_reminders(user_id)
+
+    def stats(self):
+        lags = sorted(self._lags)
+        return {
+            "pending": len(self.timers),
+            "delivered": self.delivered,
+            "messages": self.messages,
+            # Reminders per message sent; 1.0 means nothing was coalesced.
+            "coalescing_ratio": self.delivered / self.messages if self.messages else 0.0,
+            "lag_p50": lags[len(lags) // 2] if lags else 0.0,
+            "lag_p95": lags[min(len(lags) - 1, int(len(lags) * 0.95))] if lags else 0.0,
+            "lag_max": lags[-1] if lags else 0.0,
+        }
+
+    async def _deliver_due(self, due):
+        for reminder_id, due_at, (user_id, channel_id, text) in due:
+            self._outbox.setdefault(channel_id, []).append((reminder_id, user_id, text, due_at))
+            if channel_id not in self._flush_tasks:
+                self._flush_tasks[channel_id] = asyncio.create_task(self._flush_channel(channel_id))
+
+    async def _flush_channel(self, channel_id):
+        # One task per channel at a time, so its messages stay in order.
+        # Reminders that fall due while a batch is being sent go out in
+        # the next one.
+        try:
+            await asyncio.sleep(self.window)
+            while self._outbox.get(channel_id):
+                batch = self._outbox.pop(channel_id)
+                if not await self._send_batch(channel_id, batch):
+                    # Ahead of anything that fell due since.
+                    self._outbox[channel_id] = batch + self._outbox.get(channel_id, [])
+                    await asyncio.sleep(RETRY_DELAY)
+        finally:
+            self._flush_tasks.pop(channel_id, None)
+
+    async def _send_batch(self, channel_id, reminders):
+        # Reports False if the batch should be retried; its rows are back
+        # in the store by then. The claim is shielded so that a cancel
+        # cannot lose rows it has already deleted.
+        claim = asyncio.ensure_future(self.db.claim_reminders([reminder[0] for reminder in reminders]))
+        claimed = {}
+        try:
+            claimed = await asyncio.shield(claim)
+            reminders = [reminder for reminder in reminders if reminder[0] in claimed]
+            if not reminders:
+                return True  # cancelled elsewhere, or delivered by an earlier run
+            contents = format_reminders(reminders, int(time.time()))
+            for content in contents:
+                await self.send(channel_id, content)
+        except asyncio.CancelledError:
+            await asyncio.wait([claim])
+            if claim.exception() is None:
+                await self._unclaim(claim.result())
+            raise
+        except (discord.Forbidden, discord.NotFound) as e:
+            print(f"Dropping {len(reminders)} reminder(s) for channel {channel_id}:", e)
+            return True
+        except Exception as e:
+            print(f"Failed to deliver {len(reminders)} reminder(s) to channel {channel_id}, "
+                  f"retrying in {RETRY_DELAY}s:", e)
+            await self._unclaim(claimed)
+            return False
+
+        sent_at = time.time()
+        self.delivered += len(reminders)
+        self.messages += len(contents)
+        self._lags.extend(sent_at - due_at for _, _, _, due_at in reminders)
+        return True
+
+    async def _unclaim(self, claimed):
+        if not claimed:
+            return
+        try:
+            await self.db.restore_reminders(list(claimed.values()))
+        except Exception as e:
+            print(f"Failed to put back {len(claimed)} reminder(s):", e)
@@ -0,0 +1,314 @@
+# ============================================================
+#  HYDRA COMPANION — SETUP WIZARD
+# ============================================================
+#
+#  /admin setup walks an admin through six steps, one view each, saving
+#  every choice as it is made. Few servers ever run it, so the admin
+#  extension imports this module on first use rather than at startup.
+
+import time
+
+import discord
+
+from .clash_schedule import default_schedule_rows, format_clash_schedule, lead_text, next_fire_at
+from .guides import build_commands_guide_embed, build_mercy_guide_embed
+from .suggestions import MessageMeButton, build_suggestion_button_embed
+
+
+class SetupBaseView(discord.ui.View):
+    def __init__(self, owner_id, guild, state):
+        super().__init__(timeout=300)
+        self.owner_id = owner_id
+        self.guild = guild
+        self.state = state
+
+    async def interaction_check(self, interaction):
+        if interaction.user.id != self.owner_id:
+            await interaction.response.send_message("Not your setup wizard.", ephemeral=True)
+            return False
+        return True
+
+
+# ============================================================
+#  STEP 1 — COMMANDS CHANNEL
+# ============================================================
+
+class CommandsChannelView(SetupBaseView):
+    @discord.ui.select(
+        cls=discord.ui.ChannelSelect,
+        channel_types=[discord.ChannelType.text],
+        placeholder="Select the Commands Guide channel..."
+    )
+    async def select_channel(self, interaction: discord.Interaction, select: discord.ui.Select):
+        selected = select.values[0]  # AppCommandChannel
+        channel = interaction.guild.get_channel(selected.id)  # Convert to real channel
+
+        await interaction.client.db.set_guild_channel(self.guild.id, "commands_channel_id", channel.id)
+        self.state["commands_channel"] = channel
+
+        await interaction.response.edit_message(
+            content=f"Commands Guide channel set to {channel.mention}.",
+            view=None
+        )
+
+        await channel.send(embed=build_commands_guide_embed())
+        await start_mercy_step(interaction, self.state)
+
+
+# ============================================================
+#  STEP 2 — MERCY CHANNEL
+# ============================================================
+
+class MercyChannelView(SetupBaseView):
+    @discord.ui.select(
+        cls=discord.ui.ChannelSelect,
+        channel_types=[discord.ChannelType.text],
+        placeholder="Select the Mercy Guide channel..."
+    )
+    async def select_channel(self, interaction: discord.Interaction, select: discord.ui.Select):
+        selected = select.values[0]
+        channel = interaction.guild.get_channel(selected.id)
+
+        await interaction.client.db.set_guild_channel(self.guild.id, "mercy_channel_id", channel.id)
+        self.state["mercy_channel"] = channel
+
+        await interaction.response.edit_message(
+            content=f"Mercy Guide channel set to {channel.mention}.",
+            view=None
+        )
+
+        await channel.send(embed=build_mercy_guide_embed())
+        await start_suggestion_step(interaction, self.state)
+
+
+# ============================================================
+#  STEP 3 — SUGGESTION CHANNEL
+# ============================================================
+
+class SuggestionChannelView(SetupBaseView):
+    @discord.ui.select(
+        cls=discord.ui.ChannelSelect,
+        channel_types=[discord.ChannelType.text],
+        placeholder="Select the Suggestion channel (optional)..."
+    )
+    async def select_channel(self, interaction: discord.Interaction, select: discord.ui.Select):
+        selected = select.values[0]
+        channel = interaction.guild.get_channel(selected.id)
+
+        await interaction.client.db.set_guild_channel(self.guild.id, "suggestion_channel_id", channel.id)
+        self.state["suggestion_channel"] = channel
+
+        await interaction.response.edit_message(
+            content=f"Suggestion channel set to {channel.mention}.",
+            view=None
+        )
+
+        await channel.send(embed=build_suggestion_button_embed(), view=MessageMeButton())
+        await start_feedback_step(interaction, self.state)
+
+    @discord.ui.button(label="Skip this step", style=discord.ButtonStyle.secondary)
+    async def skip_step(self, interaction: discord.Interaction, button):
+        await interaction.client.db.set_guild_channel(self.guild.id, "suggestion_channel_id", None)
+        self.state["suggestion_channel"] = None
+
+        await interaction.response.edit_message(
+            content="Suggestion channel skipped.",
+            view=None
+        )
+
+        await start_feedback_step(interaction, self.state)
+
+
+# ============================================================
+#  STEP 4 — FEEDBACK CHANNEL
+# ============================================================
+
+class FeedbackChannelView(SetupBaseView):
+    @discord.ui.select(
+        cls=discord.ui.ChannelSelect,
+        channel_types=[discord.ChannelType.text],
+        placeholder="Select the Feedback channel (optional)..."
+    )
+    async def select_channel(self, interaction: discord.Interaction, select: discord.ui.Select):
+        selected = select.values[0]
+        channel = interaction.guild.get_channel(selected.id)
+
+        await interaction.client.db.set_guild_channel(self.guild.id, "feedback_channel_id", channel.id)
+        self.state["feedback_channel"] = channel
+
+        await interaction.response.edit_message(
+            content=f"Feedback channel set to {channel.mention}.",
+            view=None
+        )
+
+        await start_warning_step(interaction, self.state)
+
+    @discord.ui.button(label="Skip this step", style=discord.ButtonStyle.secondary)
+    async def skip_step(self, interaction: discord.Interaction, button):
+        await interaction.client.db.set_guild_channel(self.guild.id, "feedback_channel_id", None)
+        self.state["feedback_channel"] = None
+
+        await interaction.response.edit_message(
+            content="Feedback channel skipped.",
+            view=None
+        )
+
+        await start_warning_step(interaction, self.state)
+
+
+# ============================================================
+#  STEP 5 — WARNING CHANNEL
+# ============================================================
+
+class WarningChannelView(SetupBaseView):
+    @discord.ui.select(
+        cls=discord.ui.ChannelSelect,
+        channel_types=[discord.ChannelType.text],
+        placeholder="Select the Hydra Warning channel..."
+    )
+    async def select_channel(self, interaction: discord.Interaction, select: discord.ui.Select):
+        selected = select.values[0]
+        channel = interaction.guild.get_channel(selected.id)
+
+        db = interaction.client.db
+        await db.set_guild_channel(self.guild.id, "warning_channel_id", channel.id)
+        self.state["warning_channel"] = channel
+
+        await interaction.response.edit_message(
+            content=f"Warning channel set to {channel.mention}.",
+            view=None
+        )
+
+        await db.ensure_clash_schedules(default_schedule_rows(self.guild.id))
+        interaction.client.clash_scheduler.wake()
+        await start_clash_schedule_step(interaction, self.state)
+
+
+# ============================================================
+#  STEP 6 — CLASH WARNING TIMING
+# ============================================================
+
+WARNING_LEAD_CHOICES = [
+    (24 * 60, "24 hours before"),
+    (12 * 60, "12 hours before"),
+    (6 * 60, "6 hours before"),
+    (3 * 60, "3 hours before"),
+    (60, "1 hour before"),
+]
+
+
+async def set_warning_lead(bot, guild_id, lead_minutes):
+    now = int(time.time())
+    rows = await bot.db.get_clash_schedules(guild_id) or default_schedule_rows(guild_id, now)
+    await bot.db.set_clash_schedules([
+        (guild_id, event, weekday, local_time, tz_name, lead_minutes,
+         next_fire_at(weekday, local_time, tz_name, lead_minutes, now))
+        for guild_id, event, weekday, local_time, tz_name, _, _ in rows
+    ])
+    bot.clash_scheduler.wake()
+
+
+class ClashScheduleView(SetupBaseView):
+    @discord.ui.select(
+        placeholder="Select when clash warnings go out...",
+        options=[discord.SelectOption(label=label, value=str(minutes)) for minutes, label in WARNING_LEAD_CHOICES]
+    )
+    async def select_lead(self, interaction: discord.Interaction, select: discord.ui.Select):
+        lead_minutes = int(select.values[0])
+        await set_warning_lead(interaction.client, str(self.guild.id), lead_minutes)
+
+        await interaction.response.edit_message(
+            content=f"Clash warnings will go out {lead_text(lead_minutes)} before each clash.",
+            view=None
+        )
+
+        await finish_setup_summary(interaction, self.state)
+
+    @discord.ui.button(label="Keep current timing", style=discord.ButtonStyle.secondary)
+    async def keep_timing(self, interaction: discord.Interaction, button):
+        await interaction.response.edit_message(
+            content="Clash warning timing unchanged.",
+            view=None
+        )
+
+        await finish_setup_summary(interaction, self.state)
+
+# ============================================================
+#  SETUP WIZARD HELPERS
+# ============================================================
+
+async def start_commands_step(interaction, state):
+    view = CommandsChannelView(interaction.user.id, interaction.guild, state)
+    await interaction.response.send_message(
+        "Step 1/6 — Select the **Commands Guide** channel (required):",
+        view=view
+    )
+
+async def start_mercy_step(interaction, state):
+    view = MercyChannelView(interaction.user.id, interaction.guild, state)
+    await interaction.followup.send(
+        "Step 2/6 — Select the **Mercy Guide** channel (required):",
+        view=view
+    )
+
+async def start_suggestion_step(interaction, state):
+    view = SuggestionChannelView(interaction.user.id, interaction.guild, state)
+    await interaction.followup.send(
+        "Step 3/6 — Select the **Suggestion** channel (optional):",
+        view=view
+    )
+
+async def start_feedback_step(interaction, state):
+    view = FeedbackChannelView(interaction.user.id, interaction.guild, state)
+    await interaction.followup.send(
+        "Step 4/6 — Select the **Feedback** channel (optional):",
+        view=view
+    )
+
+async def start_warning_step(interaction, state):
+    view = WarningChannelView(interaction.user.id, interaction.guild, state)
+    await interaction.followup.send(
+        "Step 5/6 — Select the **Hydra Warning** channel (required):",
+        view=view
+    )
+
+async def start_clash_schedule_step(interaction, state):
+    view = ClashScheduleView(interaction.user.id, interaction.guild, state)
+    await interaction.followup.send(
+        "Step 6/6 — When should **clash warnings** go out? "
+        "(Use `/admin clash-schedule` to change clash days, times or timezone.)",
+        view=view
+    )
+
+async def finish_setup_summary(interaction, state):
+    guild = interaction.guild
+    db = interaction.client.db
+    channels = db.get_guild_channels(guild.id)
+
+    def fmt(ch):
+        return ch.mention if isinstance(ch, discord.TextChannel) else "Skipped"
+
+    commands_ch = guild.get_channel(channels["commands_channel_id"]) if channels["commands_channel_id"] else None
+    mercy_ch = guild.get_channel(channels["mercy_channel_id"]) if channels["mercy_channel_id"] else None
+    suggestion_ch = guild.get_channel(channels["suggestion_channel_id"]) if channels["suggestion_channel_id"] else None
+    feedback_ch = guild.get_channel(channels["feedback_channel_id"]) if channels["feedback_channel_id"] else None
+    warning_ch = guild.get_channel(channels["warning_channel_id"]) if channels["warning_channel_id"] else None
+
+    embed = discord.Embed(
+        title="✅ Hydra Companion Setup Complete",
+        color=discord.Color.green()
+    )
+    embed.add_field(name="Commands Guide Channel", value=fmt(commands_ch), inline=False)
+    embed.add_field(name="Mercy Guide Channel", value=fmt(mercy_ch), inline=False)
+    embed.add_field(name="Suggestion Channel", value=fmt(suggestion_ch), inline=False)
+    embed.add_field(name="Feedback Channel", value=fmt(feedback_ch), inline=False)
+    embed.add_field(name="Warning Channel", value=fmt(warning_ch), inline=False)
+
+    schedules = await db.get_clash_schedules(guild.id)
+    embed.add_field(
+        name="Clash Warnings",
+        value="\n".join(format_clash_schedule(row) for row in schedules) or "Not scheduled",
+        inline=False
+    )
+
+    await interaction.followup.send(embed=embed)
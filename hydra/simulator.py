@@ -0,0 +1,161 @@
+# ============================================================
+#  HYDRA COMPANION — PULL SIMULATOR
+# ============================================================
+#
+#  Simulates shard pulls with the same pity rules mercy tracking uses:
+#  every pull rolls against the compiled chance tables (rates.py) at the
+#  current counters, and the counters then move exactly as the
+#  /mercy add-* commands move them.
+#
+#  simulate_until_hit() runs thousands of independent pull sequences
+#  from a user's actual counters and reports how many pulls it took to
+#  reach a legendary (and, on primal shards, a mythical). With NumPy
+#  installed every sequence advances together as one array per counter;
+#  without it the same rules run one sequence at a time, on fewer runs.
+#
+#  Rarities are numbered RARE < EPIC < LEGENDARY < MYTHICAL.
+
+import random
+
+from .rates import shard_rates
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+RARE, EPIC, LEGENDARY, MYTHICAL = range(4)
+RARITIES = ("rare", "epic", "legendary", "mythical")
+
+# A sequence that has not hit by then stops, counted at this many pulls.
+MAX_PULLS = 1000
+
+SIM_RUNS = 10000
+SIM_RUNS_NO_NUMPY = 1000
+
+
+# ------------------------------------------------------------
+#  ONE SEQUENCE
+# ------------------------------------------------------------
+
+def pull_once(rates, counters, roll):
+    # rates: the shard's ShardRates; roll: uniform in [0, 100).
+    # Returns (rarity, new counters).
+    epic, legendary, mythical = counters
+    limit = rates.limit
+    mythical_chance = rates.mythical[min(mythical, limit)]
+    legendary_chance = rates.legendary[min(legendary, limit)]
+    epic_chance = rates.epic[min(epic, limit)]
+
+    if roll < mythical_chance:
+        return MYTHICAL, (0, 0, 0)
+    mythical = mythical + 1 if rates.has_mythical else mythical
+    if roll < mythical_chance + legendary_chance:
+        return LEGENDARY, (0, 0, mythical)
+    if roll < mythical_chance + legendary_chance + epic_chance:
+        return EPIC, (0, legendary + 1, mythical)
+    return RARE, (epic + 1 if rates.tracks_epic else epic, legendary + 1, mythical)
+
+
+def roll_pulls(shard_type, counters, pulls, rng=random):
+    # A single sequence of `pulls` pulls: ([rarity, ...], final counters).
+    rates = shard_rates(shard_type)
+    results = []
+    for _ in range(pulls):
+        rarity, counters = pull_once(rates, counters, rng.random() * 100)
+        results.append(rarity)
+    return results, counters
+
+
+# ------------------------------------------------------------
+#  MANY SEQUENCES
+# ------------------------------------------------------------
+
+def simulate_until_hit(shard_type, counters, runs=None, seed=None):
+    # {"legendary": pulls per run, "mythical": ...} for `runs` sequences
+    # started from `counters`; a legendary means legendary or better.
+    rates = shard_rates(shard_type)
+    if np is None:
+        return _simulate_python(rates, counters, runs or SIM_RUNS_NO_NUMPY, seed)
+    return _simulate_numpy(rates, counters, runs or SIM_RUNS, seed)
+
+
+def summarize(pulls):
+    # Mean, median and 90th percentile of a list of pull counts.
+    ordered = sorted(pulls)
+    return {
+        "mean": sum(ordered) / len(ordered),
+        "p50": ordered[(len(ordered) - 1) // 2],
+        "p90": ordered[min(len(ordered) - 1, int(len(ordered) * 0.9))],
+    }
+
+
+def _targets(rates):
+    return ("legendary", "mythical") if rates.has_mythical else ("legendary",)
+
+
+def _simulate_python(rates, counters, runs, seed):
+    rng = random.Random(seed)
+    targets = _targets(rates)
+    results = {target: [] for target in targets}
+    for _ in range(runs):
+        state = counters
+        hits = {}
+        for pull in range(1, MAX_PULLS + 1):
+            rarity, state = pull_once(rates, state, rng.random() * 100)
+            if rarity >= LEGENDARY:
+                hits.setdefault("legendary", pull)
+            if rarity == MYTHICAL:
+                hits.setdefault("mythical", pull)
+            if len(hits) == len(targets):
+                break
+        for target in targets:
+            results[target].append(hits.get(target, MAX_PULLS))
+    return results
+
+
+def _simulate_numpy(rates, counters, runs, seed):
+    rng = np.random.default_rng(seed)
+    epic_table, legendary_table, mythical_table = (
+        np.asarray(t) for t in (rates.epic, rates.legendary, rates.mythical)
+    )
+    limit = rates.limit
+    targets = _targets(rates)
+    count_epic = rates.tracks_epic
+    count_mythical = rates.has_mythical
+
+    epic, legendary, mythical = (np.full(runs, c, dtype=np.int64) for c in counters)
+    first = {target: np.zeros(runs, dtype=np.int64) for target in targets}  # 0: no hit yet
+    # Indices of the sequences still running; finished ones drop out.
+    live = np.arange(runs)
+
+    for pull in range(1, MAX_PULLS + 1):
+        mythical_cut = mythical_table[np.minimum(mythical, limit)]
+        legendary_cut = mythical_cut + legendary_table[np.minimum(legendary, limit)]
+        epic_cut = legendary_cut + epic_table[np.minimum(epic, limit)]
+        roll = rng.random(len(live)) * 100
+
+        is_mythical = roll < mythical_cut
+        is_legendary = roll < legendary_cut  # legendary or better
+        is_rare = roll >= epic_cut
+
+        if count_epic:
+            epic = np.where(is_rare, epic + 1, 0)
+        legendary = np.where(is_legendary, 0, legendary + 1)
+        if count_mythical:
+            mythical = np.where(is_mythical, 0, mythical + 1)
+
+        done = np.ones(len(live), dtype=bool)
+        for target, hit in (("legendary", is_legendary), ("mythical", is_mythical)):
+            if target not in first:
+                continue
+            hits = first[target]
+            hits[live[hit & (hits[live] == 0)]] = pull
+            done &= hits[live] != 0
+
+        if done.all():
+            break
+        keep = ~done
+        live, epic, legendary, mythical = live[keep], epic[keep], legendary[keep], mythical[keep]
+
+    return {target: np.where(hits == 0, MAX_PULLS, hits).tolist() for target, hits in first.items()}
@@ -0,0 +1,503 @@
+# ============================================================
+#  HYDRA COMPANION — STORAGE SERVICE
+# ============================================================
+#
+#  Handlers await the async methods on Storage. Storage never talks to
+#  the database itself: every query goes through a StorageBackend
+#  (backends.py), either the local SQLite file on its own threads or a
+#  pooled PostgreSQL server, so the event loop is never blocked on I/O.
+#
+#  Mercy and key updates are write-behind: they land in a pending map
+#  (latest value per row wins) and are group-committed in one
+#  transaction every FLUSH_INTERVAL seconds, or sooner once
+#  FLUSH_MAX_PENDING rows are waiting. Reads consult the pending map
+#  first, so callers always see their own writes.
+#
+#  Mercy state is also cached per user (all shards together) in an LRU
+#  capped at MERCY_CACHE_SIZE users. A miss loads the whole user with a
+#  single query; writes update the cached copy in place.
+#
+#  The mercy table is sparse: a missing row means all counters are zero.
+#  Reads never insert, a flush turns an all-zero update into a DELETE, and
+#  compact_mercy() sweeps any leftover all-zero rows in small batches.
+
+import asyncio
+import time
+from collections import OrderedDict
+
+DB_PATH = "mercy.db"
+
+FLUSH_INTERVAL = 0.5
+FLUSH_MAX_PENDING = 256
+
+MERCY_CACHE_SIZE = 5000
+
+EMPTY_MERCY = (0, 0, 0)
+
+GUILD_CHANNEL_FIELDS = (
+    "warning_channel_id",
+    "suggestion_channel_id",
+    "feedback_channel_id",
+    "commands_channel_id",
+    "mercy_channel_id",
+    "key_report_channel_id",
+)
+
+COMPACT_CHUNK = 500
+
+
+class Storage:
+    def __init__(self, backend, mercy_cache_size=MERCY_CACHE_SIZE):
+        # No I/O here: the bot opens storage from setup_hook, inside the loop.
+        self.backend = backend
+        self._guild_channels = {}
+        self._default_feedback_channel_id = None
+
+        self._pending_mercy = {}
+        self._pending_keys = {}
+        self._inflight_mercy = []
+        self._inflight_keys = []
+        self._flush_handle = None
+        self._flush_tasks = set()
+
+        self.rows_flushed = 0
+        self.flushes = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+        self.total_flush_ms = 0.0
+        self.rows_compacted = 0
+
+        self._mercy_cache = OrderedDict()
+        self.mercy_cache_size = mercy_cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_evictions = 0
+
+    async def open(self):
+        await self.backend.open()
+        await self.reload_guild_channels()
+
+    async def close(self):
+        await self.flush()
+        await self.backend.close()
+
+    # ------------------------------------------------------------
+    #  WRITE-BEHIND
+    # ------------------------------------------------------------
+
+    def _take_pending(self):
+        mercy_rows, self._pending_mercy = self._pending_mercy, {}
+        key_rows, self._pending_keys = self._pending_keys, {}
+        return mercy_rows, key_rows
+
+    def _schedule_flush(self):
+        if len(self._pending_mercy) + len(self._pending_keys) >= FLUSH_MAX_PENDING:
+            self._start_flush()
+        elif self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(FLUSH_INTERVAL, self._start_flush)
+
+    def _start_flush(self):
+        task = asyncio.get_running_loop().create_task(self._write_pending())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def flush(self):
+        # Returns once everything queued so far has been written, including
+        # batches a background flush took before this call.
+        await self._write_pending()
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+            # A background flush that failed has put its batch back.
+            await self._write_pending()
+
+    async def _write_pending(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        mercy_rows, key_rows = self._take_pending()
+        if not mercy_rows and not key_rows:
+            return
+
+        upserts = []
+        deletes = []
+        for (user_id, shard), counters in mercy_rows.items():
+            if tuple(counters) == EMPTY_MERCY:
+                deletes.append((user_id, shard))
+            else:
+                upserts.append((user_id, shard, *counters))
+        roster = {}
+        key_usage = []
+        for (guild_id, user_id, boss, epoch), (username, used) in key_rows.items():
+            roster[(guild_id, user_id)] = username
+            key_usage.append((guild_id, user_id, boss, epoch, used))
+        roster_rows = [(guild_id, user_id, username) for (guild_id, user_id), username in roster.items()]
+
+        # Started as its own task and shielded so a batch that has left the
+        # pending map always reaches the database, even during shutdown.
+        start = time.perf_counter()
+        write = asyncio.ensure_future(self.backend.write_batch(upserts, deletes, roster_rows, key_usage))
+        self._inflight_mercy.append(mercy_rows)
+        self._inflight_keys.append(key_rows)
+        try:
+            await asyncio.shield(write)
+        except Exception as e:
+            # Put the batch back unless a newer value has been queued since.
+            for key, value in mercy_rows.items():
+                self._pending_mercy.setdefault(key, value)
+            for key, value in key_rows.items():
+                self._pending_keys.setdefault(key, value)
+            self._schedule_flush()
+            print("Storage flush failed:", e)
+            return
+        finally:
+            self._inflight_mercy = [b for b in self._inflight_mercy if b is not mercy_rows]
+            self._inflight_keys = [b for b in self._inflight_keys if b is not key_rows]
+
+        elapsed = (time.perf_counter() - start) * 1000
+        self.flushes += 1
+        self.rows_flushed += len(mercy_rows) + len(key_rows)
+        self.last_flush_ms = elapsed
+        self.max_flush_ms = max(self.max_flush_ms, elapsed)
+        self.total_flush_ms += elapsed
+
+    def write_stats(self):
+        return {
+            "backend": self.backend.name,
+            "commits": self.backend.commits,
+            "commits_per_second": self.backend.commits_per_second(),
+            "flushes": self.flushes,
+            "rows_flushed": self.rows_flushed,
+            "pending_rows": len(self._pending_mercy) + len(self._pending_keys),
+            "last_flush_ms": self.last_flush_ms,
+            "avg_flush_ms": self.total_flush_ms / self.flushes if self.flushes else 0.0,
+            "max_flush_ms": self.max_flush_ms,
+            "rows_compacted": self.rows_compacted,
+        }
+
+    def cache_stats(self):
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "size": len(self._mercy_cache),
+            "capacity": self.mercy_cache_size,
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_ratio": self.cache_hits / lookups if lookups else 0.0,
+            "evictions": self.cache_evictions,
+        }
+
+    # ------------------------------------------------------------
+    #  MERCY
+    # ------------------------------------------------------------
+
+    async def get_users_mercy(self, user_ids):
+        # Returns {user_id: {shard: (epic, legendary, mythical)}} for every
+        # requested user; shards with no row are simply absent. All cache
+        # misses are loaded together with one IN (...) query.
+        keys = {user_id: str(user_id) for user_id in user_ids}
+        states = {}
+        missing = []
+
+        for key in dict.fromkeys(keys.values()):
+            state = self._mercy_cache.get(key)
+            if state is not None:
+                self._mercy_cache.move_to_end(key)
+                self.cache_hits += 1
+                states[key] = state
+            else:
+                self.cache_misses += 1
+                missing.append(key)
+
+        if missing:
+            # A flush may commit (and drop its batch) while the read is out,
+            # after the read took its snapshot. So the batches queued before
+            # the read are kept here and layered over it along with any
+            # queued since, oldest first, skipping repeats.
+            earlier = [*self._inflight_mercy, self._pending_mercy]
+            loaded = await self.backend.load_users_mercy(missing)
+
+            batches = []
+            for batch in (*earlier, *self._inflight_mercy, self._pending_mercy):
+                if not any(batch is seen for seen in batches):
+                    batches.append(batch)
+            for batch in batches:
+                for (user_id, shard), counters in batch.items():
+                    if user_id in loaded:
+                        loaded[user_id][shard] = counters
+
+            for key, state in loaded.items():
+                cached = self._mercy_cache.get(key)
+                if cached is not None:
+                    states[key] = cached
+                    continue
+                self._mercy_cache[key] = state
+                states[key] = state
+
+            while len(self._mercy_cache) > self.mercy_cache_size:
+                self._mercy_cache.popitem(last=False)
+                self.cache_evictions += 1
+
+        return {user_id: states[key] for user_id, key in keys.items()}
+
+    async def get_user_mercy(self, user_id):
+        return (await self.get_users_mercy([user_id]))[user_id]
+
+    async def compact_mercy(self):
+        # One short transaction per chunk so live commands interleave with
+        # the sweep instead of waiting behind it.
+        deleted = 0
+        while True:
+            count = await self.backend.compact_mercy(COMPACT_CHUNK)
+            deleted += count
+            if count < COMPACT_CHUNK:
+                break
+        self.rows_compacted += deleted
+        if deleted:
+            await self.backend.after_compaction()
+        return deleted
+
+    async def get_mercy_row(self, user_id, shard_type):
+        shard_type = shard_type.lower()
+        state = await self.get_user_mercy(user_id)
+        return state.get(shard_type, EMPTY_MERCY)
+
+    async def set_mercy_row(self, user_id, shard_type, epic, legendary, mythical):
+        user_id = str(user_id)
+        shard_type = shard_type.lower()
+        self._pending_mercy[(user_id, shard_type)] = (epic, legendary, mythical)
+        state = self._mercy_cache.get(user_id)
+        if state is not None:
+            state[shard_type] = (epic, legendary, mythical)
+        self._schedule_flush()
+
+    # ------------------------------------------------------------
+    #  GUILD CHANNELS
+    # ------------------------------------------------------------
+
+    # Guild configuration is tiny and read on every broadcast, so the whole
+    # table lives in memory: loaded in one pass at startup, updated by
+    # set_guild_channel, and re-read by reload_guild_channels.
+
+    def _refresh_default_feedback_channel(self):
+        # The configured guild with the lowest id wins, so the answer is the
+        # same on every backend.
+        self._default_feedback_channel_id = next(
+            (int(channels["feedback_channel_id"])
+             for channels in self._guild_channels.values()
+             if channels["feedback_channel_id"]),
+            None
+        )
+
+    async def reload_guild_channels(self):
+        rows = await self.backend.load_guild_channels(GUILD_CHANNEL_FIELDS)
+        self._guild_channels = {row[0]: dict(zip(GUILD_CHANNEL_FIELDS, row[1:])) for row in rows}
+        self._refresh_default_feedback_channel()
+        return len(self._guild_channels)
+
+    async def set_guild_channel(self, guild_id, field, channel_id):
+        if field not in GUILD_CHANNEL_FIELDS:
+            raise ValueError(f"Unknown guild channel field: {field}")
+
+        channels = self._guild_channels.setdefault(str(guild_id), dict.fromkeys(GUILD_CHANNEL_FIELDS))
+        channels[field] = channel_id
+        if field == "feedback_channel_id":
+            self._refresh_default_feedback_channel()
+
+        await self.backend.set_guild_channel(guild_id, field, channel_id)
+
+    def get_guild_channels(self, guild_id):
+        channels = self._guild_channels.get(str(guild_id))
+        if channels is None:
+            return dict.fromkeys(GUILD_CHANNEL_FIELDS)
+        return dict(channels)
+
+    def get_configured_guilds(self, field):
+        # [(guild_id, channel_id)] for every guild that has `field` set.
+        return [(guild_id, channels[field]) for guild_id, channels in self._guild_channels.items()
+                if channels[field]]
+
+    def get_default_feedback_channel_id(self):
+        return self._default_feedback_channel_id
+
+    # ------------------------------------------------------------
+    #  KEYS
+    # ------------------------------------------------------------
+
+    # Key usage is tracked per guild, user, boss and weekly epoch (see
+    # key_epochs.py): the same member has a separate allowance in every
+    # server, and a new week starts from zero without touching old rows.
+
+    async def get_key_row(self, guild_id, user_id, epochs):
+        # Returns (hydra_used, chimera_used) for the given epochs.
+        guild_id, user_id = str(guild_id), str(user_id)
+        used = {}
+        for boss, epoch in epochs.items():
+            key = (guild_id, user_id, boss, epoch)
+            for batch in (self._pending_keys, *reversed(self._inflight_keys)):
+                if key in batch:
+                    used[boss] = batch[key][1]
+                    break
+
+        if len(used) < len(epochs):
+            stored = await self.backend.get_key_row(guild_id, user_id, epochs)
+            for boss, count in stored.items():
+                used.setdefault(boss, count)
+
+        return used.get("hydra", 0), used.get("chimera", 0)
+
+    async def set_key_used(self, guild_id, user_id, username, boss, epoch, used):
+        self._pending_keys[(str(guild_id), str(user_id), boss, epoch)] = (username, used)
+        self._schedule_flush()
+
+    async def get_key_usage(self, guild_id, epochs):
+        # [(user_id, username, hydra_used, chimera_used)]; username is the
+        # display name when the user last logged a key. Flushes first so
+        # the report never misses a queued update.
+        await self.flush()
+        return await self.backend.get_key_usage(guild_id, epochs)
+
+    async def adopt_legacy_keys(self, guild_id):
+        await self.flush()
+        await self.backend.adopt_legacy_keys(guild_id)
+
+    async def snapshot_key_usage(self, guild_id, boss, epoch, taken_at):
+        # Copies one guild's week into key_report_snapshots; past weeks are
+        # then read from there instead of re-joining the live tables.
+        await self.flush()
+        await self.backend.snapshot_key_usage(guild_id, boss, epoch, taken_at)
+
+    async def get_key_snapshot(self, guild_id, boss, epoch):
+        # [(username, used)] for a snapshotted week, or [] if there is none.
+        return await self.backend.get_key_snapshot(guild_id, boss, epoch)
+
+    # ------------------------------------------------------------
+    #  CLASH SCHEDULES
+    # ------------------------------------------------------------
+
+    # Read and written straight through: the clash scheduler loop (see
+    # clash_schedule.py) reads the next_fire_at index, not a cache.
+
+    async def get_clash_schedules(self, guild_id):
+        return await self.backend.get_clash_schedules(guild_id)
+
+    async def get_due_clash_schedules(self, now):
+        return await self.backend.get_due_clash_schedules(now)
+
+    async def get_next_clash_fire(self):
+        return await self.backend.get_next_clash_fire()
+
+    async def set_clash_schedules(self, rows):
+        await self.backend.set_clash_schedules(rows)
+
+    async def ensure_clash_schedules(self, rows):
+        # Inserts rows for events the guild has no schedule for yet.
+        await self.backend.set_clash_schedules(rows, replace=False)
+
+    async def advance_clash_schedules(self, rows):
+        await self.backend.advance_clash_schedules(rows)
+
+    # ------------------------------------------------------------
+    #  BROADCAST LEDGER
+    # ------------------------------------------------------------
+
+    # Written straight through, never queued: the ledger is what a
+    # restarted broadcast resumes from (see broadcast.py).
+
+    async def start_broadcast(self, run_id, name, started_at, targets):
+        # Returns the run's original start time if it already existed.
+        return await self.backend.start_broadcast(run_id, name, started_at, targets)
+
+    async def claim_deliveries(self, run_id, holder, now, stale_before):
+        return await self.backend.claim_deliveries(run_id, holder, now, stale_before)
+
+    async def release_deliveries(self, run_id, holder):
+        await self.backend.release_deliveries(run_id, holder)
+
+    async def record_delivery(self, run_id, guild_id, part, status, message_id=None, error=None,
+                              attempts=0, latency_ms=None):
+        await self.backend.record_delivery(run_id, guild_id, part, status, message_id, error, attempts, latency_ms)
+
+    async def finish_broadcast(self, run_id, finished_at):
+        # Reports whether the run is now finished.
+        return await self.backend.finish_broadcast(run_id, finished_at)
+
+    async def expire_broadcast(self, run_id, finished_at):
+        await self.backend.expire_broadcast(run_id, finished_at)
+
+    async def get_unfinished_broadcasts(self):
+        return await self.backend.get_unfinished_broadcasts()
+
+    async def get_broadcast_stats(self, limit=10):
+        return await self.backend.get_broadcast_stats(limit)
+
+    # ------------------------------------------------------------
+    #  SCHEDULED JOBS
+    # ------------------------------------------------------------
+
+    async def get_job_runs(self):
+        # {job_id: unix time the job last started}
+        return await self.backend.get_job_runs()
+
+    async def record_job_run(self, job_id, ran_at):
+        await self.backend.record_job_run(job_id, ran_at)
+
+    # ------------------------------------------------------------
+    #  CLUSTER
+    # ------------------------------------------------------------
+
+    # Straight through: leases only mean anything if every worker sees the
+    # same row (see cluster.py).
+
+    async def acquire_lease(self, name, holder, now, ttl):
+        return await self.backend.acquire_lease(name, holder, now, ttl)
+
+    async def release_lease(self, name, holder):
+        await self.backend.release_lease(name, holder)
+
+    async def get_lease(self, name):
+        return await self.backend.get_lease(name)
+
+    async def bump_reload_version(self, name):
+        # Returns the new version.
+        return await self.backend.bump_reload_version(name)
+
+    async def get_reload_version(self, name):
+        return await self.backend.get_reload_version(name)
+
+    async def set_shard_stats(self, rows):
+        await self.backend.set_shard_stats(rows)
+
+    async def get_shard_stats(self):
+        return await self.backend.get_shard_stats()
+
+    # ------------------------------------------------------------
+    #  REMINDERS
+    # ------------------------------------------------------------
+
+    # Straight through: a reminder is only safe from a restart once its
+    # row is committed (see reminders.py).
+
+    async def add_reminder(self, user_id, guild_id, channel_id, text, due_at, created_at):
+        # Returns the new reminder's id.
+        return await self.backend.add_reminder(user_id, guild_id, channel_id, text, due_at, created_at)
+
+    async def get_user_reminders(self, user_id):
+        # [(id, text, due_at)], soonest first.
+        return await self.backend.get_user_reminders(user_id)
+
+    async def get_reminders(self):
+        # Every pending reminder: [(id, user_id, guild_id, channel_id, text, due_at)].
+        return await self.backend.get_reminders()
+
+    async def delete_reminder(self, reminder_id, user_id=None):
+        return await self.backend.delete_reminder(reminder_id, user_id)
+
+    async def claim_reminders(self, reminder_ids):
+        # Deletes the reminders for delivery; returns {id: row} for those
+        # still pending.
+        return await self.backend.claim_reminders(list(reminder_ids))
+
+    async def restore_reminders(self, rows):
+        # Undoes claim_reminders() for a delivery that did not happen.
+        await self.backend.restore_reminders(rows)
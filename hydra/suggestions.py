@@ -0,0 +1,85 @@
+# ============================================================
+#  HYDRA COMPANION — ANONYMOUS SUGGESTIONS
+# ============================================================
+#
+#  A "Message Me" button opens a DM with the bot; anything sent there is
+#  echoed back for confirmation and, once confirmed, posted without a
+#  name to the feedback channel.
+
+import discord
+
+from .config import SUGGESTION_CHANNEL_ID
+
+
+def get_default_feedback_channel_id(db):
+    channel_id = db.get_default_feedback_channel_id()
+    if channel_id:
+        return channel_id
+    return SUGGESTION_CHANNEL_ID
+
+
+def build_suggestion_button_embed():
+    return discord.Embed(
+        title="💡 Anonymous Suggestions",
+        description=(
+            "Want to submit feedback privately?\n"
+            "Click the button below and I'll open a DM where you can send your anonymous suggestion."
+        ),
+        color=discord.Color.green()
+    )
+
+
+class SuggestionConfirmView(discord.ui.View):
+    def __init__(self, user_id, suggestion):
+        super().__init__(timeout=120)
+        self.user_id = user_id
+        self.suggestion = suggestion
+
+    @discord.ui.button(label="Submit Anonymously", style=discord.ButtonStyle.green)
+    async def submit_button(self, interaction, button):
+        if interaction.user.id != self.user_id:
+            return await interaction.response.send_message("Not your confirmation.", ephemeral=True)
+        channel = interaction.client.get_channel(get_default_feedback_channel_id(interaction.client.db))
+        if not channel:
+            return await interaction.response.edit_message(content="Feedback channel misconfigured.", view=None)
+        embed = discord.Embed(
+            title="💡 New Anonymous Suggestion",
+            description=self.suggestion,
+            color=discord.Color.green()
+        )
+        embed.set_footer(text="Anonymous submission")
+        await channel.send(embed=embed)
+        await interaction.response.edit_message(content="Suggestion submitted.", view=None)
+
+    @discord.ui.button(label="Cancel", style=discord.ButtonStyle.red)
+    async def cancel_button(self, interaction, button):
+        if interaction.user.id != self.user_id:
+            return await interaction.response.send_message("Not your confirmation.", ephemeral=True)
+        await interaction.response.edit_message(content="Cancelled.", view=None)
+
+class MessageMeButton(discord.ui.View):
+    def __init__(self):
+        super().__init__(timeout=None)
+
+    @discord.ui.button(label="Message Me", style=discord.ButtonStyle.primary)
+    async def message_me(self, interaction, button):
+        try:
+            await interaction.user.send("Send your anonymous suggestion here.")
+            await interaction.response.send_message("DM sent.", ephemeral=True)
+        except discord.Forbidden:
+            await interaction.response.send_message("Enable DMs first.", ephemeral=True)
+
+
+async def confirm_anonymous_suggestion(message):
+    suggestion = message.content
+    embed = discord.Embed(
+        title="Confirm Anonymous Suggestion",
+        description=(
+            "You wrote:\n\n"
+            f"**{suggestion}**\n\n"
+            "Would you like to submit this anonymously?"
+        ),
+        color=discord.Color.blue()
+    )
+    view = SuggestionConfirmView(message.author.id, suggestion)
+    await message.author.send(embed=embed, view=view)
@@ -0,0 +1,205 @@
+# ============================================================
+#  HYDRA COMPANION — SCHEDULED TASKS
+# ============================================================
+#
+#  Clash warnings, weekly key reports and the leader duties that start
+#  and stop them. Everything takes the bot (app.HydraBot) first; the bot
+#  binds it with functools.partial when it wires these up.
+#
+#  Warning times are per guild (clash_schedules table). The clash
+#  scheduler pops whichever guilds are due and hands them here, grouped
+#  by event and lead. Every broadcast goes through the delivery ledger
+#  (broadcast.py); run ids name the occurrence, so a re-run only reaches
+#  guilds not yet sent to.
+#
+#  Broadcasts run on the scheduler leader (cluster.py), which may not
+#  hold the shard a guild lives on. Guilds on this process's shards are
+#  checked against the cache; the rest are sent to through the REST API,
+#  and a deleted channel there is recorded as a failed delivery instead.
+
+import time
+from functools import partial
+
+from .broadcast import broadcast, chunk_lines, resume_broadcasts
+from .clash_schedule import lead_label
+from .cluster import shard_for_guild
+from .config import MAX_KEYS
+from .jobs import catch_up_missed_jobs, schedule_job
+from .key_epochs import KEY_RESETS, current_key_epochs
+
+
+def is_local_guild(bot, guild_id):
+    return shard_for_guild(guild_id, bot.shard_count or 1) in bot.shards
+
+
+def broadcast_channel(bot, channel_id):
+    channel = bot.get_channel(channel_id)
+    if channel is None and bot.shard_ids is not None:
+        channel = bot.get_partial_messageable(channel_id)
+    return channel
+
+
+def target_channel(bot, guild_id, channel_id):
+    # channel_id if a broadcast to it is worth attempting, else None.
+    if not channel_id:
+        return None
+    if not is_local_guild(bot, guild_id):
+        return channel_id
+    guild = bot.get_guild(int(guild_id))
+    if not guild or not guild.get_channel(channel_id):
+        return None  # bot left, channel deleted or missing permissions
+    return channel_id
+
+
+def get_warning_targets(bot, guild_ids, content):
+    targets = []
+    for guild_id in guild_ids:
+        channel_id = target_channel(bot, guild_id, bot.db.get_guild_channels(guild_id).get("warning_channel_id"))
+
+        # Skip servers without a usable warning channel
+        if not channel_id:
+            continue
+
+        targets.append((int(guild_id), channel_id, content))
+    return targets
+
+
+async def send_clash_warning(bot, event, lead_minutes, fire_at, guild_ids):
+    text = (
+        f"@everyone {lead_label(lead_minutes)} WARNING FOR {event.upper()} CLASH, "
+        "Don't forget or you'll miss out on rewards!"
+    )
+    # Channels may have been changed on another worker since startup.
+    await bot.db.reload_guild_channels()
+    await broadcast(
+        bot.db,
+        f"{event}-warning:{lead_minutes}:{fire_at}",
+        f"{event}-warning",
+        get_warning_targets(bot, guild_ids, text),
+        partial(broadcast_channel, bot)
+    )
+
+# ============================================================
+#  WEEKLY KEY REPORTS
+# ============================================================
+
+# Each server reports to its own key report channel. There is nothing to
+# reset: usage is stored per weekly epoch (key_epochs.py), so these jobs
+# fire on the reset and report the week that just closed. That week is
+# first frozen into key_report_snapshots, which /keys history reads, and
+# a long roster is split over as many messages as it needs.
+
+def get_key_report_targets(bot):
+    # [(guild_id, channel_id)] for every server with a usable report channel.
+    targets = []
+    for guild_id, channel_id in bot.db.get_configured_guilds("key_report_channel_id"):
+        channel_id = target_channel(bot, guild_id, channel_id)
+        if channel_id:
+            targets.append((int(guild_id), channel_id))
+    return targets
+
+
+def previous_key_epochs():
+    return {boss: epoch - 1 for boss, epoch in current_key_epochs().items()}
+
+
+async def send_key_report(bot, boss):
+    epoch = previous_key_epochs()[boss]
+    taken_at = int(time.time())
+    max_keys = MAX_KEYS[boss]
+    targets = []
+
+    await bot.db.reload_guild_channels()
+    for guild_id, channel_id in get_key_report_targets(bot):
+        await bot.db.snapshot_key_usage(guild_id, boss, epoch, taken_at)
+        rows = await bot.db.get_key_snapshot(guild_id, boss, epoch)
+
+        if not rows:
+            content = f"{boss.capitalize()} key report: no data recorded this week."
+        else:
+            lines = [f"{username}: {used}/{max_keys} used" for username, used in rows]
+            content = chunk_lines(f"**Weekly {boss.capitalize()} Key Usage Report**", lines)
+        targets.append((guild_id, channel_id, content))
+
+    await broadcast(
+        bot.db, f"{boss}-key-report:{epoch}", f"{boss}-key-report", targets, partial(broadcast_channel, bot)
+    )
+
+# ============================================================
+#  JOBS AND LEADER DUTIES
+# ============================================================
+
+def register_jobs(bot):
+    # Runs once, from setup_hook. Stable ids plus replace_existing keep
+    # registration idempotent; see jobs.py for misfire and catch-up rules.
+    # Clash warnings are not jobs here: the clash scheduler runs them per
+    # guild.
+    jobs = []
+
+    # Weekly key reports fire on each boss's key reset (key_epochs.KEY_RESETS).
+    for boss in ("hydra", "chimera"):
+        weekday, hour, minute = KEY_RESETS[boss]
+        jobs.append(schedule_job(bot.scheduler, bot.db, f"{boss}_key_report", partial(send_key_report, bot, boss),
+                                 "cron", day_of_week=weekday, hour=hour, minute=minute))
+
+    # Sweep all-zero mercy rows left behind by clears
+    bot.scheduler.add_job(
+        bot.db.compact_mercy,
+        "interval",
+        hours=6,
+        id="compact_mercy",
+        replace_existing=True
+    )
+
+    return jobs
+
+
+async def start_leader_duties(bot):
+    # Interrupted broadcasts are finished and missed runs caught up first,
+    # then the schedulers start (or resume, after a lost lease).
+    await bot.db.reload_guild_channels()
+    await resume_broadcasts(bot.db, partial(broadcast_channel, bot))
+    await catch_up_missed_jobs(bot.db, bot.scheduled_jobs)
+    if bot.scheduler.running:
+        bot.scheduler.resume()
+    else:
+        bot.scheduler.start()
+    bot.clash_scheduler.start()
+
+
+async def stop_leader_duties(bot):
+    if bot.scheduler.running:
+        bot.scheduler.pause()
+    await bot.clash_scheduler.stop()
+
+
+async def cluster_heartbeat(bot):
+    await publish_shard_stats(bot)
+    await follow_rates_reloads(bot)
+
+
+async def follow_rates_reloads(bot):
+    # $reloadrates on any worker bumps the shared shard_rates version;
+    # the others reload the same file on their next heartbeat.
+    version = await bot.db.get_reload_version("shard_rates")
+    if version == bot.rates_version:
+        return
+    bot.rates_version = version
+    try:
+        compiled = bot.load_rates()
+    except (OSError, ValueError) as e:
+        print("Following a shard rates reload failed:", e)
+        return
+    print(f"Shard rates reloaded for {', '.join(compiled)}")
+
+
+async def publish_shard_stats(bot):
+    now = int(time.time())
+    counts = {}
+    for guild in bot.guilds:
+        counts[guild.shard_id] = counts.get(guild.shard_id, 0) + 1
+    await bot.db.set_shard_stats([
+        (shard_id, bot.cluster_id, counts.get(shard_id, 0),
+         None if shard.latency == float("inf") else int(shard.latency * 1000), now)
+        for shard_id, shard in bot.shards.items()
+    ])
@@ -0,0 +1,126 @@
+# ============================================================
+#  HYDRA COMPANION — TIMER HEAP
+# ============================================================
+#
+#  One task waits on any number of timers. Timers sit in a min-heap
+#  ordered by due time (unix seconds); the task sleeps until the earliest
+#  one is due, pops every timer that is, and hands them to `fire` as one
+#  batch. Scheduling and cancelling are O(log n), and a pending timer
+#  costs a heap entry, not a task and an event-loop handle of its own.
+#
+#  Cancelling forgets the key and marks its heap entry dead, so it can
+#  never fire. Dead entries are dropped when they reach the top of the
+#  heap, or all at once when they come to outnumber the live ones.
+#
+#  Batches are fired one at a time, in due order, off the timer task: a
+#  slow `fire` holds up later batches but never the timers themselves.
+
+import asyncio
+import heapq
+import itertools
+import time
+
+_CANCELLED = object()
+
+
+class TimerHeap:
+    def __init__(self, fire):
+        # fire: async callable([(key, due_at, payload), ...])
+        self.fire = fire
+        self._heap = []  # [due_at, seq, key, payload]
+        self._entries = {}
+        self._dead = 0
+        self._seq = itertools.count()
+        self._wake = asyncio.Event()
+        self._firing = asyncio.Lock()
+        self._fire_tasks = set()
+        self._task = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        tasks = list(self._fire_tasks)
+        if self._task is not None:
+            tasks.append(self._task)
+            self._task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def schedule(self, key, due_at, payload=None):
+        # Replaces any pending timer with the same key.
+        self.cancel(key)
+        entry = [due_at, next(self._seq), key, payload]
+        self._entries[key] = entry
+        heapq.heappush(self._heap, entry)
+        if self._heap[0] is entry:
+            self._wake.set()
+
+    def cancel(self, key):
+        # Reports whether a pending timer was cancelled.
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        entry[3] = _CANCELLED
+        self._dead += 1
+        if self._dead > len(self._entries):
+            self._heap = [e for e in self._heap if e[3] is not _CANCELLED]
+            heapq.heapify(self._heap)
+            self._dead = 0
+        return True
+
+    def next_due(self):
+        self._drop_dead()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now):
+        # Every live timer due at or before `now`, in due order.
+        due = []
+        while self.next_due() is not None and self._heap[0][0] <= now:
+            due_at, _, key, payload = heapq.heappop(self._heap)
+            del self._entries[key]
+            due.append((key, due_at, payload))
+        return due
+
+    def _drop_dead(self):
+        while self._heap and self._heap[0][3] is _CANCELLED:
+            heapq.heappop(self._heap)
+            self._dead -= 1
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            self._wake.clear()
+            due = self.pop_due(time.time())
+            if due:
+                task = asyncio.create_task(self._fire(due))
+                self._fire_tasks.add(task)
+                task.add_done_callback(self._fire_tasks.discard)
+
+            # A loop timer rather than wait_for(), which can swallow a
+            # cancel that lands as the event is set and so hang stop().
+            next_at = self.next_due()
+            timer = None
+            if next_at is not None:
+                timer = loop.call_at(loop.time() + max(next_at - time.time(), 0), self._wake.set)
+            try:
+                await self._wake.wait()
+            finally:
+                if timer is not None:
+                    timer.cancel()
+
+    async def _fire(self, due):
+        # The lock is FIFO, so batches go out in the order they fell due.
+        async with self._firing:
+            try:
+                await self.fire(due)
+            except Exception as e:
+                print("Timer callback failed:", e)
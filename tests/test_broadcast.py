@@ -0,0 +1,112 @@
+import asyncio
+
+from hydra.backends import SQLiteBackend
+from hydra.broadcast import broadcast, resume_broadcasts
+from hydra.storage import Storage
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def open_storage(tmp_path):
+    db = Storage(SQLiteBackend(str(tmp_path / "mercy.db")))
+    await db.open()
+    return db
+
+
+class Message:
+    def __init__(self, message_id):
+        self.id = message_id
+
+
+class Channel:
+    def __init__(self, sent, hold=None):
+        # hold: an Event every send waits on before going out.
+        self.sent = sent
+        self.hold = hold
+
+    async def send(self, content):
+        if self.hold is not None:
+            await self.hold.wait()
+        self.sent.append(content)
+        return Message(len(self.sent))
+
+
+def targets(count):
+    return [(guild_id, guild_id, f"hello {guild_id}") for guild_id in range(1, count + 1)]
+
+
+def test_cancelled_broadcast_resumes_where_it_stopped(tmp_path):
+    async def scenario():
+        db = await open_storage(tmp_path)
+        sent = []
+        stuck = asyncio.Event()
+        channels = {1: Channel(sent), 2: Channel(sent, hold=stuck), 3: Channel(sent)}
+
+        task = asyncio.create_task(broadcast(db, "run", "test", targets(3), channels.get, concurrency=1))
+        while sent != ["hello 1"]:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        assert [run_id for run_id, _, _ in await db.get_unfinished_broadcasts()] == ["run"]
+
+        # The same process, straight away: nothing is left claimed.
+        stuck.set()
+        await resume_broadcasts(db, channels.get)
+        assert sorted(sent) == ["hello 1", "hello 2", "hello 3"]
+        assert await db.get_unfinished_broadcasts() == []
+        await db.close()
+
+    run(scenario())
+
+
+def test_stale_claims_are_taken_over_by_any_worker_including_their_own(tmp_path):
+    # A claim left behind when releasing it failed (the store was down).
+    async def scenario():
+        db = await open_storage(tmp_path)
+        await db.start_broadcast("run", "test", 100, [(1, 1, 0, "hello")])
+        assert len(await db.claim_deliveries("run", "a:1", 100, 80)) == 1
+
+        assert await db.claim_deliveries("run", "a:1", 110, 90) == []
+        assert await db.claim_deliveries("run", "b:2", 110, 90) == []
+        assert len(await db.claim_deliveries("run", "a:1", 130, 110)) == 1
+        await db.close()
+
+    run(scenario())
+
+
+def test_starting_a_run_again_only_sends_what_is_pending(tmp_path):
+    async def scenario():
+        db = await open_storage(tmp_path)
+        sent = []
+        channels = {1: Channel(sent), 2: Channel(sent)}
+        await db.start_broadcast("run", "test", 100, [(1, 1, 0, "hello 1"), (2, 2, 0, "hello 2")])
+        await db.record_delivery("run", 1, 0, "sent", message_id=1, attempts=1)
+
+        await resume_broadcasts(db, channels.get, now=200)
+        await broadcast(db, "run", "test", targets(2), channels.get)
+        assert sent == ["hello 2"]
+        assert await db.get_unfinished_broadcasts() == []
+        await db.close()
+
+    run(scenario())
+
+
+def test_runs_too_old_to_resume_are_expired(tmp_path):
+    async def scenario():
+        db = await open_storage(tmp_path)
+        sent = []
+        await db.start_broadcast("run", "test", 100, [(1, 1, 0, "hello 1"), (2, 2, 0, "hello 2")])
+        await db.record_delivery("run", 1, 0, "sent", message_id=1, attempts=1)
+
+        await resume_broadcasts(db, {1: Channel(sent), 2: Channel(sent)}.get, now=100 + 7 * 3600)
+        assert sent == []
+        assert await db.get_unfinished_broadcasts() == []
+        [stats] = await db.get_broadcast_stats(limit=10)
+        # finished_at, targets, sent, failed, pending
+        assert tuple(stats[3:8]) == (100 + 7 * 3600, 2, 1, 1, 0)
+        await db.close()
+
+    run(scenario())
@@ -0,0 +1,51 @@
+import asyncio
+
+import pytest
+
+from hydra.backends import SQLiteBackend
+from hydra.clash_schedule import ClashScheduler
+from hydra.storage import Storage
+
+# Wednesday 14 October 2026, 11:00 in London (BST).
+CLASH_AT = 1791972000
+DAY = 24 * 3600
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def open_storage(tmp_path):
+    db = Storage(SQLiteBackend(str(tmp_path / "mercy.db")))
+    await db.open()
+    return db
+
+
+def schedule(guild_id, lead_minutes):
+    return (guild_id, "hydra", 2, "11:00", "Europe/London", lead_minutes, CLASH_AT - lead_minutes * 60)
+
+
+def test_a_failed_warning_run_stays_due(tmp_path):
+    async def scenario():
+        db = await open_storage(tmp_path)
+        await db.set_clash_schedules([schedule("1", 24 * 60), schedule("2", 60)])
+        fired = []
+
+        async def fire(event, lead, fire_at, guild_ids):
+            fired.append(guild_ids)
+            if lead == 60 and len(fired) == 2:
+                raise OSError("connection reset")
+
+        scheduler = ClashScheduler(db, fire)
+        now = CLASH_AT - 30 * 60
+        with pytest.raises(RuntimeError):
+            await scheduler.fire_due(now)
+        assert [row[0] for row in await db.get_due_clash_schedules(now)] == ["2"]
+
+        await scheduler.fire_due(now + 60)
+        assert fired == [["1"], ["2"], ["2"]]
+        assert await db.get_due_clash_schedules(now + 60) == []
+        assert await db.get_next_clash_fire() == CLASH_AT + 7 * DAY - 24 * 3600
+        await db.close()
+
+    run(scenario())
@@ -0,0 +1,48 @@
+import asyncio
+
+from hydra.backends import SQLiteBackend
+from hydra.cluster import LEASE_TTL, LeaderElection
+from hydra.storage import Storage
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def election(db, holder, log):
+    async def elected():
+        log.append(f"{holder} elected")
+
+    async def demoted():
+        log.append(f"{holder} demoted")
+
+    leader = LeaderElection(db, "scheduler", elected, demoted)
+    leader.holder = holder
+    return leader
+
+
+def test_lease_passes_to_another_worker_once_it_lapses(tmp_path):
+    async def scenario():
+        db = Storage(SQLiteBackend(str(tmp_path / "mercy.db")))
+        await db.open()
+        log = []
+        a, b = election(db, "a:1", log), election(db, "b:2", log)
+
+        await a.tick(now=1000)
+        await b.tick(now=1000)
+        await a.tick(now=1010)                  # renewed until 1010 + LEASE_TTL
+        await b.tick(now=1000 + LEASE_TTL + 1)  # the first lease would have lapsed
+        await asyncio.sleep(0)
+        assert (a.is_leader, b.is_leader) == (True, False)
+
+        # a stops renewing; b takes over once the renewal lapses.
+        await b.tick(now=1010 + LEASE_TTL + 1)
+        await a.tick(now=1010 + LEASE_TTL + 2)
+        await asyncio.sleep(0)
+        assert (a.is_leader, b.is_leader) == (False, True)
+        assert log == ["a:1 elected", "b:2 elected", "a:1 demoted"]
+        assert (await db.get_lease("scheduler"))[0] == "b:2"
+        await b.stop()
+        await db.close()
+
+    run(scenario())
@@ -0,0 +1,50 @@
+import math
+
+import pytest
+
+from hydra.forecast import Chain, forecast
+from hydra.rates import shard_rates
+
+
+def test_flat_chain_is_geometric():
+    chain = Chain([0.5])
+    assert chain.expected_pulls(0) == 2.0
+    assert chain.hit_chance(7, 3) == pytest.approx(1 - 0.5 ** 3)
+    assert chain.guaranteed_within(0) is None
+    assert chain.pulls_for(0, 0.9) == 4
+
+
+def test_chain_with_a_hard_pity():
+    chain = Chain([0.0, 0.5, 1.0])
+    assert chain.expected_pulls(0) == 2.5
+    assert [chain.hit_chance(0, n) for n in (1, 2, 3)] == [0.0, 0.5, 1.0]
+    assert chain.guaranteed_within(0) == 3
+    assert chain.guaranteed_within(5) == 1
+
+
+@pytest.mark.parametrize("pity", [0, 11, 30, 58, 80])
+def test_forecast_matches_the_pull_by_pull_chances(pity):
+    # Sacred has no mythicals, so legendary pity is the whole state.
+    rates = shard_rates("sacred")
+    hits = [rates.chance("legendary", pity + i) / 100 for i in range(200)]
+
+    def miss_within(pulls):
+        return math.prod(1 - h for h in hits[:pulls])
+
+    expected = sum(miss_within(n) for n in range(200))
+    result = forecast("sacred", (0, pity, 0), pulls=10)["legendary"]
+    assert result["expected"] == pytest.approx(expected)
+    assert result["within"] == pytest.approx(1 - miss_within(10))
+    assert result["guaranteed_within"] == next(n for n in range(1, 200) if miss_within(n) == 0)
+
+
+@pytest.mark.parametrize("legendary, mythical", [(0, 0), (40, 10), (10, 190), (70, 230)])
+def test_legendary_forecast_counts_mythicals_as_hits(legendary, mythical):
+    # On primal a mythical also resets legendary pity, at its own counter.
+    rates = shard_rates("primal")
+    hits = [
+        min(100, rates.chance("legendary", legendary + i) + rates.chance("mythical", mythical + i)) / 100
+        for i in range(400)
+    ]
+    result = forecast("primal", (0, legendary, mythical), pulls=25)["legendary"]
+    assert result["within"] == pytest.approx(1 - math.prod(1 - h for h in hits[:25]))
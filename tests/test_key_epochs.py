@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from hydra.key_epochs import RESET_TIMEZONE, current_key_epochs, key_epoch, last_reset
+
+SECOND = timedelta(seconds=1)
+
+
+def london(*args, fold=0):
+    return datetime(*args, tzinfo=RESET_TIMEZONE, fold=fold)
+
+
+def utc(local):
+    # Callers pass UTC times, as datetime.now(timezone.utc) does.
+    return local.astimezone(timezone.utc)
+
+
+# (boss, reset as London wall time, the reset a week earlier). 2026 clocks
+# go forward on Sunday 29 March and back on Sunday 25 October.
+RESETS = [
+    ("hydra", london(2026, 1, 14, 10, 59), london(2026, 1, 7, 10, 59)),        # GMT
+    ("hydra", london(2026, 7, 15, 10, 59), london(2026, 7, 8, 10, 59)),        # BST
+    ("hydra", london(2026, 4, 1, 10, 59), london(2026, 3, 25, 10, 59)),        # GMT -> BST
+    ("hydra", london(2026, 10, 28, 10, 59), london(2026, 10, 21, 10, 59)),     # BST -> GMT
+    ("chimera", london(2026, 1, 15, 11, 0), london(2026, 1, 8, 11, 0)),        # GMT
+    ("chimera", london(2026, 7, 16, 11, 0), london(2026, 7, 9, 11, 0)),        # BST
+    ("chimera", london(2026, 4, 2, 11, 0), london(2026, 3, 26, 11, 0)),        # GMT -> BST
+    ("chimera", london(2026, 10, 29, 11, 0), london(2026, 10, 22, 11, 0)),     # BST -> GMT
+]
+
+
+@pytest.mark.parametrize("boss, reset, previous", RESETS)
+def test_last_reset_either_side_of_the_reset(boss, reset, previous):
+    assert last_reset(boss, utc(reset - SECOND)) == previous
+    assert last_reset(boss, utc(reset)) == reset
+    assert last_reset(boss, utc(reset + SECOND)) == reset
+
+
+@pytest.mark.parametrize("boss, reset, previous", RESETS)
+def test_reset_keeps_its_wall_clock_time(boss, reset, previous):
+    found = last_reset(boss, utc(reset + SECOND))
+    assert (found.weekday(), found.hour, found.minute) == (reset.weekday(), reset.hour, reset.minute)
+    assert found.utcoffset() == reset.utcoffset()
+
+
+@pytest.mark.parametrize("boss, reset, previous", RESETS)
+def test_epoch_ticks_over_at_the_reset(boss, reset, previous):
+    before = key_epoch(boss, utc(reset - SECOND))
+    assert key_epoch(boss, utc(reset)) == before + 1
+    assert key_epoch(boss, utc(reset + SECOND)) == before + 1
+    assert key_epoch(boss, utc(previous)) == before
+
+
+@pytest.mark.parametrize("now", [
+    london(2026, 3, 29, 0, 59, 59),       # just before the clocks go forward
+    london(2026, 3, 29, 3, 0),            # just after
+    london(2026, 10, 25, 1, 30),          # first 01:30, BST
+    london(2026, 10, 25, 1, 30, fold=1),  # second 01:30, GMT
+])
+def test_clock_change_weekend_stays_in_the_same_week(now):
+    assert last_reset("hydra", utc(now)).date() == (now - timedelta(days=4)).date()
+    assert last_reset("chimera", utc(now)).date() == (now - timedelta(days=3)).date()
+    before, after = current_key_epochs(utc(now - timedelta(hours=3))), current_key_epochs(utc(now))
+    assert before == after
+
+
+def test_epochs_count_up_one_per_week():
+    start = london(2026, 1, 1, 12, 0)
+    epochs = [key_epoch("hydra", utc(start + timedelta(weeks=i))) for i in range(60)]
+    assert epochs == list(range(epochs[0], epochs[0] + 60))
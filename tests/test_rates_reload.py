@@ -0,0 +1,42 @@
+import asyncio
+
+from hydra.backends import SQLiteBackend
+from hydra.storage import Storage
+from hydra.tasks import follow_rates_reloads
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class Worker:
+    def __init__(self, db):
+        self.db = db
+        self.rates_version = 0
+        self.loads = 0
+
+    def load_rates(self):
+        self.loads += 1
+        return {"ancient": None}
+
+
+def test_workers_follow_a_reload_once(tmp_path):
+    async def scenario():
+        db = Storage(SQLiteBackend(str(tmp_path / "mercy.db")))
+        await db.open()
+        worker = Worker(db)
+
+        await follow_rates_reloads(worker)
+        assert worker.loads == 0
+
+        await db.bump_reload_version("shard_rates")
+        await follow_rates_reloads(worker)
+        await follow_rates_reloads(worker)
+        assert (worker.loads, worker.rates_version) == (1, 1)
+
+        assert await db.bump_reload_version("shard_rates") == 2
+        await follow_rates_reloads(worker)
+        assert worker.loads == 2
+        await db.close()
+
+    run(scenario())
@@ -0,0 +1,122 @@
+import asyncio
+
+from hydra import reminders as reminders_module
+from hydra.backends import SQLiteBackend
+from hydra.reminders import Reminders
+from hydra.storage import Storage
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def open_storage(tmp_path):
+    db = Storage(SQLiteBackend(str(tmp_path / "mercy.db")))
+    await db.open()
+    return db
+
+
+async def wait_for(condition):
+    for _ in range(200):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("timed out")
+
+
+def test_reminders_due_together_in_a_channel_go_out_as_one_message(tmp_path):
+    async def scenario():
+        db = await open_storage(tmp_path)
+        sent = []
+
+        async def send(channel_id, content):
+            sent.append((channel_id, content))
+
+        reminders = Reminders(db, send, lambda guild_id: True, window=0.05)
+        first, _ = await reminders.add(1, 10, 100, "pull", 0)
+        second, _ = await reminders.add(2, 10, 100, "fuse", 0)
+        other, _ = await reminders.add(3, 10, 200, "clash", 0)
+        await reminders.start()
+        await wait_for(lambda: len(sent) == 2)
+
+        assert sorted(sent) == [
+            (100, f"🔔 **Reminders**\n<@1> #{first}: **pull**\n<@2> #{second}: **fuse**"),
+            (200, f"<@3> 🔔 Reminder #{other}: **clash**"),
+        ]
+        assert await db.get_reminders() == []
+        assert reminders.stats()["delivered"] == 3
+        await reminders.stop()
+        await db.close()
+
+    run(scenario())
+
+
+def test_cancelled_reminder_is_never_sent(tmp_path):
+    async def scenario():
+        db = await open_storage(tmp_path)
+        sent = []
+
+        async def send(channel_id, content):
+            sent.append(content)
+
+        reminders = Reminders(db, send, lambda guild_id: True, window=0)
+        await reminders.start()
+        reminder_id, _ = await reminders.add(1, 10, 100, "pull", 1)
+        assert not await reminders.cancel(2, reminder_id)  # someone else's
+        assert await reminders.cancel(1, reminder_id)
+        assert len(reminders.timers) == 0
+
+        await asyncio.sleep(1.2)
+        assert sent == []
+        assert await db.get_reminders() == []
+        await reminders.stop()
+        await db.close()
+
+    run(scenario())
+
+
+def test_failed_send_puts_the_reminder_back_and_retries(tmp_path, monkeypatch):
+    monkeypatch.setattr(reminders_module, "RETRY_DELAY", 0.05)
+
+    async def scenario():
+        db = await open_storage(tmp_path)
+        sent = []
+        failures = [OSError("connection reset")]
+
+        async def send(channel_id, content):
+            if failures:
+                raise failures.pop()
+            sent.append(content)
+
+        reminders = Reminders(db, send, lambda guild_id: True, window=0)
+        reminder_id, _ = await reminders.add(1, 10, 100, "pull", 0)
+        await reminders.start()
+        await wait_for(lambda: sent)
+
+        assert sent == [f"<@1> 🔔 Reminder #{reminder_id}: **pull**"]
+        assert await db.get_reminders() == []
+        await reminders.stop()
+        await db.close()
+
+    run(scenario())
+
+
+def test_stop_mid_send_keeps_the_reminder_for_the_next_start(tmp_path):
+    async def scenario():
+        db = await open_storage(tmp_path)
+        sending = asyncio.Event()
+
+        async def send(channel_id, content):
+            sending.set()
+            await asyncio.Event().wait()
+
+        reminders = Reminders(db, send, lambda guild_id: True, window=0)
+        reminder_id, due_at = await reminders.add(1, 10, 100, "pull", 0)
+        await reminders.start()
+        await sending.wait()
+        await reminders.stop()
+
+        assert await db.get_reminders() == [(reminder_id, "1", "10", 100, "pull", due_at)]
+        await db.close()
+
+    run(scenario())
@@ -0,0 +1,131 @@
+import asyncio
+
+from hydra.backends import SQLiteBackend
+from hydra.storage import Storage
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def open_storage(tmp_path, **options):
+    db = Storage(SQLiteBackend(str(tmp_path / "mercy.db")), **options)
+    await db.open()
+    return db
+
+
+def test_reads_see_queued_writes(tmp_path):
+    async def scenario():
+        db = await open_storage(tmp_path)
+        await db.set_mercy_row(1, "ancient", 3, 4, 0)
+        assert await db.get_mercy_row(1, "ancient") == (3, 4, 0)
+        await db.close()
+
+    run(scenario())
+
+
+def test_read_overlapping_a_flush_sees_the_flushed_write(tmp_path):
+    # The read takes its snapshot before the flush commits and returns
+    # after the flush has dropped its batch; the write must still show.
+    async def scenario():
+        db = await open_storage(tmp_path, mercy_cache_size=0)
+        await db.set_mercy_row(1, "ancient", 1, 1, 0)
+        await db.flush()
+        await db.set_mercy_row(1, "ancient", 5, 5, 0)
+
+        load = db.backend.load_users_mercy
+        snapshot_taken = asyncio.Event()
+
+        async def slow_load(user_ids):
+            states = await load(user_ids)
+            snapshot_taken.set()
+            await asyncio.sleep(0.2)
+            return states
+
+        db.backend.load_users_mercy = slow_load
+        read = asyncio.create_task(db.get_mercy_row(1, "ancient"))
+        await snapshot_taken.wait()
+        await db.flush()
+        assert not db._inflight_mercy and not db._pending_mercy
+
+        assert await read == (5, 5, 0)
+        db.backend.load_users_mercy = load
+        assert await db.get_mercy_row(1, "ancient") == (5, 5, 0)
+        await db.close()
+
+    run(scenario())
+
+
+def test_overlapping_read_keeps_writes_queued_after_it_started(tmp_path):
+    async def scenario():
+        db = await open_storage(tmp_path, mercy_cache_size=0)
+        await db.set_mercy_row(1, "ancient", 1, 1, 0)
+
+        load = db.backend.load_users_mercy
+        snapshot_taken = asyncio.Event()
+
+        async def slow_load(user_ids):
+            states = await load(user_ids)
+            snapshot_taken.set()
+            await asyncio.sleep(0.2)
+            return states
+
+        db.backend.load_users_mercy = slow_load
+        read = asyncio.create_task(db.get_mercy_row(1, "ancient"))
+        await snapshot_taken.wait()
+        await db.flush()
+        await db.set_mercy_row(1, "ancient", 2, 2, 0)
+
+        assert await read == (2, 2, 0)
+        db.backend.load_users_mercy = load
+        await db.close()
+
+    run(scenario())
+
+
+def test_flush_waits_for_a_background_flush_already_writing(tmp_path):
+    async def scenario():
+        db = await open_storage(tmp_path, mercy_cache_size=0)
+        write = db.backend.write_batch
+        writing = asyncio.Event()
+
+        async def slow_write(*batch):
+            writing.set()
+            await asyncio.sleep(0.2)
+            await write(*batch)
+
+        db.backend.write_batch = slow_write
+        await db.set_mercy_row(1, "ancient", 3, 4, 0)
+        db._start_flush()
+        await writing.wait()
+        assert not db._pending_mercy
+
+        await db.flush()
+        assert await db.backend.load_users_mercy(["1"]) == {"1": {"ancient": (3, 4, 0)}}
+        await db.close()
+
+    run(scenario())
+
+
+def test_key_snapshot_includes_keys_a_background_flush_is_writing(tmp_path):
+    # Snapshots are first-write-wins, so a missing row would stay missing.
+    async def scenario():
+        db = await open_storage(tmp_path)
+        write = db.backend.write_batch
+        writing = asyncio.Event()
+
+        async def slow_write(*batch):
+            writing.set()
+            await asyncio.sleep(0.2)
+            await write(*batch)
+
+        db.backend.write_batch = slow_write
+        await db.set_key_used(10, 1, "Alice", "hydra", 7, 2)
+        db._start_flush()
+        await writing.wait()
+
+        await db.snapshot_key_usage(10, "hydra", 7, 100)
+        assert await db.get_key_snapshot(10, "hydra", 7) == [("Alice", 2)]
+        await db.close()
+
+    run(scenario())
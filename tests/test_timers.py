@@ -0,0 +1,56 @@
+import asyncio
+import time
+
+from hydra.timers import TimerHeap
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def ignore(due):
+    pass
+
+
+def test_pop_due_returns_live_timers_in_due_order():
+    heap = TimerHeap(ignore)
+    for key, due_at in (("c", 30), ("a", 10), ("b", 20), ("d", 40)):
+        heap.schedule(key, due_at, key.upper())
+    heap.cancel("b")
+    heap.schedule("a", 25, "A2")  # rescheduling replaces the old timer
+
+    assert heap.pop_due(30) == [("a", 25, "A2"), ("c", 30, "C")]
+    assert len(heap) == 1 and "d" in heap
+    assert heap.next_due() == 40
+
+
+def test_cancelled_entries_are_swept_once_they_outnumber_live_ones():
+    heap = TimerHeap(ignore)
+    for i in range(10):
+        heap.schedule(i, 100 + i)
+    for i in range(6):
+        heap.cancel(i)
+    assert len(heap._heap) < 10
+    assert [key for key, _, _ in heap.pop_due(200)] == [6, 7, 8, 9]
+
+
+def test_timers_fire_when_due_and_not_once_cancelled():
+    async def scenario():
+        fired = []
+
+        async def fire(due):
+            fired.extend(key for key, _, _ in due)
+
+        heap = TimerHeap(fire)
+        heap.start()
+        now = time.time()
+        heap.schedule("late", now + 0.1)
+        heap.schedule("cancelled", now + 0.05)
+        heap.schedule("overdue", now - 60)
+        heap.cancel("cancelled")
+
+        await asyncio.sleep(0.3)
+        assert fired == ["overdue", "late"]
+        await heap.stop()
+
+    run(scenario())